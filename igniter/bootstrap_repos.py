@@ -10,7 +10,9 @@ import tempfile
 from pathlib import Path
 from typing import Union, Callable, List, Tuple
 import hashlib
+import json
 import platform
+from concurrent.futures import ThreadPoolExecutor
 
 from zipfile import ZipFile, BadZipFile
 
@@ -77,6 +79,271 @@ def sha256sum(filename):
     return h.hexdigest()
 
 
+def _parse_checksums(checksums_data):
+    """Parse content of `checksums` file to list of tuples.
+
+    Args:
+        checksums_data (str): Content of checksums file.
+
+    Returns:
+        list[tuple[str, str]]: Checksum and relative file path.
+
+    """
+    return [
+        tuple(line.split(":", 1))
+        for line in checksums_data.split("\n") if line
+    ]
+
+
+class ValidationCache:
+    """Per-machine record of already validated OpenPype versions.
+
+    Cache is stored as json file in user data dir (not in data dir which can
+    be shared between machines). Each validated version is stored under its
+    resolved path with hash of its `checksums` file (manifest) and sizes and
+    modification times of validated files. When manifest and all stats
+    match the record the version is considered valid without hashing of
+    its content.
+
+    Cache can be disabled with `OPENPYPE_DONT_CACHE_VALIDATION` environment
+    variable.
+
+    Args:
+        cache_path (Path): Path to cache json file.
+
+    """
+    filename = "validation_cache.json"
+
+    def __init__(self, cache_path: Path = None):
+        if cache_path is None:
+            cache_path = Path(
+                user_data_dir("openpype", "pypeclub")) / self.filename
+        self._cache_path = cache_path
+        self._data = None
+
+    @property
+    def enabled(self) -> bool:
+        return not os.getenv("OPENPYPE_DONT_CACHE_VALIDATION")
+
+    def _get_data(self) -> dict:
+        if self._data is None:
+            data = {}
+            try:
+                with open(self._cache_path, "r") as stream:
+                    data = json.load(stream)
+            except (OSError, ValueError):
+                pass
+            if not isinstance(data, dict):
+                data = {}
+            self._data = data
+        return self._data
+
+    @staticmethod
+    def _get_key(path: Path) -> str:
+        return path.resolve().as_posix()
+
+    def is_valid(self, path: Path, manifest_hash: str, stats: dict) -> bool:
+        """Version was already validated with same manifest and file stats.
+
+        Args:
+            path (Path): Path to version.
+            manifest_hash (str): Hash of checksums file content.
+            stats (dict): File stats by relative path.
+
+        Returns:
+            bool: Version was validated and did not change.
+
+        """
+        if not self.enabled:
+            return False
+        record = self._get_data().get(self._get_key(path))
+        if not record or record.get("manifest") != manifest_hash:
+            return False
+        return record.get("stats") == stats
+
+    def store(self, path: Path, manifest_hash: str, stats: dict) -> None:
+        """Store record about validated version.
+
+        Args:
+            path (Path): Path to version.
+            manifest_hash (str): Hash of checksums file content.
+            stats (dict): File stats by relative path.
+
+        """
+        if not self.enabled:
+            return
+        data = self._get_data()
+        data[self._get_key(path)] = {
+            "manifest": manifest_hash,
+            "stats": stats
+        }
+        tmp_path = self._cache_path.with_suffix(".tmp")
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as stream:
+                json.dump(data, stream)
+            os.replace(tmp_path, self._cache_path)
+        except OSError:
+            # Cache is only an optimization
+            log.warning("Failed to store validation cache", exc_info=True)
+
+
+class VersionsIndex:
+    """Index of OpenPype versions available in a directory.
+
+    Looking for versions means to open every zip and read version file
+    of every directory which is slow on network shares. Index file stored
+    in the directory keeps result of the last scan with modification times
+    of scanned directories (root and `major.minor` subfolders). If none of
+    them changed, versions are taken from index without any scan.
+
+    When index is stale the directory is scanned again but only items which
+    are not in the index or have different size or modification time are
+    inspected. Index is rewritten after each scan if directory is writable.
+
+    Index can be disabled with `OPENPYPE_DONT_USE_VERSIONS_INDEX`
+    environment variable.
+
+    Args:
+        root (Path): Directory with OpenPype versions.
+
+    """
+    filename = "openpype_versions_index.json"
+    index_version = 1
+
+    def __init__(self, root: Path):
+        self._root = root
+        self._index_path = root / self.filename
+
+    @property
+    def enabled(self) -> bool:
+        return not os.getenv("OPENPYPE_DONT_USE_VERSIONS_INDEX")
+
+    @staticmethod
+    def _get_stat(path: Path) -> list:
+        path_stat = path.stat()
+        return [path_stat.st_size, path_stat.st_mtime_ns]
+
+    def _read(self) -> dict:
+        try:
+            with open(self._index_path, "r") as stream:
+                data = json.load(stream)
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("index_version") != self.index_version
+        ):
+            return {}
+        return data
+
+    def _is_fresh(self, data: dict) -> bool:
+        dirs = data.get("dirs")
+        if not dirs:
+            return False
+        for rel_dir, dir_mtime in dirs.items():
+            try:
+                if (self._root / rel_dir).stat().st_mtime_ns != dir_mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def _write(self, items: dict, scanned_dirs: List[str]) -> None:
+        try:
+            # Index file must exist before modification times of
+            # directories are stored because creation of file changes
+            # modification time of root directory. Rewriting content of
+            # existing file does not.
+            self._index_path.touch(exist_ok=True)
+            data = {
+                "index_version": self.index_version,
+                "dirs": {
+                    rel_dir: (self._root / rel_dir).stat().st_mtime_ns
+                    for rel_dir in scanned_dirs
+                },
+                "items": items
+            }
+            with open(self._index_path, "w") as stream:
+                json.dump(data, stream)
+        except OSError:
+            # Index is only an optimization and directory may be read only
+            log.debug(f"Cannot write versions index {self._index_path}")
+
+    def _scan(
+        self,
+        dir_path: Path,
+        validate_item: Callable,
+        cached_items: dict,
+        items: dict,
+        scanned_dirs: List[str]
+    ) -> None:
+        scanned_dirs.append(dir_path.relative_to(self._root).as_posix())
+        for item in dir_path.iterdir():
+            is_dir = item.is_dir()
+            # if the item is directory with major.minor version, dive deeper
+            if is_dir and re.match(r"^\d+\.\d+$", item.name):
+                self._scan(
+                    item, validate_item, cached_items, items, scanned_dirs)
+
+            # if it is file, strip extension, in case of dir don't.
+            name = item.name if is_dir else item.stem
+            detected_version = OpenPypeVersion.version_in_str(name)
+            if not detected_version:
+                continue
+
+            rel_path = item.relative_to(self._root).as_posix()
+            try:
+                item_stat = self._get_stat(item)
+            except OSError:
+                continue
+            cached_item = cached_items.get(rel_path)
+            if cached_item and cached_item["stat"] == item_stat:
+                is_valid = cached_item["valid"]
+            else:
+                is_valid = validate_item(item, detected_version)
+
+            items[rel_path] = {
+                "version": str(detected_version),
+                "stat": item_stat,
+                "valid": is_valid
+            }
+
+    def get_versions(
+        self, validate_item: Callable, refresh: bool = False
+    ) -> List[OpenPypeVersion]:
+        """Get versions from index or scan directory if index is stale.
+
+        Args:
+            validate_item (Callable): Function which receives path to item
+                and version detected from its name and returns if item
+                contains matching OpenPype version.
+            refresh (bool): Skip check if index is fresh and scan directory.
+                Unchanged items are still taken from index.
+
+        Returns:
+            list of OpenPypeVersion
+
+        """
+        data = self._read() if self.enabled else {}
+        cached_items = data.get("items") or {}
+        if refresh or not self._is_fresh(data):
+            items = {}
+            scanned_dirs = []
+            self._scan(
+                self._root, validate_item, cached_items, items, scanned_dirs)
+            if self.enabled:
+                self._write(items, scanned_dirs)
+            cached_items = items
+
+        openpype_versions = []
+        for rel_path, item in cached_items.items():
+            if item["valid"]:
+                openpype_versions.append(OpenPypeVersion(
+                    version=item["version"], path=self._root / rel_path))
+        return sorted(openpype_versions)
+
+
 class ZipFileLongPaths(ZipFile):
     def _extract_member(self, member, targetpath, pwd):
         return ZipFile._extract_member(
@@ -420,43 +687,17 @@ class OpenPypeVersion(semver.VersionInfo):
             ValueError: if invalid path is specified.
 
         """
-        openpype_versions = []
         if not openpype_dir.exists() and not openpype_dir.is_dir():
-            return openpype_versions
-
-        # iterate over directory in first level and find all that might
-        # contain OpenPype.
-        for item in openpype_dir.iterdir():
-            # if the item is directory with major.minor version, dive deeper
-
-            if item.is_dir() and re.match(r"^\d+\.\d+$", item.name):
-                _versions = OpenPypeVersion.get_versions_from_directory(
-                    item)
-                if _versions:
-                    openpype_versions += _versions
-
-            # if file exists, strip extension, in case of dir don't.
-            name = item.name if item.is_dir() else item.stem
-            result = OpenPypeVersion.version_in_str(name)
-
-            if result:
-                detected_version: OpenPypeVersion
-                detected_version = result
-
-                if item.is_dir() and not OpenPypeVersion.is_version_in_dir(
-                        item, detected_version
-                )[0]:
-                    continue
-
-                if item.is_file() and not OpenPypeVersion.is_version_in_zip(
-                        item, detected_version
-                )[0]:
-                    continue
+            return []
 
-                detected_version.path = item
-                openpype_versions.append(detected_version)
+        def _validate_item(item, detected_version):
+            if item.is_dir():
+                return OpenPypeVersion.is_version_in_dir(
+                    item, detected_version)[0]
+            return OpenPypeVersion.is_version_in_zip(
+                item, detected_version)[0]
 
-        return sorted(openpype_versions)
+        return VersionsIndex(openpype_dir).get_versions(_validate_item)
 
     @staticmethod
     def get_installed_version_str() -> str:
@@ -569,8 +810,12 @@ class BootstrapRepos:
         zip_filter (list): List of files to exclude from zip
         openpype_filter (list): list of top level directories to
             include in zip in OpenPype repository.
+        validation_cache (ValidationCache): Record of validated versions.
+        validation_workers (int): Number of threads used to calculate
+            checksums during validation.
 
     """
+    validation_workers = min(32, (os.cpu_count() or 1) + 4)
 
     def __init__(self, progress_callback: Callable = None, message=None):
         """Constructor.
@@ -591,6 +836,7 @@ class BootstrapRepos:
         self.openpype_filter = [
             "openpype", "LICENSE"
         ]
+        self.validation_cache = ValidationCache()
 
         # dummy progress reporter
         def empty_progress(x: int):
@@ -701,6 +947,7 @@ class BootstrapRepos:
 
             destination = self._move_zip_to_data_dir(temp_zip)
 
+        self.update_versions_index()
         return OpenPypeVersion(version=version, path=Path(destination))
 
     def _move_zip_to_data_dir(self, zip_file) -> Union[None, Path]:
@@ -906,22 +1153,61 @@ class BootstrapRepos:
             return self._validate_zip(path)
         return self._validate_dir(path)
 
-    @staticmethod
-    def _validate_zip(path: Path) -> tuple:
-        """Validate content of zip file."""
+    def _validate_checksums(self, checksums: list, hash_func: Callable):
+        """Calculate checksums of files in parallel and compare them.
+
+        Args:
+            checksums (list[tuple[str, str]]): Expected checksums and
+                relative paths of files.
+            hash_func (Callable): Function calculating checksum of file by
+                its relative path. Should raise `FileNotFoundError` if file
+                is missing.
+
+        Returns:
+            tuple(bool, str): with version validity as first item
+                and string with reason as second.
+
+        """
+        def _check(item):
+            file_checksum, file_name = item
+            try:
+                current = hash_func(file_name)
+            except FileNotFoundError:
+                return f"Missing file [ {file_name} ]"
+            if current != file_checksum:
+                return f"Invalid checksum on {file_name}"
+            return None
+
+        workers = max(1, min(self.validation_workers, len(checksums)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for error in executor.map(_check, checksums):
+                if error:
+                    return False, error
+        return True, "All ok"
+
+    def _validate_zip(self, path: Path) -> tuple:
+        """Validate content of zip file.
+
+        Zip which was already validated and was not modified since is not
+        validated again.
+
+        """
+        path_stat = path.stat()
+        stats = {"": [path_stat.st_size, path_stat.st_mtime_ns]}
         with ZipFile(path, "r") as zip_file:
             # read checksums
             try:
-                checksums_data = str(zip_file.read("checksums"))
-            except IOError:
+                checksums_raw = zip_file.read("checksums")
+            except (IOError, KeyError):
                 # FIXME: This should be set to False sometimes in the future
                 return True, "Cannot read checksums for archive."
 
+            manifest_hash = hashlib.sha256(checksums_raw).hexdigest()
+            if self.validation_cache.is_valid(path, manifest_hash, stats):
+                return True, "All ok (cached)"
+
             # split it to the list of tuples
-            checksums = [
-                tuple(line.split(":"))
-                for line in checksums_data.split("\n") if line
-            ]
+            checksums = _parse_checksums(checksums_raw.decode("utf-8"))
 
             # get list of files in zip minus `checksums` file itself
             # and turn in to set to compare against list of files
@@ -934,24 +1220,30 @@ class BootstrapRepos:
             if diff:
                 return False, f"Missing files {diff}"
 
-            # calculate and compare checksums in the zip file
-            for file_checksum, file_name in checksums:
-                if platform.system().lower() == "windows":
-                    file_name = file_name.replace("/", "\\")
+            def _hash_member(file_name):
                 h = hashlib.sha256()
                 try:
-                    h.update(zip_file.read(file_name))
-                except FileNotFoundError:
-                    return False, f"Missing file [ {file_name} ]"
-                if h.hexdigest() != file_checksum:
-                    return False, f"Invalid checksum on {file_name}"
+                    with zip_file.open(file_name, "r") as stream:
+                        for chunk in iter(lambda: stream.read(1024 * 1024),
+                                          b""):
+                            h.update(chunk)
+                except KeyError:
+                    raise FileNotFoundError(file_name)
+                return h.hexdigest()
 
-        return True, "All ok"
+            # calculate and compare checksums in the zip file
+            result = self._validate_checksums(checksums, _hash_member)
 
-    @staticmethod
-    def _validate_dir(path: Path) -> tuple:
+        if result[0]:
+            self.validation_cache.store(path, manifest_hash, stats)
+        return result
+
+    def _validate_dir(self, path: Path) -> tuple:
         """Validate checksums in a given path.
 
+        Directory which was already validated is not hashed again if sizes
+        and modification times of all files match the stored record.
+
         Args:
             path (Path): path to folder to validate.
 
@@ -964,11 +1256,9 @@ class BootstrapRepos:
         if not checksums_file.exists():
             # FIXME: This should be set to False sometimes in the future
             return True, "Cannot read checksums for archive."
-        checksums_data = checksums_file.read_text()
-        checksums = [
-            tuple(line.split(":"))
-            for line in checksums_data.split("\n") if line
-        ]
+        checksums_raw = checksums_file.read_bytes()
+        manifest_hash = hashlib.sha256(checksums_raw).hexdigest()
+        checksums = _parse_checksums(checksums_raw.decode("utf-8"))
 
         # compare file list against list of files from checksum file.
         # If difference exists, something is wrong and we invalidate directly
@@ -983,21 +1273,32 @@ class BootstrapRepos:
         if diff:
             return False, f"Missing files {diff}"
 
-        # calculate and compare checksums
-        for file_checksum, file_name in checksums:
-            if platform.system().lower() == "windows":
+        is_windows = platform.system().lower() == "windows"
+
+        def _get_file_path(file_name):
+            if is_windows:
                 file_name = file_name.replace("/", "\\")
+            return sanitize_long_path((path / file_name).as_posix())
+
+        # stats are cheap compared to hashing of content
+        stats = {}
+        for _, file_name in checksums:
             try:
-                current = sha256sum(
-                    sanitize_long_path((path / file_name).as_posix())
-                )
+                file_stat = os.stat(_get_file_path(file_name))
             except FileNotFoundError:
                 return False, f"Missing file [ {file_name} ]"
+            stats[file_name] = [file_stat.st_size, file_stat.st_mtime_ns]
 
-            if file_checksum != current:
-                return False, f"Invalid checksum on {file_name}"
+        if self.validation_cache.is_valid(path, manifest_hash, stats):
+            return True, "All ok (cached)"
 
-        return True, "All ok"
+        # calculate and compare checksums
+        result = self._validate_checksums(
+            checksums, lambda file_name: sha256sum(_get_file_path(file_name))
+        )
+        if result[0]:
+            self.validation_cache.store(path, manifest_hash, stats)
+        return result
 
     @staticmethod
     def add_paths_from_archive(archive: Path) -> None:
@@ -1427,6 +1728,7 @@ class BootstrapRepos:
         if remove_source_file:
             os.remove(openpype_version.path)
 
+        self.update_versions_index()
         return destination
 
     def _copy_zip(self, source: Path, destination: Path) -> Path:
@@ -1537,11 +1839,17 @@ class BootstrapRepos:
             return False
         return True
 
-    def get_openpype_versions(self, openpype_dir: Path) -> list:
+    def get_openpype_versions(
+            self, openpype_dir: Path, refresh: bool = False) -> list:
         """Get all detected OpenPype versions in directory.
 
+        Versions are read from index file in the directory which is
+        updated only if content of directory changed.
+
         Args:
             openpype_dir (Path): Directory to scan.
+            refresh (bool, optional): Rescan directory even if index
+                seems to be up to date.
 
         Returns:
             list of OpenPypeVersion
@@ -1553,38 +1861,29 @@ class BootstrapRepos:
         if not openpype_dir.exists() and not openpype_dir.is_dir():
             raise ValueError(f"specified directory {openpype_dir} is invalid")
 
-        openpype_versions = []
-        # iterate over directory in first level and find all that might
-        # contain OpenPype.
-        for item in openpype_dir.iterdir():
-            # if the item is directory with major.minor version, dive deeper
-            if item.is_dir() and re.match(r"^\d+\.\d+$", item.name):
-                _versions = self.get_openpype_versions(item)
-                if _versions:
-                    openpype_versions += _versions
+        return VersionsIndex(openpype_dir).get_versions(
+            self._is_openpype_item, refresh)
 
-            # if it is file, strip extension, in case of dir don't.
-            name = item.name if item.is_dir() else item.stem
-            result = OpenPypeVersion.version_in_str(name)
-
-            if result:
-                detected_version: OpenPypeVersion
-                detected_version = result
-
-                if item.is_dir() and not self._is_openpype_in_dir(
-                    item, detected_version
-                ):
-                    continue
+    def _is_openpype_item(self,
+                          item: Path,
+                          detected_version: OpenPypeVersion) -> bool:
+        """Test if directory or zip contains detected OpenPype version."""
+        if item.is_dir():
+            return self._is_openpype_in_dir(item, detected_version)
+        return self._is_openpype_in_zip(item, detected_version)
 
-                if item.is_file() and not self._is_openpype_in_zip(
-                    item, detected_version
-                ):
-                    continue
+    def update_versions_index(self, openpype_dir: Path = None) -> None:
+        """Update index of versions after version was added or removed.
 
-                detected_version.path = item
-                openpype_versions.append(detected_version)
+        Args:
+            openpype_dir (Path, optional): Directory with versions. User
+                data dir is used if not passed.
 
-        return sorted(openpype_versions)
+        """
+        if openpype_dir is None:
+            openpype_dir = self.data_dir
+        if Path(openpype_dir).is_dir():
+            self.get_openpype_versions(Path(openpype_dir), refresh=True)
 
 
 class OpenPypeVersionExists(Exception):
@@ -5,3 +5,10 @@ PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
 PLUGINS_DIR = os.path.join(PACKAGE_DIR, "plugins")
 
 AYON_SERVER_ENABLED = os.environ.get("USE_AYON_SERVER") == "1"
+
+# Start tracing of startup as soon as possible
+# - module does not import other openpype modules so they're all traced
+if os.environ.get("OPENPYPE_STARTUP_TRACE"):
+    from openpype.startup_trace import get_startup_tracer
+
+    get_startup_tracer()
@@ -360,16 +360,25 @@ def repack_version(directory):
     "--dirpath", help="Directory where package is stored", default=None)
 @click.option(
     "--dbonly", help="Store only Database data", default=False, is_flag=True)
-def pack_project(project, dirpath, dbonly):
+@click.option(
+    "--streamed",
+    help=(
+        "Create streamed package directory with files packed in parallel"
+        " which can be unpacked with resume"
+    ),
+    default=False,
+    is_flag=True)
+def pack_project(project, dirpath, dbonly, streamed):
     """Create a package of project with all files and database dump."""
 
     if AYON_SERVER_ENABLED:
         raise RuntimeError("AYON does not support 'pack-project' command.")
-    PypeCommands().pack_project(project, dirpath, dbonly)
+    PypeCommands().pack_project(project, dirpath, dbonly, streamed)
 
 
 @main.command()
-@click.option("--zipfile", help="Path to zip file")
+@click.option(
+    "--zipfile", help="Path to zip file or to streamed package directory")
 @click.option(
     "--root", help="Replace root which was stored in project", default=None
 )
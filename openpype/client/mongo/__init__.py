@@ -7,8 +7,11 @@ from .mongo import (
     get_project_database,
     get_project_connection,
     load_json_file,
+    iter_ndjson_file,
     replace_project_documents,
     store_project_documents,
+    store_project_documents_ndjson,
+    restore_project_documents_ndjson,
 )
 
 
@@ -21,6 +24,9 @@ __all__ = (
     "get_project_database",
     "get_project_connection",
     "load_json_file",
+    "iter_ndjson_file",
     "replace_project_documents",
     "store_project_documents",
+    "store_project_documents_ndjson",
+    "restore_project_documents_ndjson",
 )
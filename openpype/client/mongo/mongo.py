@@ -304,6 +304,56 @@ def store_collection(filepath, database_name, collection_name):
         stream.write(content)
 
 
+def store_collection_ndjson(filepath, database_name, collection_name):
+    """Store collection documents to a newline delimited json file.
+
+    Documents are written one per line while iterating over the cursor so
+    the collection does not have to be loaded into memory at once.
+
+    Args:
+        filepath (str): Path to a file where documents will be stored.
+        database_name (str): Name of database where to look for collection.
+        collection_name (str): Name of collection to store.
+
+    Returns:
+        int: Number of stored documents.
+    """
+
+    dirpath = os.path.dirname(filepath)
+    if dirpath and not os.path.isdir(dirpath):
+        os.makedirs(dirpath)
+
+    client = OpenPypeMongoConnection.get_mongo_client()
+    cursor = client[database_name][collection_name].find({})
+    count = 0
+    with open(filepath, "w") as stream:
+        for doc in cursor:
+            stream.write(documents_to_json(doc))
+            stream.write("\n")
+            count += 1
+    return count
+
+
+def iter_ndjson_file(filepath):
+    """Iterate over mongo documents stored in newline delimited json file.
+
+    Args:
+        filepath (str): Path to a newline delimited json file.
+
+    Yields:
+        dict[str, Any]: Loaded documents.
+    """
+
+    if not os.path.exists(filepath):
+        raise ValueError("Path {} was not found".format(filepath))
+
+    with open(filepath, "r") as stream:
+        for line in stream:
+            line = line.strip()
+            if line:
+                yield loads(line)
+
+
 def replace_collection_documents(docs, database_name, collection_name):
     """Replace all documents in a collection with passed documents.
 
@@ -325,6 +375,48 @@ def replace_collection_documents(docs, database_name, collection_name):
     col.insert_many(docs)
 
 
+def restore_collection_ndjson(
+    filepath, database_name, collection_name, batch_size=1000
+):
+    """Restore/replace collection from a newline delimited json file.
+
+    Documents are inserted in batches while reading the file.
+
+    Warnings:
+        All existing documents in collection will be removed if there are any.
+
+    Args:
+        filepath (str): Path to a newline delimited json with documents.
+        database_name (str): Name of database where to look for collection.
+        collection_name (str): Name of collection where new documents are
+            uploaded.
+        batch_size (Optional[int]): Amount of documents inserted at once.
+
+    Returns:
+        int: Number of restored documents.
+    """
+
+    client = OpenPypeMongoConnection.get_mongo_client()
+    database = client[database_name]
+    if collection_name in database.list_collection_names():
+        database.drop_collection(collection_name)
+    col = database[collection_name]
+
+    count = 0
+    batch = []
+    for doc in iter_ndjson_file(filepath):
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            col.insert_many(batch)
+            count += len(batch)
+            batch = []
+
+    if batch:
+        col.insert_many(batch)
+        count += len(batch)
+    return count
+
+
 def restore_collection(filepath, database_name, collection_name):
     """Restore/replace collection from a json filepath.
 
@@ -411,6 +503,25 @@ def store_project_documents(project_name, filepath, database_name=None):
     store_collection(filepath, database_name, project_name)
 
 
+def store_project_documents_ndjson(project_name, filepath, database_name=None):
+    """Store project documents to a newline delimited json file.
+
+    Args:
+        project_name (str): Name of project to store.
+        filepath (str): Path to a file where output will be stored.
+        database_name (Optional[str]): Name of mongo database where to look for
+            project.
+
+    Returns:
+        int: Number of stored documents.
+    """
+
+    if not database_name:
+        database_name = get_project_database_name()
+
+    return store_collection_ndjson(filepath, database_name, project_name)
+
+
 def replace_project_documents(project_name, docs, database_name=None):
     """Replace documents in mongo with passed documents.
 
@@ -445,3 +556,26 @@ def restore_project_documents(project_name, filepath, database_name=None):
     if not database_name:
         database_name = get_project_database_name()
     restore_collection(filepath, database_name, project_name)
+
+
+def restore_project_documents_ndjson(
+    project_name, filepath, database_name=None
+):
+    """Replace documents in mongo with documents from ndjson file.
+
+    Warnings:
+        Existing project collection is removed if exists in mongo.
+
+    Args:
+        project_name (str): Name of project.
+        filepath (str): Path to newline delimited json with project documents.
+        database_name (Optional[str]): Name of mongo database where project
+            collection will be created.
+
+    Returns:
+        int: Number of restored documents.
+    """
+
+    if not database_name:
+        database_name = get_project_database_name()
+    return restore_collection_ndjson(filepath, database_name, project_name)
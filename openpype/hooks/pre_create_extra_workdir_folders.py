@@ -14,6 +14,9 @@ class CreateWorkdirExtraFolders(PreLaunchHook):
 
     # Execute after workfile template copy
     order = 15
+    # Only creates folders in existing work directory
+    independent = True
+    blocks_following = False
     launch_types = {LaunchTypes.local}
 
     def execute(self):
@@ -40,8 +40,15 @@ class GlobalHostDataHook(PreLaunchHook):
             "log": self.log
         })
 
-        prepare_app_environments(temp_data, self.launch_context.env_group)
-        prepare_context_environments(temp_data)
+        modules_manager = self.launch_context.modules_manager
+        prepare_app_environments(
+            temp_data,
+            self.launch_context.env_group,
+            modules_manager=modules_manager
+        )
+        prepare_context_environments(
+            temp_data, modules_manager=modules_manager
+        )
 
         temp_data.pop("log")
 
@@ -36,7 +36,7 @@ from openpype.pipeline import (
     deregister_creator_plugin_path,
     AVALON_CONTAINER_ID,
 )
-from openpype.pipeline.load import any_outdated_containers
+from openpype.pipeline.load import get_outdated_containers_in_background
 from openpype.pipeline.workfile.lock_workfile import (
     create_workfile_lock,
     remove_workfile_lock,
@@ -590,7 +590,7 @@ def on_open():
     lib.validate_fps()
     lib.fix_incompatible_containers()
 
-    if any_outdated_containers():
+    def _show_outdated_popup():
         log.warning("Scene has outdated content.")
 
         # Find maya main window
@@ -611,6 +611,16 @@ def on_open():
             dialog.on_clicked.connect(_on_show_inventory)
             dialog.show()
 
+    def _on_outdated_containers(outdated_containers):
+        # Called from a thread, pop-up must be shown in main thread
+        if outdated_containers:
+            utils.executeDeferred(_show_outdated_popup)
+
+    # Check outdated containers without blocking scene open
+    get_outdated_containers_in_background(
+        _on_outdated_containers, use_cache=True
+    )
+
     # create lock file for the maya scene
     check_lock_on_current_file()
 
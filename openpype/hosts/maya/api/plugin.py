@@ -748,6 +748,12 @@ class ReferenceLoader(Loader):
         """To be implemented by subclass"""
         raise NotImplementedError("Must be implemented by subclass")
 
+    def update_many(self, items):
+        """Update references in one undo chunk with suspended refresh."""
+
+        with lib.undo_chunk(), lib.suspended_refresh():
+            return super(ReferenceLoader, self).update_many(items)
+
     def update(self, container, representation):
         from maya import cmds
 
@@ -1,15 +1,13 @@
 # -*- coding: utf-8 -*-
 """Maya look extractor."""
 import sys
-from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
 import contextlib
 import json
-import logging
 import os
+import time
 import tempfile
 import six
-import attr
 
 import pyblish.api
 
@@ -26,24 +24,21 @@ from openpype.lib import (
 from openpype.pipeline import legacy_io, publish, KnownPublishError
 from openpype.hosts.maya.api import lib
 from openpype import AYON_SERVER_ENABLED
+from openpype.hosts.maya.texture_processing import (
+    COPY,
+    HARDLINK,
+    TextureResult,
+    TextureCache,
+    TextureProcessingPool,
+    TextureProcessor,
+    find_published_texture_paths,
+)
 
-# Modes for transfer
-COPY = 1
-HARDLINK = 2
-
+# Environment variable with path to cache of processed textures used when
+#   cache directory is not set on the plugin
+TEXTURE_CACHE_DIR_ENV_KEY = "OPENPYPE_TEXTURE_CACHE_DIR"
 
-@attr.s
-class TextureResult(object):
-    """The resulting texture of a processed file for a resource"""
-    # Path to the file
-    path = attr.ib()
-    # Colorspace of the resulting texture. This might not be the input
-    # colorspace of the texture if a TextureProcessor has processed the file.
-    colorspace = attr.ib()
-    # Hash generated for the texture using openpype.lib.source_hash
-    file_hash = attr.ib()
-    # The transfer mode, e.g. COPY or HARDLINK
-    transfer_mode = attr.ib()
+_perf_counter = getattr(time, "perf_counter", time.time)
 
 
 def find_paths_by_hash(texture_hash):
@@ -64,8 +59,9 @@ def find_paths_by_hash(texture_hash):
             "AYON."
         )
 
-    key = "data.sourceHashes.{0}".format(texture_hash)
-    return legacy_io.distinct(key, {"type": "version"})
+    return find_published_texture_paths(
+        legacy_io.active_project(), texture_hash
+    )
 
 
 @contextlib.contextmanager
@@ -100,61 +96,6 @@ def no_workspace_dir():
         os.rmdir(fake_workspace_dir)
 
 
-@six.add_metaclass(ABCMeta)
-class TextureProcessor:
-
-    extension = None
-
-    def __init__(self, log=None):
-        if log is None:
-            log = logging.getLogger(self.__class__.__name__)
-        self.log = log
-
-    def apply_settings(self, system_settings, project_settings):
-        """Apply OpenPype system/project settings to the TextureProcessor
-
-        Args:
-            system_settings (dict): OpenPype system settings
-            project_settings (dict): OpenPype project settings
-
-        Returns:
-            None
-
-        """
-        pass
-
-    @abstractmethod
-    def process(self,
-                source,
-                colorspace,
-                color_management,
-                staging_dir):
-        """Process the `source` texture.
-
-        Must be implemented on inherited class.
-
-        This must always return a TextureResult even when it does not generate
-        a texture. If it doesn't generate a texture then it should return a
-        TextureResult using the input path and colorspace.
-
-        Args:
-            source (str): Path to source file.
-            colorspace (str): Colorspace of the source file.
-            color_management (dict): Maya Color management data from
-                `lib.get_color_management_preferences`
-            staging_dir (str): Output directory to write to.
-
-        Returns:
-            TextureResult: The resulting texture information.
-
-        """
-        pass
-
-    def __repr__(self):
-        # Log instance as class name
-        return self.__class__.__name__
-
-
 class MakeRSTexBin(TextureProcessor):
     """Make `.rstexbin` using `redshiftTextureProcessor`"""
 
@@ -195,8 +136,9 @@ class MakeRSTexBin(TextureProcessor):
                            "colorspace".format(colorspace))
             subprocess_args.extend(["-cs", colorspace])
 
-        hash_args = ["rstex"]
-        texture_hash = source_hash(source, *hash_args)
+        texture_hash = self.get_texture_hash(
+            source, colorspace, color_management
+        )
 
         # Redshift stores the output texture next to the input but with
         # the extension replaced to `.rstexbin`
@@ -218,6 +160,13 @@ class MakeRSTexBin(TextureProcessor):
             transfer_mode=COPY
         )
 
+    def get_texture_hash(self, source, colorspace, color_management):
+        hash_args = ["rstex"]
+        # Colorspace conversion changes the processed texture
+        if color_management["enabled"]:
+            hash_args.extend(["-cs", colorspace, color_management["config"]])
+        return source_hash(source, *hash_args)
+
     @staticmethod
     def get_redshift_tool(tool_name):
         """Path to redshift texture processor.
@@ -315,36 +264,17 @@ class MakeTX(TextureProcessor):
                 transfer_mode=COPY
             )
 
-        # Hardcoded default arguments for maketx conversion based on Arnold's
-        # txManager in Maya
-        args = [
-            # unpremultiply before conversion (recommended when alpha present)
-            "--unpremult",
-            # use oiio-optimized settings for tile-size, planarconfig, metadata
-            "--oiio",
-            "--filter", "lanczos3",
-        ]
+        args, render_colorspace = self._get_conversion_args(
+            source, colorspace, color_management
+        )
         if color_management["enabled"]:
-            config_path = color_management["config"]
-            if not os.path.exists(config_path):
-                raise RuntimeError("OCIO config not found at: "
-                                   "{}".format(config_path))
-
-            render_colorspace = color_management["rendering_space"]
-
             self.log.debug("tx: converting colorspace {0} "
                           "-> {1}".format(colorspace,
                                           render_colorspace))
-            args.extend(["--colorconvert", colorspace, render_colorspace])
-            args.extend(["--colorconfig", config_path])
-
         else:
-            # Maya Color management is disabled. We cannot rely on an OCIO
             self.log.debug("tx: Maya color management is disabled. No color "
                            "conversion will be applied to .tx conversion for: "
                            "{}".format(source))
-            # Assume linear
-            render_colorspace = "linear"
 
         # Note: The texture hash is only reliable if we include any potential
         # conversion arguments provide to e.g. `maketx`
@@ -354,7 +284,13 @@ class MakeTX(TextureProcessor):
         # Ensure folder exists
         resources_dir = os.path.join(staging_dir, "resources")
         if not os.path.exists(resources_dir):
-            os.makedirs(resources_dir)
+            try:
+                os.makedirs(resources_dir)
+            except OSError:
+                # Folder may be created by other texture processed in
+                #   parallel
+                if not os.path.isdir(resources_dir):
+                    raise
 
         self.log.debug("Generating .tx file for %s .." % source)
 
@@ -403,6 +339,47 @@ class MakeTX(TextureProcessor):
             transfer_mode=COPY
         )
 
+    def get_texture_hash(self, source, colorspace, color_management):
+        # Source '.tx' files are not processed
+        if os.path.splitext(source)[1] == ".tx":
+            return None
+        args, _ = self._get_conversion_args(
+            source, colorspace, color_management
+        )
+        hash_args = ["maketx"] + args + self.extra_args
+        return source_hash(source, *hash_args)
+
+    def _get_conversion_args(self, source, colorspace, color_management):
+        """Get conversion arguments for `maketx` and resulting colorspace.
+
+        Returns:
+            tuple[list[str], str]: Arguments and colorspace of processed
+                texture.
+        """
+        # Hardcoded default arguments for maketx conversion based on Arnold's
+        # txManager in Maya
+        args = [
+            # unpremultiply before conversion (recommended when alpha present)
+            "--unpremult",
+            # use oiio-optimized settings for tile-size, planarconfig, metadata
+            "--oiio",
+            "--filter", "lanczos3",
+        ]
+        if not color_management["enabled"]:
+            # Maya Color management is disabled. We cannot rely on an OCIO
+            # Assume linear
+            return args, "linear"
+
+        config_path = color_management["config"]
+        if not os.path.exists(config_path):
+            raise RuntimeError("OCIO config not found at: "
+                               "{}".format(config_path))
+
+        render_colorspace = color_management["rendering_space"]
+        args.extend(["--colorconvert", colorspace, render_colorspace])
+        args.extend(["--colorconfig", config_path])
+        return args, render_colorspace
+
     @staticmethod
     def _has_arnold():
         """Return whether the arnold package is available and importable."""
@@ -428,6 +405,15 @@ class ExtractLook(publish.Extractor):
     order = pyblish.api.ExtractorOrder + 0.2
     scene_type = "ma"
     look_data_type = "json"
+    # Maximum number of textures processed at the same time. Number of
+    #   cpus is used if not set.
+    texture_processing_workers = None
+    # Directory of cache of processed textures shared across publishes.
+    #   Value of 'OPENPYPE_TEXTURE_CACHE_DIR' environment variable is used
+    #   if not set. Cache is disabled if neither is set.
+    texture_cache_dir = None
+    # Maximum size of texture cache in GB. Size is not limited if not set.
+    texture_cache_max_size = None
 
     def get_maya_scene_type(self, instance):
         """Get Maya scene type from settings.
@@ -638,6 +624,27 @@ class ExtractLook(publish.Extractor):
                 destinations_cache[path] = destination
             return destinations_cache[path]
 
+        # Collect unique files of all resources, colorspace of first
+        #   resource using the file is used for processing
+        files_colorspace = OrderedDict()
+        for resource in resources:
+            for filepath in resource["files"]:
+                filepath = os.path.normpath(filepath)
+                if filepath not in files_colorspace:
+                    files_colorspace[filepath] = resource["color_space"]
+
+        texture_cache = self._get_texture_cache() if processors else None
+        texture_results = self._process_textures(
+            files_colorspace,
+            processors=processors,
+            staging_dir=staging_dir,
+            force_copy=force_copy,
+            color_management=color_management,
+            texture_cache=texture_cache
+        )
+        if texture_cache is not None:
+            texture_cache.prune()
+
         # Process all resource's individual files
         processed_files = {}
         transfers = []
@@ -678,14 +685,7 @@ class ExtractLook(publish.Extractor):
                     )
                     continue
 
-                texture_result = self._process_texture(
-                    filepath,
-                    processors=processors,
-                    staging_dir=staging_dir,
-                    force_copy=force_copy,
-                    color_management=color_management,
-                    colorspace=colorspace
-                )
+                texture_result = texture_results[filepath]
 
                 # Set the resulting color space on the resource
                 self._set_resource_result_colorspace(
@@ -746,6 +746,88 @@ class ExtractLook(publish.Extractor):
             "attrRemap": remap,
         }
 
+    def _get_texture_cache(self):
+        """Get cache of processed textures if enabled.
+
+        Returns:
+            Union[TextureCache, None]: Texture cache.
+        """
+        cache_dir = (
+            self.texture_cache_dir
+            or os.environ.get(TEXTURE_CACHE_DIR_ENV_KEY)
+        )
+        if not cache_dir:
+            return None
+
+        max_size = None
+        if self.texture_cache_max_size:
+            max_size = int(self.texture_cache_max_size * (1024 ** 3))
+        self.log.debug("Using texture cache: {}".format(cache_dir))
+        return TextureCache(cache_dir, max_size=max_size, log=self.log)
+
+    def _process_textures(
+        self,
+        files_colorspace,
+        processors,
+        staging_dir,
+        force_copy,
+        color_management,
+        texture_cache=None
+    ):
+        """Process texture files in parallel.
+
+        Args:
+            files_colorspace (OrderedDict[str, str]): Source colorspace by
+                texture filepath.
+            processors (list): List of TextureProcessor processing textures.
+            staging_dir (str): The staging directory to write to.
+            force_copy (bool): Whether to force a copy even if a file hash
+                might have existed already in the project.
+            color_management (dict): Maya's Color Management settings from
+                `lib.get_color_management_preferences`
+            texture_cache (Optional[TextureCache]): Cache of processed
+                textures.
+
+        Returns:
+            dict[str, TextureResult]: Texture result by filepath.
+        """
+
+        def _process(item):
+            filepath, colorspace = item
+            return self._process_texture(
+                filepath,
+                processors=processors,
+                staging_dir=staging_dir,
+                force_copy=force_copy,
+                color_management=color_management,
+                colorspace=colorspace,
+                texture_cache=texture_cache
+            )
+
+        pool = TextureProcessingPool(
+            self.texture_processing_workers, log=self.log
+        )
+        start = _perf_counter()
+        results = pool.map(_process, files_colorspace.items())
+        total_duration = _perf_counter() - start
+
+        texture_results = {}
+        processing_duration = 0.0
+        for filepath, (texture_result, duration) in zip(
+            files_colorspace.keys(), results
+        ):
+            texture_results[filepath] = texture_result
+            processing_duration += duration
+            self.log.debug("Texture processed in {:.2f}s: {}".format(
+                duration, filepath
+            ))
+
+        self.log.debug((
+            "Processed {} textures in {:.2f}s"
+            " (sum of texture durations {:.2f}s)"
+        ).format(len(texture_results), total_duration, processing_duration))
+        return texture_results
+
     def get_resource_destination(self, filepath, resources_dir, processors):
         """Get resource destination path.
 
@@ -801,7 +883,8 @@ class ExtractLook(publish.Extractor):
                          staging_dir,
                          force_copy,
                          color_management,
-                         colorspace):
+                         colorspace,
+                         texture_cache=None):
         """Process a single texture file on disk for publishing.
 
         This will:
@@ -822,6 +905,8 @@ class ExtractLook(publish.Extractor):
                 `lib.get_color_management_preferences`
             colorspace (str): The source colorspace of the resources this
                 texture belongs to.
+            texture_cache (Optional[TextureCache]): Cache of processed
+                textures. Cached texture is used instead of processing.
 
         Returns:
             TextureResult: The texture result information.
@@ -834,6 +919,24 @@ class ExtractLook(publish.Extractor):
             )
 
         for processor in processors:
+            cache_key = None
+            if texture_cache is not None:
+                texture_hash = processor.get_texture_hash(
+                    filepath, colorspace, color_management
+                )
+                if texture_hash:
+                    cache_key = texture_cache.get_key(
+                        filepath, texture_hash, processor, colorspace
+                    )
+                    cached_result = texture_cache.get(cache_key, staging_dir)
+                    if cached_result:
+                        self.log.debug(
+                            "Using cached processed texture for {}".format(
+                                filepath
+                            )
+                        )
+                        return cached_result
+
             self.log.debug("Processing texture {} with processor {}".format(
                 filepath, processor
             ))
@@ -848,6 +951,9 @@ class ExtractLook(publish.Extractor):
             self.log.debug("Generated processed "
                            "texture: {}".format(processed_result.path))
 
+            if cache_key:
+                texture_cache.store(cache_key, processed_result)
+
             # TODO: Currently all processors force copy instead of allowing
             #       hardlinks using source hashes. This should be refactored
             return processed_result
@@ -855,7 +961,7 @@ class ExtractLook(publish.Extractor):
         # No texture processing for this file
         texture_hash = source_hash(filepath)
         if not force_copy:
-            existing = self._get_existing_hashed_texture(filepath)
+            existing = self._get_existing_hashed_texture(texture_hash)
             if existing:
                 self.log.debug("Found hash in database, preparing hardlink..")
                 return TextureResult(
@@ -0,0 +1,34 @@
+import pyblish.api
+
+from openpype import AYON_SERVER_ENABLED
+from openpype.hosts.maya.texture_processing import (
+    store_published_texture_hashes,
+)
+
+
+class IntegrateSourceHashes(pyblish.api.InstancePlugin):
+    """Store paths of published textures by hash of their source.
+
+    Look extractor hardlinks already published textures found by the hash
+    instead of copying them again.
+    """
+
+    order = pyblish.api.IntegratorOrder + 0.1
+    label = "Integrate Texture Source Hashes"
+    hosts = ["maya"]
+    families = ["look", "mvLook", "model"]
+
+    def process(self, instance):
+        if AYON_SERVER_ENABLED:
+            return
+
+        hashes = instance.data.get("sourceHashes")
+        if not hashes or not instance.data.get("versionEntity"):
+            return
+
+        store_published_texture_hashes(
+            instance.context.data["projectName"], hashes
+        )
+        self.log.debug(
+            "Stored {} texture source hashes".format(len(hashes))
+        )
@@ -0,0 +1,526 @@
+# -*- coding: utf-8 -*-
+"""Processing and caching of textures published by Maya look extractor.
+
+Module does not require Maya so texture processing can be tested outside
+of it.
+"""
+import sys
+from abc import ABCMeta, abstractmethod
+import json
+import uuid
+import shutil
+import hashlib
+import logging
+import os
+import time
+import threading
+import multiprocessing
+import six
+from six.moves import queue
+import attr
+from pymongo import UpdateOne
+
+from openpype.client import OpenPypeMongoConnection
+from openpype.lib import create_hard_link
+
+# Modes for transfer
+COPY = 1
+HARDLINK = 2
+
+# Collection in OpenPype database with paths of published textures by hash
+#   of their source
+SOURCE_HASHES_COLLECTION = "source_hashes"
+
+_perf_counter = getattr(time, "perf_counter", time.time)
+
+
+@attr.s
+class TextureResult(object):
+    """The resulting texture of a processed file for a resource"""
+    # Path to the file
+    path = attr.ib()
+    # Colorspace of the resulting texture. This might not be the input
+    # colorspace of the texture if a TextureProcessor has processed the file.
+    colorspace = attr.ib()
+    # Hash generated for the texture using openpype.lib.source_hash
+    file_hash = attr.ib()
+    # The transfer mode, e.g. COPY or HARDLINK
+    transfer_mode = attr.ib()
+
+
+class TextureCache(object):
+    """Cache of processed textures shared across publishes.
+
+    Processed textures are stored in a directory addressed by hash of the
+    source path, texture hash, processor and source colorspace, so a lookup
+    is a single path check. Metadata of the processed texture are stored
+    next to it in 'entry.json' and modification time of the file is used to
+    evict least recently used entries when cache exceeds maximum size.
+
+    Pruning reads metadata of all entries so it is done at most once per
+    'prune_interval' seconds for all processes using the cache, and only
+    by a cache which stored an entry. Cache can exceed maximum size until
+    next prune.
+
+    Structure of cache directory:
+        {root}/{key[:2]}/{key}/entry.json
+        {root}/{key[:2]}/{key}/{processed texture filename}
+
+    Args:
+        root (str): Path to cache directory.
+        max_size (Optional[int]): Maximum size of cache in bytes. Size is
+            not limited if not set.
+        log (Optional[logging.Logger]): Logger.
+    """
+
+    entry_filename = "entry.json"
+    # Modification time of the file is time of last prune
+    prune_marker_filename = "last_prune"
+    # Minimum time between prunes in seconds
+    prune_interval = 600
+
+    def __init__(self, root, max_size=None, log=None):
+        if log is None:
+            log = logging.getLogger(self.__class__.__name__)
+        self.root = root
+        self.max_size = max_size
+        self.log = log
+        self._entry_stored = False
+
+    @staticmethod
+    def get_key(source, texture_hash, processor, colorspace):
+        """Key of processed texture in cache.
+
+        Texture hash is based on filename, modification time and size of
+        the source, so path of the source is part of the key to avoid
+        collisions of different textures with the same filename.
+
+        Args:
+            source (str): Path to source texture.
+            texture_hash (str): Hash of source texture and processing
+                arguments.
+            processor (TextureProcessor): Processor processing the texture.
+            colorspace (str): Colorspace of the source texture.
+
+        Returns:
+            str: Key of processed texture.
+        """
+        source = os.path.normcase(os.path.abspath(source))
+        data = json.dumps([source, texture_hash, str(processor), colorspace])
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _get_entry_dir(self, key):
+        return os.path.join(self.root, key[:2], key)
+
+    def get(self, key, staging_dir):
+        """Get processed texture from cache.
+
+        Cached texture is hardlinked (or copied if hardlink is not possible)
+        to 'resources' in staging directory, so eviction of the entry does
+        not affect the publish.
+
+        Args:
+            key (str): Key of processed texture from 'get_key'.
+            staging_dir (str): The staging directory to write to.
+
+        Returns:
+            Union[TextureResult, None]: Processed texture or None if it is
+                not cached.
+        """
+        entry_dir = self._get_entry_dir(key)
+        entry_path = os.path.join(entry_dir, self.entry_filename)
+        try:
+            with open(entry_path, "r") as stream:
+                entry = json.load(stream)
+        except (IOError, OSError, ValueError):
+            return None
+
+        cached_path = os.path.join(entry_dir, entry["filename"])
+        if not os.path.isfile(cached_path):
+            return None
+
+        resources_dir = os.path.join(staging_dir, "resources")
+        if not os.path.exists(resources_dir):
+            try:
+                os.makedirs(resources_dir)
+            except OSError:
+                if not os.path.isdir(resources_dir):
+                    raise
+
+        destination = os.path.join(resources_dir, entry["filename"])
+        if os.path.exists(destination):
+            os.remove(destination)
+        try:
+            create_hard_link(cached_path, destination)
+        except (OSError, NotImplementedError):
+            shutil.copy2(cached_path, destination)
+
+        # Mark entry as recently used
+        try:
+            os.utime(entry_path, None)
+        except OSError:
+            pass
+
+        return TextureResult(
+            path=destination,
+            colorspace=entry["colorspace"],
+            file_hash=entry["file_hash"],
+            transfer_mode=COPY
+        )
+
+    def store(self, key, texture_result):
+        """Store processed texture to cache.
+
+        Entry is prepared in temporary directory and renamed, so other
+        processes never see incomplete entries. Failures are only logged.
+
+        Args:
+            key (str): Key of processed texture from 'get_key'.
+            texture_result (TextureResult): Processed texture.
+        """
+        entry_dir = self._get_entry_dir(key)
+        if os.path.exists(entry_dir):
+            return
+
+        filename = os.path.basename(texture_result.path)
+        tmp_dir = os.path.join(
+            self.root, "tmp_{}".format(uuid.uuid4().hex)
+        )
+        try:
+            os.makedirs(tmp_dir)
+            shutil.copy2(
+                texture_result.path, os.path.join(tmp_dir, filename)
+            )
+            entry = {
+                "filename": filename,
+                "colorspace": texture_result.colorspace,
+                "file_hash": texture_result.file_hash,
+                "size": os.path.getsize(texture_result.path),
+            }
+            with open(
+                os.path.join(tmp_dir, self.entry_filename), "w"
+            ) as stream:
+                json.dump(entry, stream)
+
+            parent_dir = os.path.dirname(entry_dir)
+            if not os.path.exists(parent_dir):
+                try:
+                    os.makedirs(parent_dir)
+                except OSError:
+                    if not os.path.isdir(parent_dir):
+                        raise
+            # Entry may be stored by other process in the meantime
+            if not os.path.exists(entry_dir):
+                os.rename(tmp_dir, entry_dir)
+                self._entry_stored = True
+
+        except (IOError, OSError):
+            self.log.warning(
+                "Failed to store texture to cache: {}".format(
+                    texture_result.path
+                ),
+                exc_info=True
+            )
+
+        finally:
+            if os.path.exists(tmp_dir):
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _start_prune(self):
+        """Check if prune should be done and mark time of the prune."""
+        # Cache did not grow
+        if not self._entry_stored:
+            return False
+
+        marker_path = os.path.join(self.root, self.prune_marker_filename)
+        try:
+            last_prune = os.path.getmtime(marker_path)
+        except OSError:
+            last_prune = None
+
+        if (
+            last_prune is not None
+            and time.time() - last_prune < self.prune_interval
+        ):
+            return False
+
+        try:
+            with open(marker_path, "a"):
+                pass
+            os.utime(marker_path, None)
+        except (IOError, OSError):
+            pass
+        return True
+
+    def prune(self, force=False):
+        """Remove least recently used entries over maximum size of cache.
+
+        Args:
+            force (Optional[bool]): Prune even if entry was not stored or
+                cache was pruned recently.
+
+        Returns:
+            int: Number of removed entries.
+        """
+        if not self.max_size or not os.path.isdir(self.root):
+            return 0
+
+        if not force and not self._start_prune():
+            return 0
+
+        entries = []
+        total_size = 0
+        for prefix in os.listdir(self.root):
+            prefix_dir = os.path.join(self.root, prefix)
+            if len(prefix) != 2 or not os.path.isdir(prefix_dir):
+                continue
+            for key in os.listdir(prefix_dir):
+                entry_dir = os.path.join(prefix_dir, key)
+                entry_path = os.path.join(entry_dir, self.entry_filename)
+                try:
+                    last_used = os.path.getmtime(entry_path)
+                    with open(entry_path, "r") as stream:
+                        size = json.load(stream)["size"]
+                except (IOError, OSError, ValueError, KeyError):
+                    continue
+                total_size += size
+                entries.append((last_used, size, entry_dir))
+
+        removed = 0
+        entries.sort()
+        for _, size, entry_dir in entries:
+            if total_size <= self.max_size:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
+            removed += 1
+
+        if removed:
+            self.log.debug(
+                "Removed {} entries from texture cache {}".format(
+                    removed, self.root
+                )
+            )
+        return removed
+
+
+class TextureProcessingPool(object):
+    """Bounded pool of workers processing textures in parallel.
+
+    Texture processors spend most of the time waiting for external
+    executables like `maketx` or `redshiftTextureProcessor`, so worker
+    threads are enough to keep multiple conversion processes running at
+    the same time.
+
+    Args:
+        max_workers (Optional[int]): Maximum number of textures processed
+            at the same time. Number of cpus is used if not passed.
+        log (Optional[logging.Logger]): Logger.
+    """
+
+    def __init__(self, max_workers=None, log=None):
+        if not max_workers:
+            max_workers = multiprocessing.cpu_count()
+        if log is None:
+            log = logging.getLogger(self.__class__.__name__)
+        self.max_workers = max(1, max_workers)
+        self.log = log
+
+    def map(self, func, items):
+        """Call 'func' for each item using workers of the pool.
+
+        Processing stops scheduling new items when any call fails. The
+        first error is re-raised after all running calls are finished.
+
+        Args:
+            func (Callable[[Any], Any]): Function processing an item.
+            items (Iterable[Any]): Items to process.
+
+        Returns:
+            list[tuple[Any, float]]: Result of 'func' and duration of the
+                call in seconds for each item, in order of items.
+        """
+        items = list(items)
+        results = [None] * len(items)
+        workers_count = min(self.max_workers, len(items))
+        if workers_count < 2:
+            for idx, item in enumerate(items):
+                start = _perf_counter()
+                result = func(item)
+                results[idx] = (result, _perf_counter() - start)
+            return results
+
+        jobs_queue = queue.Queue()
+        for idx, item in enumerate(items):
+            jobs_queue.put((idx, item))
+
+        errors = []
+
+        def _worker():
+            while not errors:
+                try:
+                    idx, item = jobs_queue.get_nowait()
+                except queue.Empty:
+                    return
+
+                start = _perf_counter()
+                try:
+                    result = func(item)
+                except Exception:
+                    errors.append(sys.exc_info())
+                    return
+                results[idx] = (result, _perf_counter() - start)
+
+        self.log.debug(
+            "Processing {} textures with {} workers".format(
+                len(items), workers_count
+            )
+        )
+        threads = []
+        for _ in range(workers_count):
+            thread = threading.Thread(target=_worker)
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            six.reraise(*errors[0])
+        return results
+
+
+@six.add_metaclass(ABCMeta)
+class TextureProcessor:
+
+    extension = None
+
+    def __init__(self, log=None):
+        if log is None:
+            log = logging.getLogger(self.__class__.__name__)
+        self.log = log
+
+    def apply_settings(self, system_settings, project_settings):
+        """Apply OpenPype system/project settings to the TextureProcessor
+
+        Args:
+            system_settings (dict): OpenPype system settings
+            project_settings (dict): OpenPype project settings
+
+        Returns:
+            None
+
+        """
+        pass
+
+    @abstractmethod
+    def process(self,
+                source,
+                colorspace,
+                color_management,
+                staging_dir):
+        """Process the `source` texture.
+
+        Must be implemented on inherited class.
+
+        This must always return a TextureResult even when it does not generate
+        a texture. If it doesn't generate a texture then it should return a
+        TextureResult using the input path and colorspace.
+
+        Args:
+            source (str): Path to source file.
+            colorspace (str): Colorspace of the source file.
+            color_management (dict): Maya Color management data from
+                `lib.get_color_management_preferences`
+            staging_dir (str): Output directory to write to.
+
+        Returns:
+            TextureResult: The resulting texture information.
+
+        """
+        pass
+
+    def get_texture_hash(self, source, colorspace, color_management):
+        """Get hash of source texture with processing arguments.
+
+        Hash is used as key of processed texture in texture cache. Same
+        hash must be used on resulting TextureResult.
+
+        Args:
+            source (str): Path to source file.
+            colorspace (str): Colorspace of the source file.
+            color_management (dict): Maya Color management data from
+                `lib.get_color_management_preferences`
+
+        Returns:
+            Union[str, None]: Hash of texture or None if processed texture
+                should not be cached.
+        """
+        return None
+
+    def __repr__(self):
+        # Log instance as class name
+        return self.__class__.__name__
+
+
+class _SourceHashesIndex:
+    """Paths of published textures by hash of their source.
+
+    Source hashes are stored also in version data, but as dynamic keys
+    which can't be indexed, so lookup in versions scans all of them.
+    """
+
+    _index_created = False
+
+    @classmethod
+    def get_collection(cls):
+        mongo_client = OpenPypeMongoConnection.get_mongo_client()
+        database_name = os.environ["OPENPYPE_DATABASE_NAME"]
+        collection = mongo_client[database_name][SOURCE_HASHES_COLLECTION]
+        if not cls._index_created:
+            collection.create_index([("project_name", 1), ("hash", 1)])
+            cls._index_created = True
+        return collection
+
+
+def store_published_texture_hashes(project_name, hashes):
+    """Store paths of published textures by hash of their source.
+
+    Args:
+        project_name (str): Project name.
+        hashes (dict[str, str]): Published texture path by source hash.
+    """
+    operations = [
+        UpdateOne(
+            {
+                "project_name": project_name,
+                "hash": texture_hash,
+                "path": path
+            },
+            {"$set": {"path": path}},
+            upsert=True
+        )
+        for texture_hash, path in hashes.items()
+    ]
+    if operations:
+        _SourceHashesIndex.get_collection().bulk_write(operations)
+
+
+def find_published_texture_paths(project_name, texture_hash):
+    """Paths of published textures with source hash.
+
+    Args:
+        project_name (str): Project name.
+        texture_hash (str): Hash of source texture.
+
+    Returns:
+        list[str]: Paths of published textures.
+    """
+    return [
+        doc["path"]
+        for doc in _SourceHashesIndex.get_collection().find(
+            {"project_name": project_name, "hash": texture_hash},
+            {"path": True}
+        )
+    ]
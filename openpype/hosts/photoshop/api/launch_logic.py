@@ -97,6 +97,10 @@ def stub():
         Currently created when panel is opened (PS: Window>Extensions>Avalon)
     :return: <PhotoshopClientStub> where functions could be called from
     """
+    ps_stub = PhotoshopServerStub.get_batch_stub()
+    if ps_stub is not None:
+        return ps_stub
+
     ps_stub = PhotoshopServerStub()
     if not ps_stub.client:
         raise ConnectionNotEstablishedYet("Connection is not created yet")
@@ -73,13 +73,14 @@ def maintained_visibility(layers=None):
         layers (list) of PSItem (used for caching)
     """
     visibility = {}
+    ps_stub = stub()
     if not layers:
-        layers = stub().get_layers()
+        layers = ps_stub.get_layers()
     for layer in layers:
         visibility[layer.id] = layer.visible
     try:
         yield
     finally:
-        for layer in layers:
-            stub().set_visible(layer.id, visibility[layer.id])
-            pass
+        with ps_stub.batch():
+            for layer in layers:
+                ps_stub.set_visible(layer.id, visibility[layer.id])
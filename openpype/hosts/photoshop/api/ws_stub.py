@@ -3,6 +3,8 @@
     Used anywhere solution is calling client methods.
 """
 import json
+import asyncio
+import contextlib
 import attr
 from wsrpc_aiohttp import WebSocketAsync
 
@@ -46,13 +48,132 @@ class PhotoshopServerStub:
         Expects that client is already connected (started when avalon menu
         is opened).
         'self.websocketserver.call' is used as async wrapper
+
+        Calls which don't return value can be queued with 'batch' context
+        and sent at once.
+
+    Args:
+        websocketserver (Optional[WebServerTool]): Server used to call
+            client methods. Running 'WebServerTool' is used if not passed.
+        client (Optional[WebSocketAsync]): Connected client. First
+            connected client is used if not passed.
     """
     PUBLISH_ICON = '\u2117 '
     LOADED_ICON = '\u25bc'
 
-    def __init__(self):
-        self.websocketserver = WebServerTool.get_instance()
-        self.client = self.get_client()
+    # Stub with opened batch, shared by 'stub()' calls inside the batch
+    _batch_stub = None
+
+    def __init__(self, websocketserver=None, client=None):
+        if websocketserver is None:
+            websocketserver = WebServerTool.get_instance()
+        if client is None:
+            client = self.get_client()
+        self.websocketserver = websocketserver
+        self.client = client
+        self._batch_depth = 0
+        self._queued_calls = []
+        # Snapshots of layers and metadata used during batch
+        self._layers_snapshot = None
+        self._layers_meta_snapshot = None
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Queue calls which don't return value and send them at once.
+
+        Queued calls are sent pipelined on exit of the context (or before
+        any call that returns value), so there is only single round trip
+        to the extension instead of one per call. Queued imprints are merged
+        as each imprint stores whole metadata.
+
+        Layers and layers metadata are queried only once during the context
+        and the snapshot is updated by queued calls or invalidated by calls
+        which change layers structure.
+
+        Stub with opened batch is returned by 'stub()' until the batch is
+        closed, so code using its own stub is batched too.
+
+        Example:
+            ```
+            with stub.batch():
+                for layer in stub.get_layers():
+                    stub.set_visible(layer.id, False)
+            ```
+        """
+        cls = self.__class__
+        if cls._batch_stub is None:
+            cls._batch_stub = self
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if cls._batch_stub is self:
+                    cls._batch_stub = None
+                try:
+                    self.flush()
+                finally:
+                    self._layers_snapshot = None
+                    self._layers_meta_snapshot = None
+
+    @classmethod
+    def get_batch_stub(cls):
+        """Return stub with opened batch or None."""
+        return cls._batch_stub
+
+    @property
+    def in_batch(self):
+        return self._batch_depth > 0
+
+    def flush(self):
+        """Send queued calls to the client."""
+        queued_calls = self._queued_calls
+        if not queued_calls:
+            return
+        self._queued_calls = []
+
+        async def _send_calls():
+            # Calls are sent in order and responses are awaited together
+            return await asyncio.gather(*[
+                self.client.call(method, **kwargs)
+                for method, kwargs in queued_calls
+            ])
+
+        self.websocketserver.call(_send_calls())
+
+    def _call(self, method, **kwargs):
+        """Call method on client and return result.
+
+        Queued calls are sent first to keep order of calls.
+        """
+        self.flush()
+        return self.websocketserver.call(
+            self.client.call(method, **kwargs)
+        )
+
+    def _queue_call(self, method, **kwargs):
+        """Queue call if in batch, otherwise call it right away."""
+        if not self.in_batch:
+            self._call(method, **kwargs)
+            return
+
+        if method == 'Photoshop.imprint':
+            # Imprint stores all metadata, only last one is relevant
+            self._queued_calls = [
+                call for call in self._queued_calls
+                if call[0] != method
+            ]
+        self._queued_calls.append((method, kwargs))
+
+    def _invalidate_layers_snapshot(self):
+        self._layers_snapshot = None
+
+    def _update_layers_snapshot(self, layer_id, **kwargs):
+        for layer in self._layers_snapshot or []:
+            if str(layer.id) == str(layer_id):
+                for key, value in kwargs.items():
+                    setattr(layer, key, value)
 
     @staticmethod
     def get_client():
@@ -76,9 +197,7 @@ class PhotoshopServerStub:
             path(string): file path locally
         Returns: None
         """
-        self.websocketserver.call(
-            self.client.call('Photoshop.open', path=path)
-        )
+        self._call('Photoshop.open', path=path)
 
     def read(self, layer, layers_meta=None):
         """Parses layer metadata from Headline field of active document.
@@ -183,9 +302,9 @@ class PhotoshopServerStub:
             cleaned_data.append(item)
 
         payload = json.dumps(cleaned_data, indent=4)
-        self.websocketserver.call(
-            self.client.call('Photoshop.imprint', payload=payload)
-        )
+        if self.in_batch:
+            self._layers_meta_snapshot = json.loads(payload)
+        self._queue_call('Photoshop.imprint', payload=payload)
 
     def get_layers(self):
         """Returns JSON document with all(?) layers in active document.
@@ -196,11 +315,15 @@ class PhotoshopServerStub:
                                      'type': 'GUIDE'|'FG'|'BG'|'OBJ'
                                      'visible': 'true'|'false'
         """
-        res = self.websocketserver.call(
-            self.client.call('Photoshop.get_layers')
-        )
+        if self.in_batch and self._layers_snapshot is not None:
+            return list(self._layers_snapshot)
 
-        return self._to_records(res)
+        res = self._call('Photoshop.get_layers')
+
+        layers = self._to_records(res)
+        if self.in_batch:
+            self._layers_snapshot = list(layers)
+        return layers
 
     def get_layer(self, layer_id):
         """
@@ -266,9 +389,8 @@ class PhotoshopServerStub:
             <PSItem>
         """
         enhanced_name = self.PUBLISH_ICON + name
-        ret = self.websocketserver.call(
-            self.client.call('Photoshop.create_group', name=enhanced_name)
-        )
+        self._invalidate_layers_snapshot()
+        ret = self._call('Photoshop.create_group', name=enhanced_name)
         # create group on PS is asynchronous, returns only id
         return PSItem(id=ret, name=name, group=True)
 
@@ -279,10 +401,9 @@ class PhotoshopServerStub:
             (Layer)
         """
         enhanced_name = self.PUBLISH_ICON + name
-        res = self.websocketserver.call(
-            self.client.call(
-                'Photoshop.group_selected_layers', name=enhanced_name
-            )
+        self._invalidate_layers_snapshot()
+        res = self._call(
+            'Photoshop.group_selected_layers', name=enhanced_name
         )
         res = self._to_records(res)
         if res:
@@ -296,9 +417,7 @@ class PhotoshopServerStub:
 
         Returns: <list of Layer('id':XX, 'name':"YYY")>
         """
-        res = self.websocketserver.call(
-            self.client.call('Photoshop.get_selected_layers')
-        )
+        res = self._call('Photoshop.get_selected_layers')
         return self._to_records(res)
 
     def select_layers(self, layers):
@@ -308,11 +427,9 @@ class PhotoshopServerStub:
             layers: <list of Layer('id':XX, 'name':"YYY")>
         """
         layers_id = [str(lay.id) for lay in layers]
-        self.websocketserver.call(
-            self.client.call(
-                'Photoshop.select_layers',
-                layers=json.dumps(layers_id)
-            )
+        self._queue_call(
+            'Photoshop.select_layers',
+            layers=json.dumps(layers_id)
         )
 
     def get_active_document_full_name(self):
@@ -321,9 +438,7 @@ class PhotoshopServerStub:
         Returns(string):
             full path with name
         """
-        res = self.websocketserver.call(
-            self.client.call('Photoshop.get_active_document_full_name')
-        )
+        res = self._call('Photoshop.get_active_document_full_name')
 
         return res
 
@@ -333,9 +448,7 @@ class PhotoshopServerStub:
         Returns(string):
             file name
         """
-        return self.websocketserver.call(
-            self.client.call('Photoshop.get_active_document_name')
-        )
+        return self._call('Photoshop.get_active_document_name')
 
     def is_saved(self):
         """Returns true if no changes in active document
@@ -343,15 +456,11 @@ class PhotoshopServerStub:
         Returns:
             <boolean>
         """
-        return self.websocketserver.call(
-            self.client.call('Photoshop.is_saved')
-        )
+        return self._call('Photoshop.is_saved')
 
     def save(self):
         """Saves active document"""
-        self.websocketserver.call(
-            self.client.call('Photoshop.save')
-        )
+        self._call('Photoshop.save')
 
     def saveAs(self, image_path, ext, as_copy):
         """Saves active document to psd (copy) or png or jpg
@@ -362,13 +471,11 @@ class PhotoshopServerStub:
             as_copy: <boolean>
         Returns: None
         """
-        self.websocketserver.call(
-            self.client.call(
-                'Photoshop.saveAs',
-                image_path=image_path,
-                ext=ext,
-                as_copy=as_copy
-            )
+        self._call(
+            'Photoshop.saveAs',
+            image_path=image_path,
+            ext=ext,
+            as_copy=as_copy
         )
 
     def set_visible(self, layer_id, visibility):
@@ -379,12 +486,11 @@ class PhotoshopServerStub:
             visibility: <true - set visible, false - hide>
         Returns: None
         """
-        self.websocketserver.call(
-            self.client.call(
-                'Photoshop.set_visible',
-                layer_id=layer_id,
-                visibility=visibility
-            )
+        self._update_layers_snapshot(layer_id, visible=visibility)
+        self._queue_call(
+            'Photoshop.set_visible',
+            layer_id=layer_id,
+            visibility=visibility
         )
 
     def hide_all_others_layers(self, layers):
@@ -406,11 +512,12 @@ class PhotoshopServerStub:
             extract_ids (list): list of integer that should be visible
             layers (list) of PSItem (used for caching)
         """
-        if not layers:
-            layers = self.get_layers()
-        for layer in layers:
-            if layer.visible and layer.id not in extract_ids:
-                self.set_visible(layer.id, False)
+        with self.batch():
+            if not layers:
+                layers = self.get_layers()
+            for layer in layers:
+                if layer.visible and layer.id not in extract_ids:
+                    self.set_visible(layer.id, False)
 
     def get_layers_metadata(self):
         """Reads layers metadata from Headline from active document in PS.
@@ -424,7 +531,10 @@ class PhotoshopServerStub:
                       "asset":"Town"}}
                 8 is layer(group) id - used for deletion, update etc.
         """
-        res = self.websocketserver.call(self.client.call('Photoshop.read'))
+        if self.in_batch and self._layers_meta_snapshot is not None:
+            return json.loads(json.dumps(self._layers_meta_snapshot))
+
+        res = self._call('Photoshop.read')
         layers_data = []
         try:
             if res:
@@ -438,6 +548,8 @@ class PhotoshopServerStub:
                 if layer_meta.get("schema") != "openpype:container-2.0":
                     layer_meta["members"] = [str(layer_id)]
             layers_data = list(layers_data.values())
+        if self.in_batch:
+            self._layers_meta_snapshot = json.loads(json.dumps(layers_data))
         return layers_data
 
     def import_smart_object(self, path, layer_name, as_reference=False):
@@ -450,13 +562,12 @@ class PhotoshopServerStub:
             as_reference (bool): pull in content or reference
         """
         enhanced_name = self.LOADED_ICON + layer_name
-        res = self.websocketserver.call(
-            self.client.call(
-                'Photoshop.import_smart_object',
-                path=path,
-                name=enhanced_name,
-                as_reference=as_reference
-            )
+        self._invalidate_layers_snapshot()
+        res = self._call(
+            'Photoshop.import_smart_object',
+            path=path,
+            name=enhanced_name,
+            as_reference=as_reference
         )
         rec = self._to_records(res).pop()
         if rec:
@@ -473,13 +584,12 @@ class PhotoshopServerStub:
                 same smart object was loaded
         """
         enhanced_name = self.LOADED_ICON + layer_name
-        self.websocketserver.call(
-            self.client.call(
-                'Photoshop.replace_smart_object',
-                layer_id=layer.id,
-                path=path,
-                name=enhanced_name
-            )
+        self._invalidate_layers_snapshot()
+        self._call(
+            'Photoshop.replace_smart_object',
+            layer_id=layer.id,
+            path=path,
+            name=enhanced_name
         )
 
     def delete_layer(self, layer_id):
@@ -488,9 +598,8 @@ class PhotoshopServerStub:
         Args:
             layer_id (int): id of layer to delete
         """
-        self.websocketserver.call(
-            self.client.call('Photoshop.delete_layer', layer_id=layer_id)
-        )
+        self._invalidate_layers_snapshot()
+        self._queue_call('Photoshop.delete_layer', layer_id=layer_id)
 
     def rename_layer(self, layer_id, name):
         """Renames specific layer by it's id.
@@ -499,12 +608,11 @@ class PhotoshopServerStub:
             layer_id (int): id of layer to delete
             name (str): new name
         """
-        self.websocketserver.call(
-            self.client.call(
-                'Photoshop.rename_layer',
-                layer_id=layer_id,
-                name=name
-            )
+        self._update_layers_snapshot(layer_id, name=name)
+        self._queue_call(
+            'Photoshop.rename_layer',
+            layer_id=layer_id,
+            name=name
         )
 
     def remove_instance(self, instance_id):
@@ -516,16 +624,13 @@ class PhotoshopServerStub:
                 cleaned_data.append(item)
 
         payload = json.dumps(cleaned_data, indent=4)
-
-        self.websocketserver.call(
-            self.client.call('Photoshop.imprint', payload=payload)
-        )
+        if self.in_batch:
+            self._layers_meta_snapshot = json.loads(payload)
+        self._queue_call('Photoshop.imprint', payload=payload)
 
     def get_extension_version(self):
         """Returns version number of installed extension."""
-        return self.websocketserver.call(
-            self.client.call('Photoshop.get_extension_version')
-        )
+        return self._call('Photoshop.get_extension_version')
 
     def close(self):
         """Shutting down PS and process too.
@@ -533,7 +638,7 @@ class PhotoshopServerStub:
             For webpublishing only.
         """
         # TODO change client.call to method with checks for client
-        self.websocketserver.call(self.client.call('Photoshop.close'))
+        self._call('Photoshop.close')
 
     def _to_records(self, res):
         """Converts string json representation into list of PSItem for
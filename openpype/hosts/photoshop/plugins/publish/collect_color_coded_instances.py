@@ -71,53 +71,56 @@ class CollectColorCodedInstances(pyblish.api.ContextPlugin):
         publishable_layers = []
         created_instances = []
         family_from_settings = None
-        for layer in layers:
-            self.log.debug("Layer:: {}".format(layer))
-            if layer.parents:
-                self.log.debug("!!! Not a top layer, skip")
-                continue
-
-            if not layer.visible:
-                self.log.debug("Not visible, skip")
-                continue
-
-            resolved_family, resolved_subset_template = self._resolve_mapping(
-                layer
-            )
-
-            if not resolved_subset_template or not resolved_family:
-                self.log.debug("!!! Not found family or template, skip")
-                continue
-
-            if not family_from_settings:
-                family_from_settings = resolved_family
-
-            fill_pairs = {
-                "variant": variant,
-                "family": resolved_family,
-                "task": task_name,
-                "layer": layer.clean_name
-            }
-
-            subset = resolved_subset_template.format(
-                **prepare_template_data(fill_pairs))
-
-            subset = self._clean_subset_name(stub, naming_conventions,
-                                             subset, layer)
-
-            if subset in existing_subset_names:
-                self.log.info(
-                    "Subset {} already created, skipping.".format(subset))
-                continue
-
-            if self.create_flatten_image != "flatten_only":
-                instance = self._create_instance(context, layer,
-                                                 resolved_family,
-                                                 asset_name, subset, task_name)
-                created_instances.append(instance)
-
-            existing_subset_names.append(subset)
-            publishable_layers.append(layer)
+        # invalid layer names are renamed in single round trip
+        with stub.batch():
+            for layer in layers:
+                self.log.debug("Layer:: {}".format(layer))
+                if layer.parents:
+                    self.log.debug("!!! Not a top layer, skip")
+                    continue
+
+                if not layer.visible:
+                    self.log.debug("Not visible, skip")
+                    continue
+
+                resolved_family, resolved_subset_template = (
+                    self._resolve_mapping(layer)
+                )
+
+                if not resolved_subset_template or not resolved_family:
+                    self.log.debug("!!! Not found family or template, skip")
+                    continue
+
+                if not family_from_settings:
+                    family_from_settings = resolved_family
+
+                fill_pairs = {
+                    "variant": variant,
+                    "family": resolved_family,
+                    "task": task_name,
+                    "layer": layer.clean_name
+                }
+
+                subset = resolved_subset_template.format(
+                    **prepare_template_data(fill_pairs))
+
+                subset = self._clean_subset_name(stub, naming_conventions,
+                                                 subset, layer)
+
+                if subset in existing_subset_names:
+                    self.log.info(
+                        "Subset {} already created, skipping.".format(subset))
+                    continue
+
+                if self.create_flatten_image != "flatten_only":
+                    instance = self._create_instance(context, layer,
+                                                     resolved_family,
+                                                     asset_name, subset,
+                                                     task_name)
+                    created_instances.append(instance)
+
+                existing_subset_names.append(subset)
+                publishable_layers.append(layer)
 
         if self.create_flatten_image != "no" and publishable_layers:
             self.log.debug("create_flatten_image")
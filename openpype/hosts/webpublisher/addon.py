@@ -83,12 +83,31 @@ def publishfromapp(project, path, host, user=None, targets=None):
     cli_publish_from_app(project, path, host, user, targets)
 
 
+@cli_main.command()
+def worker():
+    """Wait for a batch from webserver and publish it (Inner command).
+
+    Started in advance by webserver, batch is received on stdin.
+    """
+
+    from .publish_functions import cli_worker
+
+    cli_worker()
+
+
 @cli_main.command()
 @click_wrap.option("-e", "--executable", help="Executable")
 @click_wrap.option("-u", "--upload_dir", help="Upload dir")
 @click_wrap.option("-h", "--host", help="Host", default=None)
 @click_wrap.option("-p", "--port", help="Port", default=None)
-def webserver(executable, upload_dir, host=None, port=None):
+@click_wrap.option("-w", "--workers", type=int, default=None,
+                   help="Maximum number of batches published at the same time")
+@click_wrap.option("--warm_workers", type=int, default=None,
+                   help="Number of started workers waiting for a batch")
+def webserver(
+    executable, upload_dir, host=None, port=None,
+    workers=None, warm_workers=None
+):
     """Start service for communication with Webpublish Front end.
 
         OP must be congigured on a machine, eg. OPENPYPE_MONGO filled AND
@@ -99,4 +118,7 @@ def webserver(executable, upload_dir, host=None, port=None):
 
     from .webserver_service import run_webserver
 
-    run_webserver(executable, upload_dir, host, port)
+    run_webserver(
+        executable, upload_dir, host, port,
+        max_workers=workers, warm_workers=warm_workers
+    )
@@ -19,6 +19,10 @@ REPROCESS_STATUS = "reprocess"
 SENT_REPROCESSING_STATUS = "sent_for_reprocessing"
 FINISHED_REPROCESS_STATUS = "republishing_finished"
 FINISHED_OK_STATUS = "finished_ok"
+QUEUED_STATUS = "queued"
+
+# Environment variable with id of log record created for queued batch
+WEBPUBLISH_LOG_ID_ENV_KEY = "WEBPUBLISH_LOG_ID"
 
 log = Logger.get_logger(__name__)
 
@@ -117,6 +121,9 @@ def get_webpublish_conn():
 def start_webpublish_log(dbcon, batch_id, user):
     """Start new log record for 'batch_id'
 
+        Record created when batch was queued is used if its id is set in
+        'WEBPUBLISH_LOG_ID' environment variable.
+
         Args:
             dbcon (OpenPypeMongoConnection)
             batch_id (str)
@@ -124,6 +131,19 @@ def start_webpublish_log(dbcon, batch_id, user):
         Returns
             (ObjectId) from DB
     """
+    log_id = os.environ.get(WEBPUBLISH_LOG_ID_ENV_KEY)
+    if log_id:
+        _id = ObjectId(log_id)
+        dbcon.update_one(
+            {"_id": _id},
+            {"$set": {
+                "start_date": datetime.now(),
+                "status": IN_PROGRESS_STATUS,
+                "progress": 0
+            }}
+        )
+        return _id
+
     return dbcon.insert_one({
         "batch_id": batch_id,
         "start_date": datetime.now(),
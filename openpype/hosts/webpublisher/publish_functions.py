@@ -1,4 +1,6 @@
 import os
+import sys
+import json
 import time
 import pyblish.api
 import pyblish.util
@@ -20,7 +22,8 @@ from .lib import (
     find_variant_key,
     get_task_data,
     get_timeout,
-    IN_PROGRESS_STATUS
+    IN_PROGRESS_STATUS,
+    WEBPUBLISH_LOG_ID_ENV_KEY
 )
 
 
@@ -204,3 +207,43 @@ def cli_publish_from_app(
             launched_app.terminate()
             msg = "Timeout reached"
             fail_batch(_id, dbcon, msg)
+
+
+def cli_worker():
+    """Wait for a batch on stdin and publish it.
+
+    Worker is started in advance by worker pool of webserver, so startup
+    of OpenPype and imports are done before a batch arrives. Each worker
+    publishes only one batch.
+
+    Batch is passed as json line with 'command', 'batch_dir', 'arguments'
+    and 'log_id' keys.
+    """
+
+    log = Logger.get_logger("WebpublishWorker")
+    # Connect to database in advance
+    get_webpublish_conn()
+
+    line = sys.stdin.readline()
+    if not line.strip():
+        log.debug("Worker stopped without batch.")
+        return
+
+    job = json.loads(line)
+    arguments = job["arguments"]
+    os.environ[WEBPUBLISH_LOG_ID_ENV_KEY] = job["log_id"]
+    if job["command"] == "publishfromapp":
+        cli_publish_from_app(
+            arguments["project"],
+            job["batch_dir"],
+            arguments["host"],
+            arguments["user"],
+            arguments.get("targets")
+        )
+    else:
+        cli_publish(
+            arguments["project"],
+            job["batch_dir"],
+            arguments["user"],
+            arguments.get("targets")
+        )
@@ -1,6 +1,9 @@
 """Routes and etc. for webpublisher API."""
 import os
 import json
+import time
+import asyncio
+import hashlib
 import datetime
 import collections
 import subprocess
@@ -19,7 +22,8 @@ from openpype_modules.webpublisher.lib import (
     get_webpublish_conn,
     get_task_data,
     ERROR_STATUS,
-    REPROCESS_STATUS
+    REPROCESS_STATUS,
+    QUEUED_STATUS
 )
 
 log = Logger.get_logger("WebpublishRoutes")
@@ -64,14 +68,16 @@ class JsonApiResource:
 class RestApiResource(JsonApiResource):
     """Resource carrying needed info and Avalon DB connection for publish."""
     def __init__(self, server_manager, executable, upload_dir,
-                 studio_task_queue=None):
+                 studio_task_queue=None, worker_pool=None):
         self.server_manager = server_manager
         self.upload_dir = upload_dir
         self.executable = executable
 
         if studio_task_queue is None:
-            studio_task_queue = collections.deque().dequeu
+            studio_task_queue = collections.deque()
         self.studio_task_queue = studio_task_queue
+        # Pool of publish workers, batches are processed by the pool if set
+        self.worker_pool = worker_pool
 
 
 class WebpublishRestApiResource(JsonApiResource):
@@ -98,9 +104,180 @@ class ProjectsEndpoint(ResourceRestApiEndpoint):
         )
 
 
+class _HierarchyCacheItem:
+    """Cached context tree of a project."""
+
+    def __init__(self, fingerprint, root, body):
+        self.fingerprint = fingerprint
+        self.root = root
+        self.body = body
+        self.etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+        self.nodes_by_id = {}
+        nodes = [root]
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, TaskNode):
+                continue
+            self.nodes_by_id[str(node["id"])] = node
+            nodes.extend(node["children"])
+        self.refresh()
+
+    def refresh(self):
+        self.last_update = time.time()
+
+    def is_outdated(self, timeout):
+        return (time.time() - self.last_update) > timeout
+
+
 class HiearchyEndpoint(ResourceRestApiEndpoint):
-    """Returns dictionary with context tree from assets."""
-    async def get(self, project_name) -> Response:
+    """Returns dictionary with context tree from assets.
+
+    Tree is built outside of event loop and cached per project. Cached tree
+    is validated against database after 'cache_timeout' and rebuilt only
+    if assets changed. Responses have 'ETag' header and 'If-None-Match'
+    request header is respected.
+
+    Optional query parameters:
+        id: Id of node which is returned instead of project root.
+        offset: Index of first child of returned node.
+        limit: Maximum number of children of returned node. Total count of
+            children is in 'X-Total-Count' response header.
+    """
+
+    # Assets are changed outside of webserver (e.g. by ftrack sync) so
+    #   cached tree must be validated often, validation does not rebuild
+    #   the tree if assets did not change
+    cache_timeout = 10
+
+    def __init__(self, resource):
+        self._cache = {}
+        self._cache_locks = {}
+        super(HiearchyEndpoint, self).__init__(resource)
+
+    def invalidate_cache(self, project_name=None):
+        """Force rebuild of cached tree on next request.
+
+        Args:
+            project_name (Optional[str]): Project name. All projects are
+                invalidated if not passed.
+        """
+        if project_name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(project_name, None)
+
+    async def get(self, project_name, request) -> Response:
+        try:
+            node_id, offset, limit = self._parse_query(request.query)
+        except ValueError as exc:
+            return Response(
+                status=400,
+                body=self.resource.encode({"msg": str(exc)}),
+                content_type="application/json"
+            )
+
+        cache_item = await self._get_cache_item(project_name)
+        headers = {}
+        if node_id is None and offset is None and limit is None:
+            etag = cache_item.etag
+            body = cache_item.body
+        else:
+            node = cache_item.nodes_by_id.get(node_id or str(
+                cache_item.root["id"]))
+            if node is None:
+                return Response(
+                    status=404,
+                    body=self.resource.encode({
+                        "msg": "Node {} not found".format(node_id)
+                    }),
+                    content_type="application/json"
+                )
+            etag = '"{}"'.format(hashlib.sha1("{}|{}|{}|{}".format(
+                cache_item.etag, node_id, offset, limit
+            ).encode("utf-8")).hexdigest())
+            children = node["children"]
+            headers["X-Total-Count"] = str(len(children))
+            start = offset or 0
+            end = None if limit is None else start + limit
+            output = dict(node)
+            output["children"] = children[start:end]
+            body = None
+
+        headers["ETag"] = etag
+        if self._etag_matches(request, etag):
+            return Response(status=304, headers=headers)
+
+        if body is None:
+            body = self.resource.encode(output)
+
+        return Response(
+            status=200,
+            body=body,
+            headers=headers,
+            content_type="application/json"
+        )
+
+    @staticmethod
+    def _parse_query(query):
+        node_id = query.get("id") or None
+        output = [node_id]
+        for key in ("offset", "limit"):
+            value = query.get(key)
+            if value is not None:
+                try:
+                    value = int(value)
+                except ValueError:
+                    value = -1
+                if value < 0:
+                    raise ValueError(
+                        "Query parameter '{}' must be positive integer".format(
+                            key
+                        )
+                    )
+            output.append(value)
+        return output
+
+    @staticmethod
+    def _etag_matches(request, etag):
+        if_none_match = request.headers.get("If-None-Match")
+        if not if_none_match:
+            return False
+        for value in if_none_match.split(","):
+            value = value.strip()
+            if value.startswith("W/"):
+                value = value[2:]
+            if value in ("*", etag):
+                return True
+        return False
+
+    async def _get_cache_item(self, project_name):
+        lock = self._cache_locks.get(project_name)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._cache_locks[project_name] = lock
+
+        # Only one request per project queries database, other requests
+        #   wait for the result
+        async with lock:
+            cache_item = self._cache.get(project_name)
+            if (
+                cache_item is not None
+                and not cache_item.is_outdated(self.cache_timeout)
+            ):
+                return cache_item
+
+            loop = asyncio.get_event_loop()
+            cache_item = await loop.run_in_executor(
+                None, self._prepare_cache_item, project_name, cache_item
+            )
+            self._cache[project_name] = cache_item
+            return cache_item
+
+    def _prepare_cache_item(self, project_name, cache_item):
+        """Query assets and rebuild tree if assets changed.
+
+        Called in executor, must not touch event loop.
+        """
         query_projection = {
             "_id": 1,
             "data.tasks": 1,
@@ -110,7 +287,25 @@ class HiearchyEndpoint(ResourceRestApiEndpoint):
             "type": 1,
         }
 
-        asset_docs = get_assets(project_name, fields=query_projection.keys())
+        asset_docs = list(
+            get_assets(project_name, fields=query_projection.keys())
+        )
+        fingerprint = hashlib.sha1(json.dumps(
+            asset_docs,
+            sort_keys=True,
+            default=self.resource.json_dump_handler
+        ).encode("utf-8")).hexdigest()
+        if cache_item is not None and cache_item.fingerprint == fingerprint:
+            cache_item.refresh()
+            return cache_item
+
+        root = self._build_tree(project_name, asset_docs)
+        return _HierarchyCacheItem(
+            fingerprint, root, self.resource.encode(root)
+        )
+
+    @staticmethod
+    def _build_tree(project_name, asset_docs):
         asset_docs_by_id = {
             asset_doc["_id"]: asset_doc
             for asset_doc in asset_docs
@@ -155,12 +350,9 @@ class HiearchyEndpoint(ResourceRestApiEndpoint):
                 node.parent = parent_node
 
         roots = [x for x in assets.values() if x.parent is None]
-
-        return Response(
-            status=200,
-            body=self.resource.encode(roots[0]),
-            content_type="application/json"
-        )
+        if not roots:
+            return Node(None, "project", project_name)
+        return roots[0]
 
 
 class Node(dict):
@@ -195,7 +387,11 @@ class TaskNode(Node):
 
 
 class BatchPublishEndpoint(WebpublishApiEndpoint):
-    """Triggers headless publishing of batch."""
+    """Triggers headless publishing of batch.
+
+    Batch is added to queue of worker pool if resource has one, otherwise
+    publish process is started right away.
+    """
     async def post(self, request) -> Response:
         # Validate existence of openpype executable
         openpype_app = self.resource.executable
@@ -289,6 +485,27 @@ class BatchPublishEndpoint(WebpublishApiEndpoint):
             for item in value:
                 args += [arg_key, item]
 
+        worker_pool = self.resource.worker_pool
+        if worker_pool is not None:
+            job = {
+                "batch_id": content["batch"],
+                "command": command,
+                "batch_dir": batch_dir,
+                "arguments": add_args,
+                "exclusive": add_to_queue,
+            }
+            loop = asyncio.get_event_loop()
+            log_id = await loop.run_in_executor(None, worker_pool.submit, job)
+            log.info("Batch {} queued".format(content["batch"]))
+            return Response(
+                status=200,
+                body=self.resource.encode({
+                    "log_id": log_id,
+                    "status": QUEUED_STATUS
+                }),
+                content_type="application/json"
+            )
+
         log.info("args:: {}".format(args))
         if add_to_queue:
             log.debug("Adding to queue")
@@ -319,9 +536,17 @@ class BatchStatusEndpoint(WebpublishApiEndpoint):
     """
 
     async def get(self, batch_id) -> Response:
-        output = self.dbcon.find_one({"batch_id": batch_id})
+        output = self.dbcon.find_one(
+            {"batch_id": batch_id}, projection={"job": False}
+        )
 
         if output:
+            if output.get("status") == QUEUED_STATUS:
+                # Number of batches waiting before this one
+                output["queue_position"] = self.dbcon.count_documents({
+                    "status": QUEUED_STATUS,
+                    "_id": {"$lt": output["_id"]}
+                })
             status = 200
         else:
             output = {"msg": "Batch id {} not found".format(batch_id),
@@ -344,7 +569,8 @@ class UserReportEndpoint(WebpublishApiEndpoint):
 
     async def get(self, user) -> Response:
         output = list(self.dbcon.find({"user": user},
-                                      projection={"log": False}))
+                                      projection={"log": False,
+                                                  "job": False}))
 
         if output:
             status = 200
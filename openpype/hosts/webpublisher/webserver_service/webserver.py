@@ -28,12 +28,29 @@ from .webpublish_routes import (
     TaskPublishEndpoint,
     UserReportEndpoint
 )
+from .worker_pool import BatchWorkerPool
 
 log = Logger.get_logger("webserver_gui")
 
 
-def run_webserver(executable, upload_dir, host=None, port=None):
-    """Runs webserver in command line, adds routes."""
+def run_webserver(
+    executable, upload_dir, host=None, port=None,
+    max_workers=None, warm_workers=None
+):
+    """Runs webserver in command line, adds routes.
+
+    Batches are published by pool of worker processes.
+
+    Args:
+        executable (str): Path to OpenPype executable.
+        upload_dir (str): Directory with uploaded batches.
+        host (Optional[str]): Host of webserver.
+        port (Optional[int]): Port of webserver.
+        max_workers (Optional[int]): Maximum number of batches published
+            at the same time.
+        warm_workers (Optional[int]): Number of started workers waiting
+            for a batch.
+    """
 
     if not host:
         host = "localhost"
@@ -47,11 +64,17 @@ def run_webserver(executable, upload_dir, host=None, port=None):
     webserver_url = server_manager.url
     # queue for publishfromapp tasks
     studio_task_queue = collections.deque()
+    worker_pool = BatchWorkerPool(
+        executable,
+        max_workers=max_workers,
+        warm_workers=warm_workers
+    )
 
     resource = RestApiResource(server_manager,
                                upload_dir=upload_dir,
                                executable=executable,
-                               studio_task_queue=studio_task_queue)
+                               studio_task_queue=studio_task_queue,
+                               worker_pool=worker_pool)
     projects_endpoint = ProjectsEndpoint(resource)
     server_manager.add_route(
         "GET",
@@ -112,16 +135,21 @@ def run_webserver(executable, upload_dir, host=None, port=None):
     )
 
     server_manager.start_server()
+    worker_pool.start()
     last_reprocessed = time.time()
-    while True:
-        if time.time() - last_reprocessed > 20:
-            reprocess_failed(upload_dir, webserver_url)
-            last_reprocessed = time.time()
-        if studio_task_queue:
-            args = studio_task_queue.popleft()
-            subprocess.call(args)  # blocking call
-
-        time.sleep(1.0)
+    try:
+        while True:
+            if time.time() - last_reprocessed > 20:
+                reprocess_failed(upload_dir, webserver_url)
+                last_reprocessed = time.time()
+            if studio_task_queue:
+                args = studio_task_queue.popleft()
+                subprocess.call(args)  # blocking call
+
+            worker_pool.process()
+            time.sleep(1.0)
+    finally:
+        worker_pool.stop()
 
 
 def reprocess_failed(upload_dir, webserver_url):
@@ -0,0 +1,268 @@
+"""Pool of worker processes publishing webpublisher batches."""
+import os
+import json
+import time
+import subprocess
+from datetime import datetime
+
+from openpype.lib import Logger
+from openpype_modules.webpublisher import WebpublisherAddon
+from openpype_modules.webpublisher.lib import (
+    get_webpublish_conn,
+    ERROR_STATUS,
+    IN_PROGRESS_STATUS,
+    QUEUED_STATUS,
+)
+
+log = Logger.get_logger("WebpublishWorkerPool")
+
+
+class BatchWorkerPool:
+    """Bounded pool of worker processes publishing batches.
+
+    Submitted batches are stored to 'webpublishes' collection with 'queued'
+    status, so the queue survives restart of webserver. Queued batches are
+    processed in order of submission, at most 'max_workers' at the same
+    time. Only one exclusive batch (e.g. publish from application) is
+    processed at the same time.
+
+    Worker processes are started in advance and wait for a batch on stdin,
+    so startup of OpenPype is not part of batch processing. Each worker
+    publishes only one batch to not share global state between publishes.
+
+    Pool is processed from main thread of webserver by calling 'start'
+    once and then 'process' periodically.
+
+    Args:
+        executable (str): Path to OpenPype executable.
+        max_workers (Optional[int]): Maximum number of batches processed
+            at the same time.
+        warm_workers (Optional[int]): Number of started idle workers waiting
+            for a batch.
+        dbcon (Optional[Collection]): Connection to 'webpublishes'
+            collection.
+    """
+
+    default_max_workers = 2
+    default_warm_workers = 1
+    # Delay of starting new warm workers after a warm worker died (seconds)
+    min_spawn_delay = 1
+    max_spawn_delay = 300
+
+    def __init__(
+        self, executable, max_workers=None, warm_workers=None, dbcon=None
+    ):
+        if max_workers is None:
+            max_workers = self.default_max_workers
+        if warm_workers is None:
+            warm_workers = self.default_warm_workers
+
+        self.executable = executable
+        self.max_workers = max(1, int(max_workers))
+        self.warm_workers = max(0, min(int(warm_workers), self.max_workers))
+        self._dbcon = dbcon
+        self._idle_workers = []
+        # Running processes with job by log id
+        self._running = {}
+        self._spawn_delay = 0
+        self._next_spawn_time = 0
+
+    @property
+    def dbcon(self):
+        if self._dbcon is None:
+            self._dbcon = get_webpublish_conn()
+        return self._dbcon
+
+    def submit(self, job):
+        """Add batch to queue.
+
+        Args:
+            job (dict[str, Any]): Batch job data with 'batch_id', 'command',
+                'batch_dir', 'arguments' and 'exclusive' keys.
+
+        Returns:
+            str: Id of log record of the batch.
+        """
+        arguments = job["arguments"]
+        return str(self.dbcon.insert_one({
+            "batch_id": job["batch_id"],
+            "user": arguments.get("user"),
+            "queued_date": datetime.now(),
+            "status": QUEUED_STATUS,
+            "progress": 0,
+            "job": job,
+        }).inserted_id)
+
+    def start(self):
+        """Fail batches which were in progress when pool was stopped.
+
+        Pool does not own any worker after webserver restart, so nothing
+        would ever finish records of batches which were in progress. They
+        are marked as failed instead of re-queued, because the batch may be
+        already partially published.
+        """
+        result = self.dbcon.update_many(
+            {
+                "status": IN_PROGRESS_STATUS,
+                "job": {"$exists": True}
+            },
+            {"$set": {
+                "finish_date": datetime.now(),
+                "status": ERROR_STATUS,
+                "log": "Webserver was restarted during processing of batch"
+            }}
+        )
+        if result.modified_count:
+            log.warning("Marked {} interrupted batches as failed".format(
+                result.modified_count
+            ))
+
+    def process(self):
+        """Check running workers and start queued batches."""
+        self._reap_workers()
+        self._dispatch_queued()
+        self._fill_idle_workers()
+
+    def stop(self):
+        """Stop idle workers, running batches are not affected."""
+        for process in self._idle_workers:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+        self._idle_workers = []
+
+    def _start_worker(self):
+        args = [
+            self.executable,
+            "module",
+            WebpublisherAddon.name,
+            "worker"
+        ]
+        log.debug("Starting worker: {}".format(args))
+        return subprocess.Popen(args, stdin=subprocess.PIPE)
+
+    def _pop_idle_worker(self):
+        while self._idle_workers:
+            process = self._idle_workers.pop(0)
+            if process.poll() is None:
+                # Workers can start, reset backoff
+                self._spawn_delay = 0
+                return process
+        return self._start_worker()
+
+    def _fill_idle_workers(self):
+        idle_workers = [
+            process
+            for process in self._idle_workers
+            if process.poll() is None
+        ]
+        if len(idle_workers) != len(self._idle_workers):
+            # Idle worker died without a batch, e.g. broken environment,
+            #   postpone start of new workers to not respawn them in loop
+            self._spawn_delay = min(
+                self.max_spawn_delay,
+                max(self.min_spawn_delay, self._spawn_delay * 2)
+            )
+            self._next_spawn_time = time.time() + self._spawn_delay
+            log.warning((
+                "Idle worker process died, next worker will be started"
+                " in {} seconds"
+            ).format(self._spawn_delay))
+        self._idle_workers = idle_workers
+
+        if time.time() < self._next_spawn_time:
+            return
+
+        missing = (
+            min(self.warm_workers, self.max_workers - len(self._running))
+            - len(self._idle_workers)
+        )
+        for _ in range(missing):
+            self._idle_workers.append(self._start_worker())
+
+    def _reap_workers(self):
+        for log_id, (process, job) in tuple(self._running.items()):
+            returncode = process.poll()
+            if returncode is None:
+                continue
+
+            self._running.pop(log_id)
+            log.debug("Batch {} finished with code {}".format(
+                job["batch_id"], returncode
+            ))
+            if returncode == 0:
+                continue
+
+            # Mark batch as failed if worker did not finish the record
+            msg = "Worker process failed with exit code {}".format(
+                returncode
+            )
+            self.dbcon.update_one(
+                {
+                    "_id": log_id,
+                    "status": {"$in": [QUEUED_STATUS, IN_PROGRESS_STATUS]}
+                },
+                {"$set": {
+                    "finish_date": datetime.now(),
+                    "status": ERROR_STATUS,
+                    "log": msg
+                }}
+            )
+
+    def _dispatch_queued(self):
+        free_slots = self.max_workers - len(self._running)
+        if free_slots < 1:
+            return
+
+        exclusive_running = any(
+            job.get("exclusive")
+            for _, job in self._running.values()
+        )
+        queued_docs = self.dbcon.find(
+            {"status": QUEUED_STATUS},
+            sort=[("_id", 1)]
+        )
+        for doc in queued_docs:
+            if free_slots < 1:
+                break
+
+            job = doc.get("job")
+            if not job:
+                continue
+
+            if job.get("exclusive"):
+                if exclusive_running:
+                    continue
+                exclusive_running = True
+
+            self._start_job(doc["_id"], job)
+            free_slots -= 1
+
+    def _start_job(self, log_id, job):
+        self.dbcon.update_one(
+            {"_id": log_id},
+            {"$set": {
+                "start_date": datetime.now(),
+                "status": IN_PROGRESS_STATUS,
+            }}
+        )
+        job_data = dict(job)
+        job_data["log_id"] = str(log_id)
+        log.info("Starting batch {} ({})".format(
+            job["batch_id"], job["command"]
+        ))
+        process = self._pop_idle_worker()
+        try:
+            process.stdin.write(
+                (json.dumps(job_data) + os.linesep).encode("utf-8")
+            )
+            process.stdin.close()
+        except OSError:
+            # Worker died in the meantime, start new one
+            process = self._start_worker()
+            process.stdin.write(
+                (json.dumps(job_data) + os.linesep).encode("utf-8")
+            )
+            process.stdin.close()
+        self._running[log_id] = (process, job)
@@ -146,6 +146,11 @@ from .plugin_tools import (
     source_hash,
 )
 
+from .frame_sequence import (
+    FrameSequence,
+    assemble_frame_sequences,
+    assemble_frame_sequences_compat,
+)
 from .path_tools import (
     format_file_size,
     collect_frames,
@@ -263,6 +268,10 @@ __all__ = [
     "prepare_template_data",
     "source_hash",
 
+    "FrameSequence",
+    "assemble_frame_sequences",
+    "assemble_frame_sequences_compat",
+
     "format_file_size",
     "collect_frames",
     "create_hard_link",
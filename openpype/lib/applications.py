@@ -2,12 +2,16 @@ import os
 import sys
 import copy
 import json
+import time
 import tempfile
 import platform
+import threading
+import contextlib
 import collections
 import inspect
 import subprocess
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 import six
 
@@ -779,6 +783,18 @@ class LaunchHook:
     """Abstract base class of launch hook."""
     # Order of prelaunch hook, will be executed as last if set to None.
     order = None
+    # Prelaunch hook runs in a thread along other hooks with the same order.
+    #   It waits for hooks with lower order.
+    # - hook must be thread safe (e.g. not use Qt) and must not modify
+    #   launch context data (e.g. environments) other hooks are using
+    independent = False
+    # Hooks with higher order wait for the independent hook. Can be disabled
+    #   if no hook uses result of the hook, following hooks then don't wait
+    #   for it unless they have it in 'dependencies'.
+    blocks_following = True
+    # Class names of prelaunch hooks which must finish before the hook
+    #   is executed. Dependencies must have lower order.
+    dependencies = set()
     # List of host implementations, skipped if empty.
     hosts = set()
     # Set of application groups
@@ -908,6 +924,75 @@ class PostLaunchHook(LaunchHook):
     """
 
 
+class _LaunchHooksCache:
+    """Cache of launch hook classes discovered in directories.
+
+    Hook files are imported only once per process. Directory is imported
+    again only when python files in it were added, removed or modified.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items = {}
+
+    @staticmethod
+    def _get_dir_signature(path):
+        signature = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if (
+                    entry.name.startswith("_")
+                    or not entry.name.endswith(".py")
+                    or not entry.is_file()
+                ):
+                    continue
+                stat = entry.stat()
+                signature.append(
+                    (entry.name, stat.st_mtime_ns, stat.st_size)
+                )
+        signature.sort()
+        return tuple(signature)
+
+    def get_hook_classes(self, path):
+        """Prelaunch and postlaunch hook classes from directory.
+
+        Args:
+            path (str): Path to directory with launch hooks.
+
+        Returns:
+            Tuple[List[type], List[type]]: Prelaunch and postlaunch hook
+                classes.
+        """
+
+        path = os.path.normpath(path)
+        signature = self._get_dir_signature(path)
+        with self._lock:
+            item = self._items.get(path)
+            if item is not None and item[0] == signature:
+                return list(item[1]), list(item[2])
+
+        pre_classes = []
+        post_classes = []
+        modules, crashed = modules_from_path(path)
+        for _filepath, module in modules:
+            pre_classes.extend(classes_from_module(PreLaunchHook, module))
+            post_classes.extend(classes_from_module(PostLaunchHook, module))
+
+        # Don't cache directories where import of a file crashed so the
+        #   import is tried again on next launch
+        if not crashed:
+            with self._lock:
+                self._items[path] = (signature, pre_classes, post_classes)
+        return list(pre_classes), list(post_classes)
+
+    def clear(self):
+        with self._lock:
+            self._items = {}
+
+
+_launch_hooks_cache = _LaunchHooksCache()
+
+
 class ApplicationLaunchContext:
     """Context of launching application.
 
@@ -932,6 +1017,13 @@ class ApplicationLaunchContext:
             'run_prelaunch_hooks' method to run prelaunch hooks which prepare
             them.
 
+    Duration of each launch phase (hooks discovery, each launch hook and
+    process start) is stored to 'launch_timings' and logged after launch.
+
+    Prelaunch hooks marked as 'independent' are executed in at most
+    'prelaunch_hooks_workers' threads, concurrently with other hooks with
+    the same order or with following hooks if they don't block them.
+
     Args:
         application (Application): Application definition.
         executable (ApplicationExecutable): Object with path to executable.
@@ -939,9 +1031,12 @@ class ApplicationLaunchContext:
             'DEFAULT_ENV_SUBGROUP' is used.
         launch_type (Optional[str]): Launch type. If not set 'local' is used.
         **data (dict): Any additional data. Data may be used during
-            preparation to store objects usable in multiple places.
+            preparation to store objects usable in multiple places. Passed
+            'modules_manager' is used instead of creating new one.
     """
 
+    prelaunch_hooks_workers = 4
+
     def __init__(
         self,
         application,
@@ -955,7 +1050,14 @@ class ApplicationLaunchContext:
         # Application object
         self.application = application
 
-        self.modules_manager = ModulesManager()
+        # Durations of launch phases
+        self.launch_timings = []
+
+        modules_manager = data.get("modules_manager")
+        if modules_manager is None:
+            with self._timed_phase("modules manager"):
+                modules_manager = ModulesManager()
+        self.modules_manager = modules_manager
 
         # Logger
         logger_name = "{}-{}".format(self.__class__.__name__,
@@ -1023,6 +1125,27 @@ class ApplicationLaunchContext:
         self.process = None
         self._prelaunch_hooks_executed = False
 
+    @contextlib.contextmanager
+    def _timed_phase(self, label):
+        """Store duration of a launch phase to 'launch_timings'."""
+
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.launch_timings.append((label, time.time() - start))
+
+    def _log_launch_timings(self):
+        if not self.launch_timings:
+            return
+        lines = ["Launch phases of {}:".format(self.application.full_name)]
+        for label, duration in self.launch_timings:
+            lines.append("    {:>8.3f}s {}".format(duration, label))
+        lines.append("    {:>8.3f}s total".format(
+            sum(duration for _, duration in self.launch_timings)
+        ))
+        self.log.debug("\n".join(lines))
+
     @property
     def env(self):
         if (
@@ -1137,7 +1260,11 @@ class ApplicationLaunchContext:
         return paths
 
     def discover_launch_hooks(self, force=False):
-        """Load and prepare launch hooks."""
+        """Load and prepare launch hooks.
+
+        Hook classes are cached per directory for the process lifetime, see
+        '_LaunchHooksCache'.
+        """
         if (
             self.prelaunch_hooks is not None
             or self.postlaunch_hooks is not None
@@ -1149,6 +1276,10 @@ class ApplicationLaunchContext:
             self.prelaunch_hooks.clear()
             self.postlaunch_hooks.clear()
 
+        with self._timed_phase("launch hooks discovery"):
+            self._discover_launch_hooks()
+
+    def _discover_launch_hooks(self):
         self.log.debug("Discovery of launch hooks started.")
 
         paths = self.paths_to_launch_hooks()
@@ -1167,14 +1298,11 @@ class ApplicationLaunchContext:
                 )
                 continue
 
-            modules, _crashed = modules_from_path(path)
-            for _filepath, module in modules:
-                all_classes["pre"].extend(
-                    classes_from_module(PreLaunchHook, module)
-                )
-                all_classes["post"].extend(
-                    classes_from_module(PostLaunchHook, module)
-                )
+            pre_classes, post_classes = _launch_hooks_cache.get_hook_classes(
+                path
+            )
+            all_classes["pre"].extend(pre_classes)
+            all_classes["post"].extend(post_classes)
 
         for launch_type, classes in all_classes.items():
             hooks_with_order = []
@@ -1291,11 +1419,154 @@ class ApplicationLaunchContext:
         # Return process which is already terminated
         return process
 
+    def _execute_prelaunch_hook(self, prelaunch_hook):
+        hook_name = str(prelaunch_hook.__class__.__name__)
+        self.log.debug("Executing prelaunch hook: {}".format(hook_name))
+        with self._timed_phase("prelaunch hook {}".format(hook_name)):
+            prelaunch_hook.execute()
+
+    @staticmethod
+    def _get_hook_order(hook):
+        # Hooks without order are executed as last
+        if hook.order is None:
+            return float("inf")
+        return hook.order
+
+    def _get_prelaunch_hooks_dependencies(self, prelaunch_hooks):
+        """Indexes of hooks which must finish before each hook.
+
+        Hook which is not independent waits for previous hook which is
+        not independent. Hook marked as independent waits only for hook
+        which is not independent and has lower order. Both wait for
+        independent hooks with lower order, unless they don't block
+        following hooks, and for their declared dependencies.
+
+        Args:
+            prelaunch_hooks (List[PreLaunchHook]): Ordered prelaunch hooks.
+
+        Returns:
+            List[Set[int]]: Indexes of dependencies for each hook.
+        """
+
+        index_by_name = {
+            hook.__class__.__name__: idx
+            for idx, hook in enumerate(prelaunch_hooks)
+        }
+        output = []
+        # Indexes of hooks which are not independent
+        chained_indexes = []
+        # Indexes of independent hooks which block following hooks
+        blocking_indexes = []
+        for idx, hook in enumerate(prelaunch_hooks):
+            hook_order = self._get_hook_order(hook)
+            dependencies = {
+                blocking_idx
+                for blocking_idx in blocking_indexes
+                if self._get_hook_order(
+                    prelaunch_hooks[blocking_idx]
+                ) < hook_order
+            }
+            if hook.independent:
+                for chained_idx in reversed(chained_indexes):
+                    chained_hook = prelaunch_hooks[chained_idx]
+                    if self._get_hook_order(chained_hook) < hook_order:
+                        dependencies.add(chained_idx)
+                        break
+            elif chained_indexes:
+                dependencies.add(chained_indexes[-1])
+
+            if not hook.independent:
+                chained_indexes.append(idx)
+            elif hook.blocks_following:
+                blocking_indexes.append(idx)
+
+            for name in hook.dependencies:
+                dep_idx = index_by_name.get(name)
+                # Dependency may not be valid for current launch context
+                if dep_idx is None:
+                    continue
+
+                if dep_idx >= idx:
+                    self.log.warning((
+                        "Prelaunch hook {} depends on {} which has higher"
+                        " order. Dependency is ignored."
+                    ).format(hook.__class__.__name__, name))
+                    continue
+                dependencies.add(dep_idx)
+            output.append(dependencies)
+        return output
+
+    def _run_prelaunch_hooks_concurrently(self, prelaunch_hooks):
+        """Run prelaunch hooks with independent hooks in thread pool.
+
+        Hooks which are not independent are executed in current thread while
+        independent hooks are running in thread pool. First exception stops
+        scheduling of new hooks and is raised once running hooks finish.
+        """
+
+        dependencies = self._get_prelaunch_hooks_dependencies(
+            prelaunch_hooks
+        )
+        pending = list(range(len(prelaunch_hooks)))
+        finished = set()
+        futures = {}
+        error = None
+        with ThreadPoolExecutor(
+            max_workers=self.prelaunch_hooks_workers
+        ) as executor:
+            while futures or (pending and error is None):
+                current_idx = None
+                if error is None:
+                    for idx in list(pending):
+                        if not dependencies[idx].issubset(finished):
+                            continue
+
+                        hook = prelaunch_hooks[idx]
+                        if hook.independent:
+                            pending.remove(idx)
+                            future = executor.submit(
+                                self._execute_prelaunch_hook, hook
+                            )
+                            futures[future] = idx
+
+                        elif current_idx is None:
+                            current_idx = idx
+
+                if current_idx is not None:
+                    pending.remove(current_idx)
+                    try:
+                        self._execute_prelaunch_hook(
+                            prelaunch_hooks[current_idx]
+                        )
+                    except Exception as exc:
+                        error = exc
+                    finished.add(current_idx)
+                    done = [future for future in futures if future.done()]
+
+                elif futures:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                else:
+                    break
+
+                for future in done:
+                    idx = futures.pop(future)
+                    exc = future.exception()
+                    if exc is not None and error is None:
+                        error = exc
+                    finished.add(idx)
+
+        if error is not None:
+            raise error
+
     def run_prelaunch_hooks(self):
         """Run prelaunch hooks.
 
         This method will be executed only once, any future calls will skip
             the processing.
+
+        Hooks are executed by their order. Hooks marked as 'independent' are
+        executed concurrently in a thread pool.
         """
 
         if self._prelaunch_hooks_executed:
@@ -1305,11 +1576,14 @@ class ApplicationLaunchContext:
         self.discover_launch_hooks()
 
         # Execute prelaunch hooks
-        for prelaunch_hook in self.prelaunch_hooks:
-            self.log.debug("Executing prelaunch hook: {}".format(
-                str(prelaunch_hook.__class__.__name__)
-            ))
-            prelaunch_hook.execute()
+        if (
+            self.prelaunch_hooks_workers > 1
+            and any(hook.independent for hook in self.prelaunch_hooks)
+        ):
+            self._run_prelaunch_hooks_concurrently(self.prelaunch_hooks)
+        else:
+            for prelaunch_hook in self.prelaunch_hooks:
+                self._execute_prelaunch_hook(prelaunch_hook)
         self._prelaunch_hooks_executed = True
 
     def launch(self):
@@ -1344,18 +1618,21 @@ class ApplicationLaunchContext:
         self.launch_args = args
 
         # Run process
-        self.process = self._run_process()
+        with self._timed_phase("process start"):
+            self.process = self._run_process()
 
         # Process post launch hooks
         for postlaunch_hook in self.postlaunch_hooks:
-            self.log.debug("Executing postlaunch hook: {}".format(
-                str(postlaunch_hook.__class__.__name__)
-            ))
+            hook_name = str(postlaunch_hook.__class__.__name__)
+            self.log.debug("Executing postlaunch hook: {}".format(hook_name))
 
             # TODO how to handle errors?
             # - store to variable to let them accessible?
             try:
-                postlaunch_hook.execute()
+                with self._timed_phase(
+                    "postlaunch hook {}".format(hook_name)
+                ):
+                    postlaunch_hook.execute()
 
             except Exception:
                 self.log.warning(
@@ -1366,6 +1643,7 @@ class ApplicationLaunchContext:
         self.log.debug("Launch of {} finished.".format(
             self.application.full_name
         ))
+        self._log_launch_timings()
 
         return self.process
 
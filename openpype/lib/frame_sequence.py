@@ -0,0 +1,459 @@
+"""Compact representation of frame sequences.
+
+Sequence is stored as head, tail, padding and list of inclusive frame
+ranges. Filenames are created only when they're needed, so even long
+sequences don't create string object per frame and set operations
+(union, intersection, difference, gaps) work on ranges instead of frames.
+"""
+
+import re
+import bisect
+import collections
+
+import six
+import clique
+
+# Last group of digits in a path without extension is used as frame
+FRAME_PATTERN = re.compile(r"^(?P<head>.*\D|)(?P<frame>\d+)(?P<tail>\D*)$")
+EXTENSION_PATTERN = re.compile(r"\.[a-zA-Z][^./\\]*$")
+# Frame must be separated by dots '.' e.g. 'file.0001.exr'
+DOT_FRAME_PATTERN = re.compile(
+    r"^(?P<head>.*\.)(?P<frame>\d+)(?P<tail>\.\D+\d?)$"
+)
+
+
+def _ranges_from_frames(frames):
+    """Convert frame numbers to sorted list of inclusive ranges."""
+    ranges = []
+    for frame in sorted(set(frames)):
+        if ranges and ranges[-1][1] + 1 == frame:
+            ranges[-1][1] = frame
+        else:
+            ranges.append([frame, frame])
+    return [tuple(frame_range) for frame_range in ranges]
+
+
+def _normalize_ranges(ranges):
+    """Sort ranges and merge overlapping or touching ranges."""
+    output = []
+    for start, end in sorted(ranges):
+        if start > end:
+            start, end = end, start
+        if output and start <= output[-1][1] + 1:
+            if end > output[-1][1]:
+                output[-1][1] = end
+        else:
+            output.append([start, end])
+    return [tuple(frame_range) for frame_range in output]
+
+
+def _intersect_ranges(ranges_a, ranges_b):
+    output = []
+    idx_a = idx_b = 0
+    while idx_a < len(ranges_a) and idx_b < len(ranges_b):
+        start_a, end_a = ranges_a[idx_a]
+        start_b, end_b = ranges_b[idx_b]
+        start = max(start_a, start_b)
+        end = min(end_a, end_b)
+        if start <= end:
+            output.append((start, end))
+
+        if end_a < end_b:
+            idx_a += 1
+        else:
+            idx_b += 1
+    return output
+
+
+def _subtract_ranges(ranges_a, ranges_b):
+    output = []
+    idx_b = 0
+    for start, end in ranges_a:
+        while idx_b < len(ranges_b) and ranges_b[idx_b][1] < start:
+            idx_b += 1
+
+        current = start
+        idx = idx_b
+        while idx < len(ranges_b) and ranges_b[idx][0] <= end:
+            sub_start, sub_end = ranges_b[idx]
+            if sub_start > current:
+                output.append((current, sub_start - 1))
+            current = max(current, sub_end + 1)
+            idx += 1
+
+        if current <= end:
+            output.append((current, end))
+    return output
+
+
+def _to_ranges(value):
+    """Convert supported value to ranges.
+
+    Args:
+        value (Union[FrameSequence, range, Iterable[int]]): Frames.
+
+    Returns:
+        list[tuple[int, int]]: Sorted inclusive ranges.
+    """
+
+    if isinstance(value, FrameSequence):
+        return value.ranges
+    # Python 2 'xrange' does not have 'step'
+    if isinstance(value, six.moves.range) and getattr(value, "step", 0) == 1:
+        if len(value) == 0:
+            return []
+        return [(value.start, value.stop - 1)]
+    return _ranges_from_frames(value)
+
+
+class FrameSequence(object):
+    """Frame sequence defined by head, tail, padding and frame ranges.
+
+    Path of frame is '{head}{frame padded to padding}{tail}'.
+
+    Args:
+        head (str): Part of path before frame.
+        tail (str): Part of path after frame.
+        padding (int): Padding of frame. Frames are not padded if is 0.
+        ranges (Iterable[tuple[int, int]]): Inclusive frame ranges.
+    """
+
+    __slots__ = ("head", "tail", "padding", "_ranges", "_starts")
+
+    def __init__(self, head, tail, padding=0, ranges=None):
+        self.head = head
+        self.tail = tail
+        self.padding = padding
+        self._ranges = _normalize_ranges(ranges or [])
+        self._starts = [start for start, _ in self._ranges]
+
+    @classmethod
+    def from_frames(cls, head, tail, padding, frames):
+        """Create sequence from frame numbers.
+
+        Args:
+            head (str): Part of path before frame.
+            tail (str): Part of path after frame.
+            padding (int): Padding of frame.
+            frames (Union[FrameSequence, range, Iterable[int]]): Frames.
+
+        Returns:
+            FrameSequence: Sequence with frames.
+        """
+
+        return cls(head, tail, padding, _to_ranges(frames))
+
+    @classmethod
+    def from_collection(cls, collection):
+        """Create sequence from 'clique.Collection'.
+
+        Args:
+            collection (clique.Collection): Collection of files.
+
+        Returns:
+            FrameSequence: Sequence with collection frames.
+        """
+
+        return cls.from_frames(
+            collection.head,
+            collection.tail,
+            collection.padding,
+            collection.indexes
+        )
+
+    def to_collection(self):
+        """Convert sequence to 'clique.Collection'.
+
+        Returns:
+            clique.Collection: Collection with sequence frames.
+        """
+
+        return clique.Collection(
+            self.head, self.tail, self.padding, set(self.frames())
+        )
+
+    def with_ranges(self, ranges):
+        """Create sequence with same head, tail and padding.
+
+        Args:
+            ranges (Iterable[tuple[int, int]]): Inclusive frame ranges.
+
+        Returns:
+            FrameSequence: New sequence.
+        """
+
+        return FrameSequence(self.head, self.tail, self.padding, ranges)
+
+    @property
+    def ranges(self):
+        """Sorted inclusive frame ranges.
+
+        Returns:
+            list[tuple[int, int]]: Frame ranges.
+        """
+
+        return list(self._ranges)
+
+    @property
+    def frame_start(self):
+        if self._ranges:
+            return self._ranges[0][0]
+        return None
+
+    @property
+    def frame_end(self):
+        if self._ranges:
+            return self._ranges[-1][1]
+        return None
+
+    def frames(self):
+        """Iterate over frame numbers.
+
+        Yields:
+            int: Frame number.
+        """
+
+        for start, end in self._ranges:
+            for frame in range(start, end + 1):
+                yield frame
+
+    def format_frame(self, frame):
+        """Frame as string with padding of sequence."""
+        return "%0*d" % (self.padding, frame)
+
+    def get_path(self, frame):
+        """Path of frame in sequence."""
+        return "{}{}{}".format(self.head, self.format_frame(frame), self.tail)
+
+    def paths(self):
+        """Iterate over paths of all frames.
+
+        Yields:
+            str: Path of frame.
+        """
+
+        for frame in self.frames():
+            yield self.get_path(frame)
+
+    def union(self, other):
+        """Sequence with frames from both sequences.
+
+        Args:
+            other (Union[FrameSequence, range, Iterable[int]]): Frames.
+
+        Returns:
+            FrameSequence: New sequence.
+        """
+
+        return self.with_ranges(self._ranges + _to_ranges(other))
+
+    def intersection(self, other):
+        """Sequence with frames available in both sequences.
+
+        Args:
+            other (Union[FrameSequence, range, Iterable[int]]): Frames.
+
+        Returns:
+            FrameSequence: New sequence.
+        """
+
+        return self.with_ranges(
+            _intersect_ranges(self._ranges, _to_ranges(other))
+        )
+
+    def difference(self, other):
+        """Sequence with frames which are not in other frames.
+
+        Args:
+            other (Union[FrameSequence, range, Iterable[int]]): Frames.
+
+        Returns:
+            FrameSequence: New sequence.
+        """
+
+        return self.with_ranges(
+            _subtract_ranges(self._ranges, _to_ranges(other))
+        )
+
+    def gaps(self, frame_start=None, frame_end=None):
+        """Missing frame ranges.
+
+        Args:
+            frame_start (Optional[int]): First expected frame. First frame
+                of sequence is used if not passed.
+            frame_end (Optional[int]): Last expected frame. Last frame
+                of sequence is used if not passed.
+
+        Returns:
+            list[tuple[int, int]]: Inclusive ranges of missing frames.
+        """
+
+        if frame_start is None:
+            frame_start = self.frame_start
+        if frame_end is None:
+            frame_end = self.frame_end
+        if frame_start is None or frame_end is None:
+            return []
+        return _subtract_ranges([(frame_start, frame_end)], self._ranges)
+
+    def is_contiguous(self):
+        return len(self._ranges) < 2
+
+    def __contains__(self, frame):
+        idx = bisect.bisect_right(self._starts, frame) - 1
+        return idx >= 0 and frame <= self._ranges[idx][1]
+
+    def __len__(self):
+        return sum(end - start + 1 for start, end in self._ranges)
+
+    def __iter__(self):
+        return self.paths()
+
+    def __eq__(self, other):
+        if not isinstance(other, FrameSequence):
+            return False
+        return (
+            self.head == other.head
+            and self.tail == other.tail
+            and self.padding == other.padding
+            and self._ranges == other._ranges
+        )
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.head, self.tail, self.padding, tuple(self._ranges)))
+
+    def __str__(self):
+        ranges = ",".join(
+            str(start) if start == end else "{}-{}".format(start, end)
+            for start, end in self._ranges
+        )
+        padding = "%0{}d".format(self.padding) if self.padding else "%d"
+        return "{}{}{} [{}]".format(self.head, padding, self.tail, ranges)
+
+    def __repr__(self):
+        return "<{} \"{}\">".format(self.__class__.__name__, self)
+
+
+def _match_frame(path, pattern):
+    """Match path and return head, frame string and tail.
+
+    Returns:
+        Union[tuple[str, str, str], None]: Parts of path or None if frame
+            was not found.
+    """
+
+    ext = ""
+    if pattern is None:
+        ext_result = EXTENSION_PATTERN.search(path)
+        if ext_result is not None:
+            ext = ext_result.group(0)
+            path = path[:ext_result.start()]
+        pattern = FRAME_PATTERN
+
+    result = pattern.match(path)
+    if result is None:
+        return None
+    return (
+        result.group("head"),
+        result.group("frame"),
+        result.group("tail") + ext
+    )
+
+
+def _get_frame_padding(frame_str):
+    if len(frame_str) > 1 and frame_str.startswith("0"):
+        return len(frame_str)
+    return 0
+
+
+def assemble_frame_sequences(paths, minimum_items=2, pattern=None):
+    """Assemble paths into frame sequences.
+
+    Each path is parsed only once by single regex. By default is used last
+    group of digits before extension as frame. Frames with leading zeros
+    define padding of sequence, frames without leading zeros are merged into
+    padded sequence when they match the padding.
+
+    Args:
+        paths (Iterable[str]): Paths or filenames.
+        minimum_items (Optional[int]): Minimum number of frames in sequence.
+        pattern (Optional[re.Pattern]): Pattern with 'head', 'frame' and
+            'tail' groups matched against whole path
+            (e.g. 'DOT_FRAME_PATTERN').
+
+    Returns:
+        tuple[list[FrameSequence], list[str]]: Sequences and paths which
+            are not part of any sequence.
+    """
+
+    frames_by_key = collections.defaultdict(dict)
+    remainders = []
+    for path in paths:
+        parts = _match_frame(path, pattern)
+        if parts is None:
+            remainders.append(path)
+            continue
+        head, frame_str, tail = parts
+        key = (head, tail, _get_frame_padding(frame_str))
+        frames_by_key[key][int(frame_str)] = path
+
+    # Merge not padded frames into padded sequences where possible
+    for key in list(frames_by_key.keys()):
+        head, tail, padding = key
+        if padding != 0:
+            continue
+        padded_keys = [
+            other_key
+            for other_key in frames_by_key
+            if other_key[:2] == (head, tail) and other_key[2] != 0
+        ]
+        if len(padded_keys) != 1:
+            continue
+        padded_key = padded_keys[0]
+        frames = frames_by_key[key]
+        if all(len(str(frame)) >= padded_key[2] for frame in frames):
+            frames_by_key[padded_key].update(frames)
+            frames_by_key.pop(key)
+
+    sequences = []
+    for (head, tail, padding), frames in frames_by_key.items():
+        if len(frames) < minimum_items:
+            remainders.extend(frames.values())
+            continue
+        sequences.append(
+            FrameSequence.from_frames(head, tail, padding, frames.keys())
+        )
+
+    sequences.sort(key=lambda sequence: (sequence.head, sequence.tail))
+    return sequences, remainders
+
+
+def assemble_frame_sequences_compat(paths, minimum_items=2):
+    """Assemble paths into frame sequences with fallback to clique.
+
+    Paths which are not assembled into sequences by last group of digits are
+    assembled using 'clique.assemble' to keep results same as for
+    'clique.assemble' in cases where frame is not last number in path.
+
+    Args:
+        paths (Iterable[str]): Paths or filenames.
+        minimum_items (Optional[int]): Minimum number of frames in sequence.
+
+    Returns:
+        tuple[list[FrameSequence], list[str]]: Sequences and paths which
+            are not part of any sequence.
+    """
+
+    sequences, remainders = assemble_frame_sequences(paths, minimum_items)
+    if len(remainders) >= minimum_items:
+        collections, remainders = clique.assemble(
+            remainders, minimum_items=minimum_items
+        )
+        sequences.extend(
+            FrameSequence.from_collection(collection)
+            for collection in collections
+        )
+    return sequences, remainders
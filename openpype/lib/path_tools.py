@@ -3,7 +3,7 @@ import re
 import logging
 import platform
 
-import clique
+from .frame_sequence import assemble_frame_sequences, DOT_FRAME_PATTERN
 
 log = logging.getLogger(__name__)
 
@@ -68,8 +68,8 @@ def create_hard_link(src_path, dst_path):
 def collect_frames(files):
     """Returns dict of source path and its frame, if from sequence
 
-    Uses clique as most precise solution, used when anatomy template that
-    created files is not known.
+    Uses frame sequences assembly as most precise solution, used when
+    anatomy template that created files is not known.
 
     Assumption is that frames are separated by '.', negative frames are not
     allowed.
@@ -81,21 +81,16 @@ def collect_frames(files):
         (dict): {'/asset/subset_v001.0001.png': '0001', ....}
     """
 
-    patterns = [clique.PATTERNS["frames"]]
-    collections, remainder = clique.assemble(
-        files, minimum_items=1, patterns=patterns)
+    sequences, remainder = assemble_frame_sequences(
+        files, minimum_items=1, pattern=DOT_FRAME_PATTERN)
 
     sources_and_frames = {}
-    if collections:
-        for collection in collections:
-            src_head = collection.head
-            src_tail = collection.tail
-
-            for index in collection.indexes:
-                src_frame = collection.format("{padding}") % index
-                src_file_name = "{}{}{}".format(
-                    src_head, src_frame, src_tail)
-                sources_and_frames[src_file_name] = src_frame
+    if sequences:
+        for sequence in sequences:
+            for frame in sequence.frames():
+                sources_and_frames[sequence.get_path(frame)] = (
+                    sequence.format_frame(frame)
+                )
     else:
         sources_and_frames[remainder.pop()] = None
 
@@ -12,14 +12,22 @@ This gives ability to create project where a changes and tests can be done.
 
 Keep in mind that to be able to create a package of project has few
 requirements. Possible requirement should be listed in 'pack_project' function.
+
+Project can be also packed into a streamed package using
+'pack_project_streamed'. The package is a directory with metadata, manifest
+with hashes of all files, documents stored as newline delimited json and
+project files split into zip parts which are packed and unpacked in parallel.
+Already compressed files (e.g. exr, mov) are stored without compression.
 """
 
 import os
 import json
+import hashlib
 import platform
 import tempfile
 import shutil
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import zipfile
 from openpype.client.mongo import (
@@ -27,11 +35,24 @@ from openpype.client.mongo import (
     get_project_connection,
     replace_project_documents,
     store_project_documents,
+    store_project_documents_ndjson,
+    restore_project_documents_ndjson,
 )
 
 DOCUMENTS_FILE_NAME = "database"
 METADATA_FILE_NAME = "metadata"
+MANIFEST_FILE_NAME = "manifest"
 PROJECT_FILES_DIR = "project_files"
+STREAMED_PACKAGE_VERSION = 2
+
+# Size of chunks in which are files read
+_CHUNK_SIZE = 1024 * 1024
+# Files with these extensions are already compressed
+COMPRESSED_EXTENSIONS = {
+    ".exr", ".mov", ".mp4", ".m4v", ".mxf", ".mkv", ".avi", ".webm",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".tx", ".rstexbin",
+    ".zip", ".gz", ".bz2", ".xz", ".7z", ".rar",
+}
 
 
 def add_timestamp(filepath):
@@ -82,6 +103,279 @@ def _pack_files_to_zip(zip_stream, source_path, root_path):
             zip_stream.write(filepath, archive_name)
 
 
+def _calculate_file_hash(filepath):
+    """Calculate sha256 hash of a file content."""
+
+    hasher = hashlib.sha256()
+    with open(filepath, "rb") as stream:
+        for chunk in iter(lambda: stream.read(_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _is_compressed_file(filepath):
+    ext = os.path.splitext(filepath)[-1].lower()
+    return ext in COMPRESSED_EXTENSIONS
+
+
+def _collect_project_files(source_path, root_path):
+    """Collect files for packing using single 'os.scandir' pass per folder.
+
+    Symlinks to directories are skipped same as with 'os.walk', symlinks to
+    files are packed as files.
+
+    Args:
+        source_path (str): Path to a directory where files are.
+        root_path (str): Path to a directory which is used for calculation
+            of relative path.
+
+    Returns:
+        list[tuple[str, str, int]]: Filepath, relative path in package with
+            forward slashes and size of file.
+    """
+
+    output = []
+    dirpaths = [source_path]
+    while dirpaths:
+        dirpath = dirpaths.pop()
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirpaths.append(entry.path)
+                    continue
+                # Symlink to a directory
+                if entry.is_dir():
+                    continue
+                rel_path = os.path.relpath(entry.path, root_path)
+                output.append((
+                    entry.path,
+                    rel_path.replace("\\", "/"),
+                    entry.stat().st_size
+                ))
+    output.sort(key=lambda item: item[1])
+    return output
+
+
+def _split_files_to_parts(files, parts_count):
+    """Split files into parts with similar size.
+
+    Args:
+        files (list[tuple[str, str, int]]): Output of
+            '_collect_project_files'.
+        parts_count (int): Maximum number of parts.
+
+    Returns:
+        list[list[tuple[str, str, int]]]: Files split into parts.
+    """
+
+    parts_count = max(1, min(parts_count, len(files)))
+    parts = [[] for _ in range(parts_count)]
+    sizes = [0] * parts_count
+    # Add biggest files first, each to the part with smallest size
+    for item in sorted(files, key=lambda item: item[2], reverse=True):
+        idx = sizes.index(min(sizes))
+        parts[idx].append(item)
+        sizes[idx] += item[2]
+
+    for part in parts:
+        part.sort(key=lambda item: item[1])
+    return parts
+
+
+def _pack_files_to_zip_part(zip_path, files):
+    """Pack files to a zip part and calculate their hashes.
+
+    Files are read only once, content is hashed while it is written to zip.
+    Files which are already compressed are stored without compression.
+
+    Args:
+        zip_path (str): Path to output zip file.
+        files (list[tuple[str, str, int]]): Files to pack.
+
+    Returns:
+        list[dict[str, Any]]: Manifest items of packed files.
+    """
+
+    part_name = os.path.basename(zip_path)
+    manifest_items = []
+    with zipfile.ZipFile(zip_path, "w", allowZip64=True) as zip_stream:
+        for filepath, rel_path, size in files:
+            archive_name = "/".join((PROJECT_FILES_DIR, rel_path))
+            zip_info = zipfile.ZipInfo.from_file(filepath, archive_name)
+            if _is_compressed_file(filepath):
+                zip_info.compress_type = zipfile.ZIP_STORED
+            else:
+                zip_info.compress_type = zipfile.ZIP_DEFLATED
+
+            hasher = hashlib.sha256()
+            with open(filepath, "rb") as src_stream, zip_stream.open(
+                zip_info, "w", force_zip64=True
+            ) as dst_stream:
+                for chunk in iter(lambda: src_stream.read(_CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+                    dst_stream.write(chunk)
+
+            manifest_items.append({
+                "path": rel_path,
+                "size": size,
+                "hash": hasher.hexdigest(),
+                "part": part_name,
+            })
+    return manifest_items
+
+
+def _get_project_source(project_doc, project_name):
+    """Get root of single root project and path to project files.
+
+    Args:
+        project_doc (dict[str, Any]): Project document.
+        project_name (str): Name of project.
+
+    Returns:
+        tuple[str, dict[str, str], str]: Root path for current platform,
+            root data and path to project files.
+    """
+
+    roots = project_doc["config"]["roots"]
+    # Determine root directory of project
+    source_root = None
+    source_root_name = None
+    for root_name, root_value in roots.items():
+        if source_root is not None:
+            raise ValueError(
+                "Packaging is supported only for single root projects"
+            )
+        source_root = root_value
+        source_root_name = root_name
+
+    root_path = source_root[platform.system().lower()]
+    print("Using root \"{}\" with path \"{}\"".format(
+        source_root_name, root_path
+    ))
+
+    project_source_path = os.path.join(root_path, project_name)
+    if not os.path.exists(project_source_path):
+        raise ValueError("Didn't find source of project files")
+    return root_path, source_root, project_source_path
+
+
+def pack_project_streamed(
+    project_name,
+    destination_dir=None,
+    only_documents=False,
+    database_name=None,
+    workers=None
+):
+    """Make a streamed package of a project with mongo documents and files.
+
+    Package is a directory '{project_name}_package' with metadata, manifest,
+    documents stored as newline delimited json written directly from
+    database cursor and project files split into zip parts which are created
+    in parallel.
+
+    Restrictions are same as for 'pack_project'.
+
+    Args:
+        project_name (str): Project that should be packaged.
+        destination_dir (Optional[str]): Optional path where package will be
+            stored. Project's root is used if not passed.
+        only_documents (Optional[bool]): Pack only Mongo documents and skip
+            files.
+        database_name (Optional[str]): Custom database name from which is
+            project queried.
+        workers (Optional[int]): Number of parallel workers. Number of cpus
+            is used if not passed.
+
+    Returns:
+        str: Path to created package directory.
+    """
+
+    print("Creating streamed package of project \"{}\"".format(project_name))
+    # Validate existence of project
+    project_doc = get_project_document(project_name, database_name)
+    if not project_doc:
+        raise ValueError("Project \"{}\" was not found in database".format(
+            project_name
+        ))
+
+    if only_documents and not destination_dir:
+        raise ValueError((
+            "Destination directory must be defined"
+            " when only documents should be packed."
+        ))
+
+    root_path = None
+    source_root = {}
+    project_source_path = None
+    if not only_documents:
+        root_path, source_root, project_source_path = _get_project_source(
+            project_doc, project_name
+        )
+
+    if not destination_dir:
+        destination_dir = root_path
+
+    if not destination_dir:
+        raise ValueError(
+            "Project {} does not have any roots.".format(project_name)
+        )
+
+    if not workers:
+        workers = os.cpu_count() or 1
+
+    package_dir = os.path.join(
+        os.path.normpath(destination_dir), project_name + "_package"
+    )
+    print("Project will be packaged into \"{}\"".format(package_dir))
+    # Rename already existing package
+    if os.path.exists(package_dir):
+        os.rename(package_dir, add_timestamp(package_dir))
+
+    files_dir = os.path.join(package_dir, PROJECT_FILES_DIR)
+    os.makedirs(files_dir)
+
+    print("Storing database documents")
+    docs_count = store_project_documents_ndjson(
+        project_name,
+        os.path.join(package_dir, DOCUMENTS_FILE_NAME + ".ndjson"),
+        database_name
+    )
+    print("Stored {} documents".format(docs_count))
+
+    manifest_items = []
+    if not only_documents:
+        files = _collect_project_files(project_source_path, root_path)
+        parts = _split_files_to_parts(files, workers)
+        print("Packing {} files into {} parts".format(len(files), len(parts)))
+        part_paths = [
+            os.path.join(files_dir, "part_{:04}.zip".format(idx))
+            for idx in range(len(parts))
+        ]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for items in executor.map(
+                _pack_files_to_zip_part, part_paths, parts
+            ):
+                manifest_items.extend(items)
+
+    manifest_path = os.path.join(package_dir, MANIFEST_FILE_NAME + ".json")
+    with open(manifest_path, "w") as stream:
+        json.dump({"files": manifest_items}, stream)
+
+    # Metadata are stored as last, package without metadata is not complete
+    metadata = {
+        "project_name": project_name,
+        "root": source_root,
+        "version": STREAMED_PACKAGE_VERSION,
+        "documents_count": docs_count
+    }
+    metadata_path = os.path.join(package_dir, METADATA_FILE_NAME + ".json")
+    with open(metadata_path, "w") as stream:
+        json.dump(metadata, stream)
+
+    print("*** Packing finished ***")
+    return package_dir
+
+
 def pack_project(
     project_name,
     destination_dir=None,
@@ -123,26 +417,9 @@ def pack_project(
     source_root = {}
     project_source_path = None
     if not only_documents:
-        roots = project_doc["config"]["roots"]
-        # Determine root directory of project
-        source_root = None
-        source_root_name = None
-        for root_name, root_value in roots.items():
-            if source_root is not None:
-                raise ValueError(
-                    "Packaging is supported only for single root projects"
-                )
-            source_root = root_value
-            source_root_name = root_name
-
-        root_path = source_root[platform.system().lower()]
-        print("Using root \"{}\" with path \"{}\"".format(
-            source_root_name, root_path
-        ))
-
-        project_source_path = os.path.join(root_path, project_name)
-        if not os.path.exists(project_source_path):
-            raise ValueError("Didn't find source of project files")
+        root_path, source_root, project_source_path = _get_project_source(
+            project_doc, project_name
+        )
 
     # Determine zip filepath where data will be stored
     if not destination_dir:
@@ -245,6 +522,189 @@ def _unpack_project_files(unzip_dir, root_path, project_name):
     shutil.move(src_project_files_dir, dst_project_files_dir)
 
 
+def _change_project_root(project_name, new_root, database_name=None):
+    """Change root path of current platform in project document."""
+
+    low_platform = platform.system().lower()
+    project_doc = get_project_document(project_name, database_name)
+    roots = project_doc["config"]["roots"]
+    key = tuple(roots.keys())[0]
+    update_key = "config.roots.{}.{}".format(key, low_platform)
+    collection = get_project_connection(project_name, database_name)
+    collection.update_one(
+        {"_id": project_doc["_id"]},
+        {"$set": {
+            update_key: new_root
+        }}
+    )
+
+
+def _is_file_unpacked(filepath, manifest_item):
+    """Check if file was already unpacked with same content."""
+
+    if not os.path.isfile(filepath):
+        return False
+    if os.path.getsize(filepath) != manifest_item["size"]:
+        return False
+    return _calculate_file_hash(filepath) == manifest_item["hash"]
+
+
+def _unpack_zip_part(zip_path, manifest_items, root_path):
+    """Extract files from a zip part to root.
+
+    Files which already exist with same hash are skipped so interrupted
+    unpack can be resumed. Files are extracted to a temporary file first
+    and renamed when hash of extracted content matches manifest.
+
+    Args:
+        zip_path (str): Path to zip part.
+        manifest_items (list[dict[str, Any]]): Manifest items of files in
+            the part.
+        root_path (str): Path to root where files are extracted.
+
+    Returns:
+        tuple[int, int]: Number of extracted and skipped files.
+    """
+
+    extracted = skipped = 0
+    with zipfile.ZipFile(zip_path, "r") as zip_stream:
+        for item in manifest_items:
+            dst_path = os.path.normpath(os.path.join(root_path, item["path"]))
+            if _is_file_unpacked(dst_path, item):
+                skipped += 1
+                continue
+
+            dst_dir = os.path.dirname(dst_path)
+            if not os.path.exists(dst_dir):
+                os.makedirs(dst_dir, exist_ok=True)
+
+            tmp_path = dst_path + ".unpacking"
+            hasher = hashlib.sha256()
+            archive_name = "/".join((PROJECT_FILES_DIR, item["path"]))
+            with zip_stream.open(archive_name, "r") as src_stream, open(
+                tmp_path, "wb"
+            ) as dst_stream:
+                for chunk in iter(lambda: src_stream.read(_CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+                    dst_stream.write(chunk)
+
+            if hasher.hexdigest() != item["hash"]:
+                os.remove(tmp_path)
+                raise ValueError(
+                    "Hash of unpacked file \"{}\" does not match".format(
+                        item["path"])
+                )
+            os.replace(tmp_path, dst_path)
+            extracted += 1
+    return extracted, skipped
+
+
+def unpack_project_streamed(
+    package_dir,
+    new_root=None,
+    database_only=None,
+    database_name=None,
+    workers=None
+):
+    """Unpack project from package created by 'pack_project_streamed'.
+
+    Files are extracted in parallel directly to project root. Files which
+    already exist with same content are skipped, so unpack can be resumed
+    when it was interrupted.
+
+    Args:
+        package_dir (str): Path to package directory.
+        new_root (str): Optional way how to set different root path for
+            unpacked project.
+        database_only (Optional[bool]): Unpack only database from package.
+        database_name (str): Name of database where project will be recreated.
+        workers (Optional[int]): Number of parallel workers. Number of cpus
+            is used if not passed.
+    """
+
+    if database_only is None:
+        database_only = False
+
+    print("Unpacking project from package {}".format(package_dir))
+    metadata_json_path = os.path.join(
+        package_dir, METADATA_FILE_NAME + ".json"
+    )
+    if not os.path.exists(metadata_json_path):
+        print("Package is not complete, metadata are missing: {}".format(
+            package_dir))
+        return
+
+    with open(metadata_json_path, "r") as stream:
+        metadata = json.load(stream)
+
+    low_platform = platform.system().lower()
+    project_name = metadata["project_name"]
+    root_path = metadata["root"].get(low_platform)
+
+    docs_count = restore_project_documents_ndjson(
+        project_name,
+        os.path.join(package_dir, DOCUMENTS_FILE_NAME + ".ndjson"),
+        database_name
+    )
+    print("Creating project documents ({})".format(docs_count))
+
+    # Skip change of root if is the same as the one stored in metadata
+    #   - root is not stored for database only package
+    if (
+        new_root
+        and root_path is not None
+        and (os.path.normpath(new_root) == os.path.normpath(root_path))
+    ):
+        new_root = None
+
+    if new_root:
+        print("Using different root path {}".format(new_root))
+        root_path = new_root
+        _change_project_root(project_name, new_root, database_name)
+
+    if database_only:
+        print("*** Unpack finished ***")
+        return
+
+    manifest_path = os.path.join(package_dir, MANIFEST_FILE_NAME + ".json")
+    with open(manifest_path, "r") as stream:
+        manifest = json.load(stream)
+
+    items_by_part = {}
+    for item in manifest["files"]:
+        items_by_part.setdefault(item["part"], []).append(item)
+
+    if not items_by_part:
+        print("*** Unpack finished ***")
+        return
+
+    if not workers:
+        workers = os.cpu_count() or 1
+
+    files_dir = os.path.join(package_dir, PROJECT_FILES_DIR)
+    part_names = list(sorted(items_by_part.keys()))
+    print("Unpacking files from {} parts to \"{}\"".format(
+        len(part_names), root_path
+    ))
+    extracted = skipped = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for part_extracted, part_skipped in executor.map(
+            lambda part_name: _unpack_zip_part(
+                os.path.join(files_dir, part_name),
+                items_by_part[part_name],
+                root_path
+            ),
+            part_names
+        ):
+            extracted += part_extracted
+            skipped += part_skipped
+
+    print("Unpacked {} files, skipped {} already existing files".format(
+        extracted, skipped
+    ))
+    print("*** Unpack finished ***")
+
+
 def unpack_project(
     path_to_zip, new_root=None, database_only=None, database_name=None
 ):
@@ -252,13 +712,20 @@ def unpack_project(
 
     Args:
         path_to_zip (str): Path to zip which was created using 'pack_project'
-            function.
+            function or path to package directory created using
+            'pack_project_streamed' function.
         new_root (str): Optional way how to set different root path for
             unpacked project.
         database_only (Optional[bool]): Unpack only database from zip.
         database_name (str): Name of database where project will be recreated.
     """
 
+    if os.path.isdir(path_to_zip):
+        unpack_project_streamed(
+            path_to_zip, new_root, database_only, database_name
+        )
+        return
+
     if database_only is None:
         database_only = False
 
@@ -295,8 +762,10 @@ def unpack_project(
     print("Creating project documents ({})".format(len(docs)))
 
     # Skip change of root if is the same as the one stored in metadata
+    #   - root is not stored for database only package
     if (
         new_root
+        and root_path is not None
         and (os.path.normpath(new_root) == os.path.normpath(root_path))
     ):
         new_root = None
@@ -304,18 +773,7 @@ def unpack_project(
     if new_root:
         print("Using different root path {}".format(new_root))
         root_path = new_root
-
-        project_doc = get_project_document(project_name)
-        roots = project_doc["config"]["roots"]
-        key = tuple(roots.keys())[0]
-        update_key = "config.roots.{}.{}".format(key, low_platform)
-        collection = get_project_connection(project_name, database_name)
-        collection.update_one(
-            {"_id": project_doc["_id"]},
-            {"$set": {
-                update_key: new_root
-            }}
-        )
+        _change_project_root(project_name, new_root, database_name)
 
     _unpack_project_files(tmp_dir, root_path, project_name)
 
@@ -8,6 +8,7 @@ import time
 import inspect
 import logging
 import platform
+import functools
 import threading
 import collections
 import traceback
@@ -63,6 +64,8 @@ IGNORED_DEFAULT_FILENAMES = (
     "example_addons",
     "default_modules",
 )
+# Optional manifest of addon directory which allows to skip addon import
+ADDON_MANIFEST_FILENAME = "manifest.json"
 # Addons that won't be loaded in AYON mode from "./openpype/modules"
 # - the same addons are ignored in "./server_addon/create_ayon_addons.py"
 IGNORED_FILENAMES_IN_AYON = {
@@ -146,6 +149,28 @@ class _ModuleClass(object):
         return self.__attributes__.items()
 
 
+class _AddonsModuleClass(_ModuleClass):
+    """Fake module class for storing OpenPype modules and addons.
+
+    Addons registered by manifest are imported on first access.
+    """
+
+    def __getattr__(self, attr_name):
+        if attr_name not in self.__attributes__:
+            if attr_name in _LoadCache.lazy_addons:
+                _import_lazy_addon(attr_name)
+            elif attr_name == "__spec__":
+                # Accessed by import system on import of not imported addon
+                return None
+        return super(_AddonsModuleClass, self).__getattr__(attr_name)
+
+    def __setattr__(self, attr_name, value):
+        # Import system sets imported addon to parent module again
+        if self.__attributes__.get(attr_name) is value:
+            return
+        super(_AddonsModuleClass, self).__setattr__(attr_name, value)
+
+
 class _InterfacesClass(_ModuleClass):
     """Fake module class for storing OpenPype interfaces.
 
@@ -180,6 +205,12 @@ class _LoadCache:
     modules_lock = threading.Lock()
     interfaces_loaded = False
     modules_loaded = False
+    lazy_addons_lock = threading.RLock()
+    # Addons registered by manifest which were not imported yet
+    lazy_addons = {}
+    # Import time of addons by name of their python module
+    import_times = {}
+    lazy_finder = None
 
 
 def get_default_modules_dir():
@@ -520,7 +551,14 @@ def _load_modules():
     modules_key = "openpype_modules"
 
     # Change `sys.modules`
-    sys.modules[modules_key] = openpype_modules = _ModuleClass(modules_key)
+    sys.modules[modules_key] = openpype_modules = (
+        _AddonsModuleClass(modules_key)
+    )
+    _LoadCache.lazy_addons = {}
+    _LoadCache.import_times = {}
+    if six.PY3 and _LoadCache.lazy_finder is None:
+        _LoadCache.lazy_finder = _LazyAddonsFinder()
+        sys.meta_path.append(_LoadCache.lazy_finder)
 
     log = Logger.get_logger("ModulesLoader")
 
@@ -603,50 +641,325 @@ def _load_modules():
             elif ext not in (".py", ):
                 continue
 
-            # TODO add more logic how to define if folder is module or not
-            # - check manifest and content of manifest
+            import_func = functools.partial(
+                _import_addon,
+                openpype_modules,
+                modules_key,
+                dirpath,
+                filename,
+                is_in_current_dir,
+                is_in_host_dir,
+                log
+            )
+            # Addons with manifest are imported when are needed
+            manifest = None
+            if six.PY3 and not is_in_host_dir and os.path.isdir(fullpath):
+                manifest = _read_addon_manifest(fullpath, log)
+
+            if manifest is not None:
+                _LoadCache.lazy_addons[basename] = _LazyAddon(
+                    basename, manifest, import_func
+                )
+                continue
+
+            start_time = time.time()
+            import_func()
+            _LoadCache.import_times[basename] = time.time() - start_time
+
+
+def _import_addon(
+    openpype_modules,
+    modules_key,
+    dirpath,
+    filename,
+    is_in_current_dir,
+    is_in_host_dir,
+    log
+):
+    """Import addon python module and store it to 'openpype_modules'."""
+
+    fullpath = os.path.join(dirpath, filename)
+    basename, _ = os.path.splitext(filename)
+    try:
+        # Don't import dynamically current directory modules
+        if is_in_current_dir:
+            import_str = "openpype.modules.{}".format(basename)
+            new_import_str = "{}.{}".format(modules_key, basename)
+            default_module = __import__(import_str, fromlist=("", ))
+            sys.modules[new_import_str] = default_module
+            setattr(openpype_modules, basename, default_module)
+
+        elif is_in_host_dir:
+            import_str = "openpype.hosts.{}".format(basename)
+            new_import_str = "{}.{}".format(modules_key, basename)
+            # Until all hosts are converted to be able use them as
+            #   modules is this error check needed
             try:
-                # Don't import dynamically current directory modules
-                if is_in_current_dir:
-                    import_str = "openpype.modules.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    default_module = __import__(import_str, fromlist=("", ))
-                    sys.modules[new_import_str] = default_module
-                    setattr(openpype_modules, basename, default_module)
-
-                elif is_in_host_dir:
-                    import_str = "openpype.hosts.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    # Until all hosts are converted to be able use them as
-                    #   modules is this error check needed
-                    try:
-                        default_module = __import__(
-                            import_str, fromlist=("", )
-                        )
-                        sys.modules[new_import_str] = default_module
-                        setattr(openpype_modules, basename, default_module)
+                default_module = __import__(
+                    import_str, fromlist=("", )
+                )
+                sys.modules[new_import_str] = default_module
+                setattr(openpype_modules, basename, default_module)
 
-                    except Exception:
-                        log.warning(
-                            "Failed to import host folder {}".format(basename),
-                            exc_info=True
-                        )
+            except Exception:
+                log.warning(
+                    "Failed to import host folder {}".format(basename),
+                    exc_info=True
+                )
 
-                elif os.path.isdir(fullpath):
-                    import_module_from_dirpath(dirpath, filename, modules_key)
+        elif os.path.isdir(fullpath):
+            import_module_from_dirpath(dirpath, filename, modules_key)
 
-                else:
-                    module = import_filepath(fullpath)
-                    setattr(openpype_modules, basename, module)
+        else:
+            module = import_filepath(fullpath)
+            setattr(openpype_modules, basename, module)
 
-            except Exception:
-                if is_in_current_dir:
-                    msg = "Failed to import default module '{}'.".format(
-                        basename
-                    )
-                else:
-                    msg = "Failed to import module '{}'.".format(fullpath)
-                log.error(msg, exc_info=True)
+    except Exception:
+        if is_in_current_dir:
+            msg = "Failed to import default module '{}'.".format(
+                basename
+            )
+        else:
+            msg = "Failed to import module '{}'.".format(fullpath)
+        log.error(msg, exc_info=True)
+    return openpype_modules.get(basename)
+
+
+def _read_addon_manifest(dirpath, log):
+    """Read manifest of addon directory without importing its code.
+
+    Manifest is optional json file 'manifest.json' in root of addon
+    directory. Expected keys are "name", "settings_key", "entry_point",
+    "interfaces" and "cli". Only "entry_point", name of addon class available
+    in addon python module, is required.
+
+    Args:
+        dirpath (str): Path to addon directory.
+        log (logging.Logger): Logger used to log invalid manifests.
+
+    Returns:
+        Union[dict[str, Any], None]: Manifest data or None if addon does
+            not have valid manifest.
+    """
+
+    manifest_path = os.path.join(dirpath, ADDON_MANIFEST_FILENAME)
+    if not os.path.exists(manifest_path):
+        return None
+
+    try:
+        with open(manifest_path, "r") as stream:
+            manifest = json.load(stream)
+    except Exception:
+        log.warning(
+            "Failed to read addon manifest {}".format(manifest_path),
+            exc_info=True
+        )
+        return None
+
+    if not isinstance(manifest, dict) or not manifest.get("entry_point"):
+        log.warning(
+            "Addon manifest {} does not define 'entry_point'.".format(
+                manifest_path
+            )
+        )
+        return None
+    return manifest
+
+
+def _import_lazy_addon(basename):
+    """Import addon which was registered by its manifest.
+
+    Args:
+        basename (str): Name of addon python module.
+
+    Returns:
+        Union[ModuleType, None]: Imported addon python module.
+    """
+
+    with _LoadCache.lazy_addons_lock:
+        lazy_addon = _LoadCache.lazy_addons.get(basename)
+        if lazy_addon is None:
+            return sys.modules["openpype_modules"].get(basename)
+
+        start_time = time.time()
+        module = lazy_addon.import_addon()
+        _LoadCache.import_times[basename] = time.time() - start_time
+        _LoadCache.lazy_addons.pop(basename, None)
+    return module
+
+
+def _import_lazy_addons():
+    """Import all addons which were registered by their manifest."""
+
+    for basename in tuple(_LoadCache.lazy_addons.keys()):
+        _import_lazy_addon(basename)
+
+
+class _LazyAddon(object):
+    """Addon registered by manifest which was not imported yet.
+
+    Args:
+        basename (str): Name of addon python module.
+        manifest (dict[str, Any]): Addon manifest data.
+        import_func (Callable[[], ModuleType]): Function which imports
+            the addon.
+    """
+
+    def __init__(self, basename, manifest, import_func):
+        self.basename = basename
+        self.name = manifest.get("name") or basename
+        self.settings_key = manifest.get("settings_key") or self.name
+        self.entry_point = manifest["entry_point"]
+        self.interfaces = list(manifest.get("interfaces") or [])
+        self.cli_name = manifest.get("cli")
+        self._import_func = import_func
+
+    def import_addon(self):
+        return self._import_func()
+
+    def is_disabled(self, modules_settings):
+        """Addon is explicitly disabled in settings.
+
+        Addon without settings or without 'enabled' key is considered as
+        enabled because it is not possible to know without its import.
+
+        Args:
+            modules_settings (dict[str, Any]): Modules system settings.
+
+        Returns:
+            bool: Addon is disabled.
+        """
+
+        addon_settings = modules_settings.get(self.settings_key)
+        if (
+            not isinstance(addon_settings, dict)
+            or "enabled" not in addon_settings
+        ):
+            return False
+        return not addon_settings["enabled"]
+
+
+class _LazyAddonsFinder(object):
+    """Import finder of 'openpype_modules.<addon>' for not imported addons.
+
+    Addons registered by manifest are not available in 'sys.modules' until
+    they're imported. The finder imports them on first import statement.
+    """
+
+    prefix = "openpype_modules."
+
+    def find_spec(self, fullname, path=None, target=None):
+        if not fullname.startswith(self.prefix):
+            return None
+        basename = fullname[len(self.prefix):]
+        if basename not in _LoadCache.lazy_addons:
+            return None
+
+        import importlib.util
+
+        return importlib.util.spec_from_loader(fullname, self)
+
+    def create_module(self, spec):
+        basename = spec.name[len(self.prefix):]
+        module = _import_lazy_addon(basename)
+        if module is None:
+            raise ImportError(
+                "Failed to import addon '{}'".format(basename),
+                name=spec.name
+            )
+        return module
+
+    def exec_module(self, module):
+        # Module was already executed in 'create_module'
+        pass
+
+
+class _DisabledAddonPlaceholder(object):
+    """Placeholder of disabled addon which was not imported.
+
+    Placeholder is used instead of addon registered by manifest when addon
+    is disabled in settings. Addon is imported and initialized on first
+    access to attribute which is not available on placeholder, so code
+    checking only 'enabled' does not cause import of the addon.
+
+    Args:
+        manager (ModulesManager): Manager which created the placeholder.
+        lazy_addon (_LazyAddon): Addon registered by manifest.
+        settings (dict[str, Any]): Settings passed to addon initialization.
+    """
+
+    enabled = False
+
+    def __init__(self, manager, lazy_addon, settings):
+        self._manager = manager
+        self._lazy_addon = lazy_addon
+        self._settings = settings
+        self._addon = None
+        self._id = uuid4()
+
+    @property
+    def id(self):
+        return self._id
+
+    @property
+    def name(self):
+        return self._lazy_addon.name
+
+    @property
+    def interfaces(self):
+        """Names of interfaces defined in addon manifest."""
+
+        return list(self._lazy_addon.interfaces)
+
+    def get_addon(self):
+        """Import and initialize addon.
+
+        Returns:
+            AYONAddon: Initialized addon.
+        """
+
+        if self._addon is None:
+            module = _import_lazy_addon(self._lazy_addon.basename)
+            addon_class = getattr(module, self._lazy_addon.entry_point)
+            self._addon = addon_class(self._manager, self._settings)
+        return self._addon
+
+    def __getattr__(self, attr_name):
+        return getattr(self.get_addon(), attr_name)
+
+    def cli(self, module_click_group):
+        """Add cli group of addon without its import.
+
+        Commands of the group are resolved when the group is used.
+        """
+
+        cli_name = self._lazy_addon.cli_name
+        if not cli_name:
+            return
+
+        import click
+
+        placeholder = self
+
+        class LazyAddonGroup(click.Group):
+            def _get_addon_group(self):
+                tmp_group = click.Group()
+                placeholder.get_addon().cli(tmp_group)
+                return tmp_group.commands.get(cli_name)
+
+            def list_commands(self, ctx):
+                group = self._get_addon_group()
+                if group is None:
+                    return []
+                return group.list_commands(ctx)
+
+            def get_command(self, ctx, cmd_name):
+                group = self._get_addon_group()
+                if group is None:
+                    return None
+                return group.get_command(ctx, cmd_name)
+
+        module_click_group.add_command(LazyAddonGroup(cli_name))
 
 
 @six.add_metaclass(ABCMeta)
@@ -899,8 +1212,18 @@ class ModulesManager:
         time_start = time.time()
         prev_start_time = time_start
 
+        # Addons registered by manifest are imported only if are enabled
+        disabled_lazy_addons = []
+        for lazy_addon in tuple(_LoadCache.lazy_addons.values()):
+            if lazy_addon.is_disabled(modules_settings):
+                disabled_lazy_addons.append(lazy_addon)
+            else:
+                _import_lazy_addon(lazy_addon.basename)
+
         module_classes = []
-        for module in openpype_modules:
+        import_report = {}
+        for basename, module in openpype_modules.items():
+            import_time = _LoadCache.import_times.get(basename)
             # Go through globals in `pype.modules`
             for name in dir(module):
                 modules_item = getattr(module, name, None)
@@ -934,6 +1257,10 @@ class ModulesManager:
                     ).format(name, ", ".join(not_implemented)))
                     continue
                 module_classes.append(modules_item)
+                # Import time is reported with first addon class in module
+                if import_time is not None:
+                    import_report[modules_item.__name__] = import_time
+                    import_time = None
 
         for modules_item in module_classes:
             is_openpype_module = issubclass(modules_item, OpenPypeModule)
@@ -963,7 +1290,23 @@ class ModulesManager:
                     exc_info=True
                 )
 
+        for lazy_addon in disabled_lazy_addons:
+            # Addon could be imported meanwhile
+            if lazy_addon.basename not in _LoadCache.lazy_addons:
+                continue
+            placeholder = _DisabledAddonPlaceholder(
+                self, lazy_addon, modules_settings
+            )
+            self.modules.append(placeholder)
+            self.modules_by_id[placeholder.id] = placeholder
+            self.modules_by_name[placeholder.name] = placeholder
+            self.log.debug("[ ] {} (not imported)".format(placeholder.name))
+
         if self._report is not None:
+            import_report[self._report_total_key] = sum(
+                import_report.values()
+            )
+            self._report["Import"] = import_report
             report[self._report_total_key] = time.time() - time_start
             self._report["Initialization"] = report
 
@@ -1521,6 +1864,8 @@ def get_module_settings_defs():
     """
     # Make sure modules are loaded
     load_modules()
+    # Settings definitions can be in any addon
+    _import_lazy_addons()
 
     import openpype_modules
 
@@ -1,9 +1,13 @@
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 
 import pyblish.api
 
 from openpype.lib import collect_frames
+from openpype.pipeline.farm.directory_scanner import get_directory_scanner
 from openpype_modules.deadline.abstract_submit_deadline import requests_get
 
 
@@ -19,6 +23,17 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
     # case when artists wants to render only subset of frames
     allow_user_override = True
 
+    # maximum of concurrent requests to Deadline webservice
+    max_job_info_workers = 8
+
+    # single frame '1001', range '1001-1010' or range with step
+    #   '1001-1010x2' ('step', 'by' and 'every' are valid too), frames may be
+    #   negative
+    _frame_range_regex = re.compile(
+        r"^(-?\d+)(?:\s*-\s*(-?\d+)(?:\s*(?:x|step|by|every)\s*(\d+))?)?$",
+        re.IGNORECASE
+    )
+
     def process(self, instance):
         """Process all the nodes in the instance"""
 
@@ -33,12 +48,14 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
         # get list of frames from dependent jobs
         frame_list = self._get_dependent_jobs_frames(
             instance, dependent_job_ids)
+        job_frames = self._get_frames_from_frame_list(frame_list)
 
+        # multiple representations (AOVs) usually share staging directory
+        #   so listings are cached for whole publish
+        scanner = get_directory_scanner(instance.context)
         for repre in instance.data["representations"]:
             expected_files = self._get_expected_files(repre)
-
-            staging_dir = repre["stagingDir"]
-            existing_files = self._get_existing_files(staging_dir)
+            existing_files = scanner.get_file_names(repre["stagingDir"])
 
             if self.allow_user_override:
                 # We always check for user override because the user might have
@@ -54,17 +71,24 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
                     raise RuntimeError("Unable to retrieve file_name template"
                                        "from files: {}".format(expected_files))
 
-                job_expected_files = self._get_job_expected_files(
+                # Compare frame numbers instead of file names, the file
+                #   names are created only when the frame list has changed
+                job_frames_diff = self._get_job_frames_difference(
                     file_name_template,
                     frame_placeholder,
-                    frame_list)
-
-                job_files_diff = job_expected_files.difference(expected_files)
-                if job_files_diff:
+                    expected_files,
+                    job_frames)
+
+                if job_frames_diff:
+                    job_expected_files = self._get_job_expected_files(
+                        file_name_template,
+                        frame_placeholder,
+                        job_frames)
                     self.log.debug(
                         "Detected difference in expected output files from "
                         "Deadline job. Assuming an updated frame list by the "
-                        "user. Difference: {}".format(sorted(job_files_diff))
+                        "user. Difference: {}".format(
+                            sorted(job_expected_files - expected_files))
                     )
 
                     # Update the representation expected files
@@ -129,18 +153,105 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
         """
         all_frame_lists = []
 
-        for job_id in dependent_job_ids:
-            job_info = self._get_job_info(instance, job_id)
-            frame_list = job_info["Props"].get("Frames")
+        # Job infos are fetched concurrently, order of results is kept
+        max_workers = max(
+            1, min(len(dependent_job_ids), self.max_job_info_workers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            job_infos = list(executor.map(
+                lambda job_id: self._get_job_info(instance, job_id),
+                dependent_job_ids
+            ))
+
+        for job_info in job_infos:
+            frame_list = job_info.get("Props", {}).get("Frames")
             if frame_list:
                 all_frame_lists.extend(frame_list.split(','))
 
         return all_frame_lists
 
+    def _get_frames_from_frame_list(self, frame_list):
+        """Convert Deadline frame list into set of frame numbers.
+
+        Args:
+            frame_list (list[str]): Frame ranges like '1001-1010', '1001' or
+                '1001-1010x2'.
+
+        Returns:
+            set[int]: Frame numbers.
+
+        Raises:
+            ValueError: When frame range can't be parsed.
+
+        """
+        frames = set()
+        for frame_range in frame_list:
+            frame_range = frame_range.strip()
+            if not frame_range:
+                continue
+            match = self._frame_range_regex.match(frame_range)
+            if not match:
+                raise ValueError(
+                    "Unable to parse frame range \"{}\" of Deadline job "
+                    "frame list.".format(frame_range)
+                )
+            start, end, step = match.groups()
+            start = int(start)
+            end = start if end is None else int(end)
+            step = int(step) if step else 1
+            if step < 1:
+                raise ValueError(
+                    "Invalid step in frame range \"{}\"".format(frame_range)
+                )
+            if end < start:
+                # Reversed range is rendered from start down to end
+                step = -step
+            frames.update(range(start, end + (1 if step > 0 else -1), step))
+        return frames
+
+    def _get_file_name_regex(self, file_name_template, frame_placeholder):
+        """Regex matching file names created from template.
+
+        Frame is captured in first group. Frame may have more digits than
+        is padding of the placeholder.
+        """
+        head, tail = file_name_template.split(frame_placeholder, 1)
+        return re.compile(r"^{}(-?\d{{{},}}){}$".format(
+            re.escape(head), len(frame_placeholder), re.escape(tail)
+        ))
+
+    def _get_job_frames_difference(
+        self, file_name_template, frame_placeholder, expected_files, job_frames
+    ):
+        """Frames from Deadline job which are not in expected files.
+
+        Args:
+            file_name_template (str): File name with frame placeholder.
+            frame_placeholder (Union[str, None]): Frame placeholder ('####').
+            expected_files (set[str]): Expected file names.
+            job_frames (set[int]): Frame numbers of Deadline jobs.
+
+        Returns:
+            set: Frames (or file names without frames) missing in expected
+                files.
+
+        """
+        # no frames in file name at all, eg 'renderCompositingMain.withLut.mov'
+        if not frame_placeholder:
+            return {file_name_template} - expected_files
+
+        regex = self._get_file_name_regex(
+            file_name_template, frame_placeholder)
+        expected_frames = set()
+        for file_name in expected_files:
+            match = regex.match(os.path.basename(file_name))
+            if match:
+                expected_frames.add(int(match.group(1)))
+        return job_frames - expected_frames
+
     def _get_job_expected_files(self,
                                 file_name_template,
                                 frame_placeholder,
-                                frame_list):
+                                job_frames):
         """Calculates list of names of expected rendered files.
 
         Might be different from expected files from submission if user
@@ -151,19 +262,13 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
         if not frame_placeholder:
             return set([file_name_template])
 
-        real_expected_rendered = set()
-        src_padding_exp = "%0{}d".format(len(frame_placeholder))
-        for frames in frame_list:
-            if '-' not in frames:  # single frame
-                frames = "{}-{}".format(frames, frames)
-
-            start, end = frames.split('-')
-            for frame in range(int(start), int(end) + 1):
-                ren_name = file_name_template.replace(
-                    frame_placeholder, src_padding_exp % frame)
-                real_expected_rendered.add(ren_name)
-
-        return real_expected_rendered
+        head, tail = file_name_template.split(frame_placeholder, 1)
+        src_padding_exp = "{}%0{}d{}".format(
+            head.replace("%", "%%"),
+            len(frame_placeholder),
+            tail.replace("%", "%%")
+        )
+        return {src_padding_exp % frame for frame in job_frames}
 
     def _get_file_name_template_and_placeholder(self, files):
         """Returns file name with frame replaced with # and this placeholder"""
@@ -225,13 +330,6 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
             return json_content.pop()
         return {}
 
-    def _get_existing_files(self, staging_dir):
-        """Returns set of existing file names from 'staging_dir'"""
-        existing_files = set()
-        for file_name in os.listdir(staging_dir):
-            existing_files.add(file_name)
-        return existing_files
-
     def _get_expected_files(self, repre):
         """Returns set of file names in representation['files']
 
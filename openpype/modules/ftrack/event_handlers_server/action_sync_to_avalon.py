@@ -26,6 +26,14 @@ class SyncToAvalonServer(ServerAction):
 
     * These information are stored for entities in whole project.
 
+    With 'incremental_sync' enabled in settings are queried and updated only
+    entities which changed since last synchronization. Changes are found in
+    events stored by event server and by comparing state of ftrack hierarchy
+    and avalon documents with state stored by last synchronization. Full
+    synchronization is done when the state is missing, is older than 2 days
+    or event server was restarted since, and is always done by the local
+    action. The state is not stored when synchronization reports errors.
+
     Avalon ID of asset is stored to Ftrack
         - Custom attribute 'avalon_mongo_id'.
     - action IS NOT creating this Custom attribute if doesn't exist
@@ -133,8 +141,16 @@ class SyncToAvalonServer(ServerAction):
 
         self.show_message(event, "Synchronization - Preparing data", True)
 
+        project_settings = self.get_project_settings_from_event(
+            event, project_name
+        )
+        incremental = project_settings["ftrack"]["events"][
+            "sync_to_avalon"].get("incremental_sync", False)
+
         try:
-            output = self.entities_factory.launch_setup(project_name)
+            output = self.entities_factory.launch_setup(
+                project_name, incremental
+            )
             if output is not None:
                 return output
 
@@ -151,12 +167,14 @@ class SyncToAvalonServer(ServerAction):
             time_4 = time.time()
 
             self.entities_factory.duplicity_regex_check()
+            self.entities_factory.filter_unchanged_entities()
             time_5 = time.time()
 
             self.entities_factory.prepare_ftrack_ent_data()
             time_6 = time.time()
 
             self.entities_factory.synchronize()
+            self.entities_factory.store_sync_state()
             time_7 = time.time()
 
             self.log.debug(
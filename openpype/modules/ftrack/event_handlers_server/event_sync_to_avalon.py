@@ -23,7 +23,7 @@ from openpype.pipeline import AvalonMongoDB, schema
 
 from openpype_modules.ftrack.lib import (
     get_openpype_attr,
-    query_custom_attributes,
+    CustomAttributeValuesFetcher,
     CUST_ATTR_ID_KEY,
     CUST_ATTR_AUTO_SYNC,
     FPS_KEYS,
@@ -34,8 +34,10 @@ from openpype_modules.ftrack.lib import (
 )
 from openpype_modules.ftrack.lib.avalon_sync import (
     convert_to_fps,
+    resolve_hierarchical_values,
     InvalidFpsValue
 )
+from openpype_modules.ftrack.ftrack_server.lib import TOPIC_PROCESSOR_IDLE
 
 
 class SyncToAvalonEvent(BaseEvent):
@@ -78,6 +80,13 @@ class SyncToAvalonEvent(BaseEvent):
     created_entities = []
     report_splitter = {"type": "label", "value": "---"}
 
+    # Events are collected for this amount of seconds, changes of entities
+    #   are merged and processed at once
+    # - set to 0 to process each event on its own
+    coalesce_window = 2
+    # Collected events are processed when this count is reached
+    coalesce_max_events = 500
+
     def __init__(self, session):
         '''Expects a ftrack_api.Session instance'''
         # Debug settings
@@ -89,6 +98,12 @@ class SyncToAvalonEvent(BaseEvent):
         #   only entityTypes in interest instead of filtering by ignored
         self.debug_sync_types = collections.defaultdict(list)
 
+        # Collected events waiting for processing
+        self._pending_events = []
+        self._pending_since = None
+        # Events are collected only if processor emits idle events
+        self._idle_events_supported = False
+
         self.dbcon = AvalonMongoDB()
         # Set processing session to not use global
         self.set_process_session(session)
@@ -483,6 +498,11 @@ class SyncToAvalonEvent(BaseEvent):
 
         self._ent_types_by_name = None
 
+        # Values are cached only during processing of one event
+        self.cust_attr_values_fetcher = CustomAttributeValuesFetcher(
+            self.process_session
+        )
+
         self.ftrack_ents_by_id = {}
         self.obj_id_ent_type_map = {}
         self.ftrack_recreated_mapping = {}
@@ -594,7 +614,202 @@ class SyncToAvalonEvent(BaseEvent):
                 return "unknown hierarchy"
         return "/".join([ent["name"] for ent in entity["link"]])
 
+    def register(self):
+        super(SyncToAvalonEvent, self).register()
+        self.session.event_hub.subscribe(
+            "topic={}".format(TOPIC_PROCESSOR_IDLE),
+            self._on_processor_idle,
+            priority=self.priority
+        )
+
+    def _on_processor_idle(self, event):
+        self._idle_events_supported = True
+        if (
+            self._pending_events
+            and time.time() - self._pending_since >= self.coalesce_window
+        ):
+            try:
+                self.process_pending_events(self.session)
+            except Exception:
+                self.session.rollback()
+                self.log.error(
+                    "Processing of collected events failed", exc_info=True
+                )
+
+    def _is_auto_sync_change(self, event):
+        for ent_info in event["data"].get("entities") or []:
+            if (
+                ent_info.get("entityType") == "show"
+                and CUST_ATTR_AUTO_SYNC in (ent_info.get("changes") or {})
+            ):
+                return True
+        return False
+
+    def _get_event_project_id(self, event):
+        for ent_info in event["data"].get("entities") or []:
+            for parent in ent_info.get("parents") or []:
+                if parent.get("entityType") == "show":
+                    return parent.get("entityId")
+        return None
+
+    def _merge_entity_info(self, current, new):
+        """Merge changes of an entity from two events.
+
+        Removed entity can't be changed anymore and added entity is queried
+        with current values so other changes are not needed. Changes of
+        updated or moved entity are merged, keeping the oldest 'old' and
+        the newest 'new' value.
+        """
+        if new["action"] == "remove" or current["action"] == "remove":
+            return copy.deepcopy(new)
+
+        if current["action"] == "add":
+            return current
+
+        merged = copy.deepcopy(current)
+        if new["action"] == "move":
+            merged["action"] = "move"
+
+        changes = merged.get("changes") or {}
+        for key, change in (new.get("changes") or {}).items():
+            if key in changes:
+                changes[key] = {
+                    "old": changes[key].get("old"),
+                    "new": change.get("new")
+                }
+            else:
+                changes[key] = copy.deepcopy(change)
+        merged["changes"] = changes
+
+        keys = list(merged.get("keys") or [])
+        for key in new.get("keys") or []:
+            if key not in keys:
+                keys.append(key)
+        merged["keys"] = keys
+
+        for key in ("parentId", "parents"):
+            if key in new:
+                merged[key] = copy.deepcopy(new[key])
+        return merged
+
+    def merge_events(self, events):
+        """Merge entity changes from multiple events.
+
+        Args:
+            events (list[ftrack_api.event.base.Event]): Events to merge.
+
+        Returns:
+            list[ftrack_api.event.base.Event]: One merged event per project.
+        """
+        infos_by_project_id = collections.OrderedDict()
+        last_event_by_project_id = {}
+        for event in events:
+            project_id = self._get_event_project_id(event)
+            last_event_by_project_id[project_id] = event
+            infos_by_id = infos_by_project_id.setdefault(
+                project_id, collections.OrderedDict()
+            )
+            for ent_info in event["data"].get("entities") or []:
+                ftrack_id = ent_info.get("entityId")
+                if isinstance(ftrack_id, list):
+                    ftrack_id = tuple(ftrack_id)
+                current = infos_by_id.get(ftrack_id)
+                if current is None:
+                    infos_by_id[ftrack_id] = copy.deepcopy(ent_info)
+                else:
+                    infos_by_id[ftrack_id] = self._merge_entity_info(
+                        current, ent_info
+                    )
+
+        output = []
+        for project_id, infos_by_id in infos_by_project_id.items():
+            last_event = last_event_by_project_id[project_id]
+            output.append(ftrack_api.event.base.Event(
+                topic=last_event["topic"],
+                data={"entities": list(infos_by_id.values())},
+                source=last_event.get("source")
+            ))
+        return output
+
+    def process_pending_events(self, session):
+        """Process collected events merged together.
+
+        Events of each project are merged and processed at once. If
+        processing of merged event fails, the events are processed one by
+        one. Events are set as processed in event server database only
+        after that, so they're processed again after processor restart
+        if processor crashes before.
+        """
+        events = self._pending_events
+        self._pending_events = []
+        self._pending_since = None
+        if not events:
+            return
+
+        events_by_project_id = collections.OrderedDict()
+        for event in events:
+            project_id = self._get_event_project_id(event)
+            events_by_project_id.setdefault(project_id, []).append(event)
+
+        self.log.debug("Processing {} collected events as {}".format(
+            len(events), len(events_by_project_id)
+        ))
+        for project_events in events_by_project_id.values():
+            self._process_merged_events(session, project_events)
+
+        session.event_hub.set_events_processed(events)
+
+    def _process_merged_events(self, session, events):
+        merged_event = self.merge_events(events)[0]
+        try:
+            self.process_event(session, merged_event)
+            return
+        except Exception:
+            self.log.warning((
+                "Processing of {} merged events failed."
+                " Processing them one by one."
+            ).format(len(events)), exc_info=True)
+
+        for event in events:
+            try:
+                self.process_event(session, event)
+            except Exception:
+                self.log.error(
+                    "Processing of collected event failed", exc_info=True
+                )
+
     def launch(self, session, event):
+        """Collect events to process them together.
+
+        Events are collected for 'coalesce_window' seconds and processed
+        when window is over, on processor idle or when count of collected
+        events reaches 'coalesce_max_events'. Change of project auto sync
+        is processed immediately.
+
+        Collected events are deferred in processor event hub, so they're
+        not set as processed until they're really processed.
+        """
+        if (
+            not self.coalesce_window
+            or not self._idle_events_supported
+            or self._is_auto_sync_change(event)
+        ):
+            self.process_pending_events(session)
+            return self.process_event(session, event)
+
+        if not self._pending_events:
+            self._pending_since = time.time()
+        session.event_hub.defer_event(event)
+        self._pending_events.append(event)
+
+        if (
+            len(self._pending_events) >= self.coalesce_max_events
+            or time.time() - self._pending_since >= self.coalesce_window
+        ):
+            self.process_pending_events(session)
+        return True
+
+    def process_event(self, session, event):
         """
             Main entry port for synchronization.
             Goes through event (can contain multiple changes) and decides if
@@ -1392,7 +1607,8 @@ class SyncToAvalonEvent(BaseEvent):
             self.process_session,
             entity,
             hier_attrs,
-            self.cust_attr_types_by_id.values()
+            self.cust_attr_types_by_id.values(),
+            self.cust_attr_values_fetcher
         )
         for key, val in hier_values.items():
             output[key] = val
@@ -2254,8 +2470,7 @@ class SyncToAvalonEvent(BaseEvent):
         for key in hier_cust_attrs_keys:
             configuration_ids.add(hier_attr_id_by_key[key])
 
-        values = query_custom_attributes(
-            self.process_session,
+        values = self.cust_attr_values_fetcher.get_values(
             configuration_ids,
             cust_attrs_ftrack_ids,
             True
@@ -2336,22 +2551,34 @@ class SyncToAvalonEvent(BaseEvent):
             if value is not None:
                 project_values[key] = value
 
-        hier_down_queue = collections.deque()
-        hier_down_queue.append(
-            (project_values, ftrack_project_id)
+        # Prepare hierarchy as array of parent indexes (parents are always
+        #   before children)
+        ordered_ids = [ftrack_project_id]
+        parent_indexes = [-1]
+        idx = 0
+        while idx < len(ordered_ids):
+            for child_id in entities_dict[ordered_ids[idx]]["children"]:
+                ordered_ids.append(child_id)
+                parent_indexes.append(idx)
+            idx += 1
+
+        values_by_key = {}
+        for key in set(hier_cust_attrs_keys) | set(project_values.keys()):
+            values = [project_values.get(key)]
+            for ftrack_id in ordered_ids[1:]:
+                value = None
+                if key in hier_cust_attrs_keys:
+                    value = entities_dict[ftrack_id]["hier_attrs"].get(key)
+                values.append(value)
+            values_by_key[key] = values
+
+        resolved_by_key = resolve_hierarchical_values(
+            parent_indexes, values_by_key
         )
-
-        while hier_down_queue:
-            hier_values, parent_id = hier_down_queue.popleft()
-            for child_id in entities_dict[parent_id]["children"]:
-                _hier_values = hier_values.copy()
-                for name in hier_cust_attrs_keys:
-                    value = entities_dict[child_id]["hier_attrs"].get(name)
-                    if value is not None:
-                        _hier_values[name] = value
-
-                entities_dict[child_id]["hier_attrs"].update(_hier_values)
-                hier_down_queue.append((_hier_values, child_id))
+        for key, values in resolved_by_key.items():
+            for ftrack_id, value in zip(ordered_ids[1:], values[1:]):
+                if value is not None:
+                    entities_dict[ftrack_id]["hier_attrs"][key] = value
 
         ftrack_mongo_mapping = {}
         for mongo_id, ftrack_id in mongo_ftrack_mapping.items():
@@ -149,12 +149,14 @@ class SyncToAvalonLocal(BaseAction):
             time_4 = time.time()
 
             self.entities_factory.duplicity_regex_check()
+            self.entities_factory.filter_unchanged_entities()
             time_5 = time.time()
 
             self.entities_factory.prepare_ftrack_ent_data()
             time_6 = time.time()
 
             self.entities_factory.synchronize()
+            self.entities_factory.store_sync_state()
             time_7 = time.time()
 
             self.log.debug(
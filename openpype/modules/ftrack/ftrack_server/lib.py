@@ -31,6 +31,8 @@ from openpype.lib import Logger
 
 TOPIC_STATUS_SERVER = "openpype.event.server.status"
 TOPIC_STATUS_SERVER_RESULT = "openpype.event.server.status.result"
+# Local event emitted by processor when there are no events to process
+TOPIC_PROCESSOR_IDLE = "openpype.event.server.processor.idle"
 
 
 def get_host_ip():
@@ -120,6 +122,8 @@ class ProcessEventHub(SocketBaseEventHub):
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
+        # Mongo ids of events which handlers set as processed on their own
+        self._deferred_mongo_ids = set()
 
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
@@ -148,7 +152,7 @@ class ProcessEventHub(SocketBaseEventHub):
     def wait(self, duration=None):
         """Overridden wait
         Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        set as processed in Mongo DB, unless a handler deferred it.
         """
         started = time.time()
         self.prepare_dbcon()
@@ -157,13 +161,17 @@ class ProcessEventHub(SocketBaseEventHub):
                 event = self._event_queue.get(timeout=0.1)
             except queue.Empty:
                 if not self.load_events():
+                    self._handle_idle()
                     time.sleep(0.5)
             else:
                 try:
                     self._handle(event)
 
                     mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
+                    if (
+                        mongo_id is None
+                        or mongo_id in self._deferred_mongo_ids
+                    ):
                         continue
 
                     self.dbcon.update_one(
@@ -184,6 +192,55 @@ class ProcessEventHub(SocketBaseEventHub):
                 if (time.time() - started) > duration:
                     break
 
+    def _handle_idle(self):
+        """Let handlers know that there are no events to process.
+
+        Handlers which collect events to process them together can use it
+        to process collected events.
+        """
+        event = ftrack_api.event.base.Event(topic=TOPIC_PROCESSOR_IDLE)
+        try:
+            self._handle(event)
+        except Exception:
+            self.pypelog.warning(
+                "Failed to handle idle event", exc_info=True
+            )
+
+    def defer_event(self, event):
+        """Don't set event as processed when handling of event finishes.
+
+        Handler which collects events to process them later must call
+        'set_events_processed' when they're processed. Deferred events which
+        were not set as processed are loaded again after processor restart.
+
+        Args:
+            event (ftrack_api.event.base.Event): Handled event.
+        """
+
+        mongo_id = event["data"].get("_event_mongo_id")
+        if mongo_id is not None:
+            self._deferred_mongo_ids.add(mongo_id)
+
+    def set_events_processed(self, events):
+        """Set deferred events as processed in Mongo DB.
+
+        Args:
+            events (Iterable[ftrack_api.event.base.Event]): Processed events.
+        """
+
+        mongo_ids = []
+        for event in events:
+            mongo_id = event["data"].get("_event_mongo_id")
+            if mongo_id is not None:
+                mongo_ids.append(mongo_id)
+                self._deferred_mongo_ids.discard(mongo_id)
+
+        if mongo_ids:
+            self.dbcon.update_many(
+                {"_id": {"$in": mongo_ids}},
+                {"$set": {"pype_data.is_processed": True}}
+            )
+
     def load_events(self):
         """Load not processed events sorted by stored date"""
         ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
@@ -192,9 +249,12 @@ class ProcessEventHub(SocketBaseEventHub):
             "pype_data.is_processed": True
         })
 
-        not_processed_events = self.dbcon.find(
-            {"pype_data.is_processed": False}
-        ).sort(
+        query = {"pype_data.is_processed": False}
+        # Deferred events are waiting in handlers
+        if self._deferred_mongo_ids:
+            query["_id"] = {"$nin": list(self._deferred_mongo_ids)}
+
+        not_processed_events = self.dbcon.find(query).sort(
             [("pype_data.stored", pymongo.ASCENDING)]
         ).limit(100)
 
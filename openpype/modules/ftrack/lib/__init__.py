@@ -8,14 +8,16 @@ from .constants import (
     FPS_KEYS
 )
 from .settings import (
-    get_ftrack_event_mongo_info
+    get_ftrack_event_mongo_info,
+    get_ftrack_sync_state_mongo_info,
 )
 from .custom_attributes import (
     default_custom_attributes_definition,
     app_definitions_from_app_manager,
     tool_definitions_from_app_manager,
     get_openpype_attr,
-    query_custom_attributes
+    query_custom_attributes,
+    CustomAttributeValuesFetcher,
 )
 
 from . import avalon_sync
@@ -35,12 +37,14 @@ __all__ = (
     "FPS_KEYS",
 
     "get_ftrack_event_mongo_info",
+    "get_ftrack_sync_state_mongo_info",
 
     "default_custom_attributes_definition",
     "app_definitions_from_app_manager",
     "tool_definitions_from_app_manager",
     "get_openpype_attr",
     "query_custom_attributes",
+    "CustomAttributeValuesFetcher",
 
     "avalon_sync",
 
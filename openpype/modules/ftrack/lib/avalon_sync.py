@@ -1,5 +1,7 @@
 import re
 import json
+import hashlib
+import datetime
 import collections
 import copy
 import numbers
@@ -7,6 +9,7 @@ import numbers
 import six
 
 from openpype.client import (
+    OpenPypeMongoConnection,
     get_project,
     get_assets,
     get_archived_assets,
@@ -24,7 +27,15 @@ from openpype.lib import ApplicationManager, Logger
 from openpype.pipeline import AvalonMongoDB, schema
 
 from .constants import CUST_ATTR_ID_KEY, FPS_KEYS
-from .custom_attributes import get_openpype_attr, query_custom_attributes
+from .settings import (
+    get_ftrack_event_mongo_info,
+    get_ftrack_sync_state_mongo_info,
+)
+from .custom_attributes import (
+    get_openpype_attr,
+    query_custom_attributes,
+    CustomAttributeValuesFetcher,
+)
 
 from bson.objectid import ObjectId
 from bson.errors import InvalidId
@@ -313,8 +324,105 @@ def get_project_apps(in_app_list):
     return apps, warnings
 
 
+def resolve_hierarchical_values(parent_indexes, values_by_key):
+    """Resolve inherited hierarchical values in single top-down pass.
+
+    Hierarchy is passed as array of parent indexes where parent must be
+    before its children (e.g. breadth-first order). Value which is 'None'
+    is inherited from parent.
+
+    Args:
+        parent_indexes (list[int]): Index of parent for each entity, root
+            entities have '-1'.
+        values_by_key (dict[str, list[Any]]): Values set directly on entities
+            by attribute key. Each list has same order as 'parent_indexes'.
+
+    Returns:
+        dict[str, list[Any]]: Resolved values by attribute key.
+    """
+    output = {}
+    for key, values in values_by_key.items():
+        resolved = list(values)
+        for idx, parent_idx in enumerate(parent_indexes):
+            if resolved[idx] is None and parent_idx >= 0:
+                resolved[idx] = resolved[parent_idx]
+        output[key] = resolved
+    return output
+
+
+def calculate_data_hash(data):
+    """Hash of json serializable data (other values are converted to str)."""
+    content = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def get_ftrack_ids_from_update_events(event_docs):
+    """Ids of ftrack entities changed by 'ftrack.update' events.
+
+    Change of task is change of its parent because tasks are stored on
+    parent in avalon.
+
+    Args:
+        event_docs (Iterable[dict]): Stored events.
+
+    Returns:
+        set[str]: Ids of changed entities.
+    """
+    ftrack_ids = set()
+    for event_doc in event_docs:
+        for ent_info in event_doc.get("data", {}).get("entities") or []:
+            if (ent_info.get("entity_type") or "").lower() == "task":
+                ftrack_id = ent_info.get("parentId")
+            else:
+                ftrack_id = ent_info.get("entityId")
+
+            if isinstance(ftrack_id, list):
+                ftrack_id = ftrack_id[0] if ftrack_id else None
+            if ftrack_id:
+                ftrack_ids.add(ftrack_id)
+    return ftrack_ids
+
+
+def get_incremental_sync_ids(entities_dict, changed_ids):
+    """Entities to update and entities with values to query.
+
+    Hierarchical attributes are inherited so children of changed entity
+    are updated too. Values of parents are needed to resolve inherited
+    values.
+
+    Args:
+        entities_dict (dict[str, dict]): Entity data by ftrack id with
+            'parent_id' and 'children'.
+        changed_ids (Iterable[str]): Ids of changed entities.
+
+    Returns:
+        tuple[set[str], set[str]]: Ids of entities to update and ids of
+            entities with values to query.
+    """
+    update_ids = set()
+    queue = collections.deque(
+        ftrack_id
+        for ftrack_id in changed_ids
+        if ftrack_id in entities_dict
+    )
+    while queue:
+        ftrack_id = queue.popleft()
+        if ftrack_id in update_ids:
+            continue
+        update_ids.add(ftrack_id)
+        queue.extend(entities_dict[ftrack_id]["children"])
+
+    fetch_ids = set(update_ids)
+    for ftrack_id in update_ids:
+        parent_id = entities_dict[ftrack_id]["parent_id"]
+        while parent_id in entities_dict and parent_id not in fetch_ids:
+            fetch_ids.add(parent_id)
+            parent_id = entities_dict[parent_id]["parent_id"]
+    return update_ids, fetch_ids
+
+
 def get_hierarchical_attributes_values(
-    session, entity, hier_attrs, cust_attr_types=None
+    session, entity, hier_attrs, cust_attr_types=None, values_fetcher=None
 ):
     if not cust_attr_types:
         cust_attr_types = session.query(
@@ -345,9 +453,14 @@ def get_hierarchical_attributes_values(
 
     entity_ids = [item["id"] for item in entity["link"]]
 
-    values = query_custom_attributes(
-        session, list(attr_key_by_id.keys()), entity_ids, True
-    )
+    if values_fetcher is not None:
+        values = values_fetcher.get_values(
+            attr_key_by_id.keys(), entity_ids, True
+        )
+    else:
+        values = query_custom_attributes(
+            session, list(attr_key_by_id.keys()), entity_ids, True
+        )
 
     hier_values = {}
     for key, val in defaults.items():
@@ -405,6 +518,9 @@ class SyncEntitiesFactory:
     )
     ignore_custom_attr_key = "avalon_ignore_sync"
     ignore_entity_types = ["milestone"]
+    # Incremental synchronization needs events stored since last
+    #   synchronization, processed events are removed after 3 days
+    incremental_max_age = datetime.timedelta(days=2)
 
     report_splitter = {"type": "label", "value": "---"}
 
@@ -414,7 +530,19 @@ class SyncEntitiesFactory:
         self._api_key = session.api_key
         self._api_user = session.api_user
 
-    def launch_setup(self, project_full_name):
+    def launch_setup(self, project_full_name, incremental=False):
+        """Prepare ftrack entities of project for synchronization.
+
+        Args:
+            project_full_name (str): Full name of ftrack project.
+            incremental (Optional[bool]): Query custom attribute values and
+                update only entities which changed since last
+                synchronization. Full synchronization is used if state of
+                last synchronization is not available.
+        """
+
+        # Changes made during synchronization are found by next one
+        self.sync_started = datetime.datetime.utcnow()
         try:
             self.session.close()
         except Exception:
@@ -426,6 +554,9 @@ class SyncEntitiesFactory:
             api_user=self._api_user,
             auto_connect_event_hub=False
         )
+        self.cust_attr_values_fetcher = CustomAttributeValuesFetcher(
+            self.session
+        )
 
         self.duplicates = {}
         self.failed_regex = {}
@@ -473,6 +604,12 @@ class SyncEntitiesFactory:
         self.update_ftrack_ids = None
         self.deleted_entities = None
 
+        self.incremental = incremental
+        self.entity_hashes = {}
+        # Ids of entities to update and to query values for, all if 'None'
+        self.changed_ftrack_ids = None
+        self.fetch_ftrack_ids = None
+
         # Get Ftrack project
         ft_project = self.session.query(
             self.project_query.format(project_full_name)
@@ -579,6 +716,14 @@ class SyncEntitiesFactory:
         self.ft_project_id = ft_project_id
         self.entities_dict = entities_dict
 
+        self.entity_hashes = {
+            ftrack_id: self._calculate_entity_hash(ftrack_id)
+            for ftrack_id, entity_dict in self.entities_dict.items()
+            if entity_dict["entity"] is not None
+        }
+        if incremental:
+            self._prepare_incremental_sync()
+
     @property
     def project_name(self):
         return self.entities_dict[self.ft_project_id]["name"]
@@ -1068,9 +1213,16 @@ class SyncEntitiesFactory:
                     copy.deepcopy(prepared_avalon_attr_ca_id)
                 )
 
-        items = query_custom_attributes(
-            self.session,
-            list(attribute_key_by_id.keys()),
+        # Query values only of changed entities in incremental mode
+        if self.fetch_ftrack_ids is not None:
+            sync_ids = [
+                entity_id
+                for entity_id in sync_ids
+                if entity_id in self.fetch_ftrack_ids
+            ]
+
+        items = self.cust_attr_values_fetcher.get_values(
+            attribute_key_by_id.keys(),
             sync_ids
         )
 
@@ -1180,9 +1332,8 @@ class SyncEntitiesFactory:
             for key, val in prepare_dict_avalon.items():
                 entity_dict["avalon_attrs"][key] = val
 
-        items = query_custom_attributes(
-            self.session,
-            list(attribute_key_by_id.keys()),
+        items = self.cust_attr_values_fetcher.get_values(
+            attribute_key_by_id.keys(),
             sync_ids,
             True
         )
@@ -1245,24 +1396,38 @@ class SyncEntitiesFactory:
             if value is not None:
                 project_values[key] = value
 
-        hier_down_queue = collections.deque()
-        hier_down_queue.append((project_values, top_id))
-
-        while hier_down_queue:
-            hier_values, parent_id = hier_down_queue.popleft()
-            for child_id in self.entities_dict[parent_id]["children"]:
-                _hier_values = copy.deepcopy(hier_values)
-                for key in attributes_by_key.keys():
-                    if key.startswith("avalon_"):
-                        store_key = "avalon_attrs"
-                    else:
-                        store_key = "hier_attrs"
-                    value = self.entities_dict[child_id][store_key][key]
-                    if value is not None:
-                        _hier_values[key] = value
+        # Prepare hierarchy as array of parent indexes (parents are always
+        #   before children)
+        ordered_ids = [top_id]
+        parent_indexes = [-1]
+        idx = 0
+        while idx < len(ordered_ids):
+            for child_id in self.entities_dict[ordered_ids[idx]]["children"]:
+                ordered_ids.append(child_id)
+                parent_indexes.append(idx)
+            idx += 1
+
+        values_by_key = {}
+        for key in attributes_by_key.keys():
+            if key.startswith("avalon_"):
+                store_key = "avalon_attrs"
+            else:
+                store_key = "hier_attrs"
+            values = [project_values.get(key)]
+            for ftrack_id in ordered_ids[1:]:
+                values.append(self.entities_dict[ftrack_id][store_key][key])
+            values_by_key[key] = values
 
-                self.entities_dict[child_id]["hier_attrs"].update(_hier_values)
-                hier_down_queue.append((_hier_values, child_id))
+        resolved_by_key = resolve_hierarchical_values(
+            parent_indexes, values_by_key
+        )
+        for key, values in resolved_by_key.items():
+            for ftrack_id, value in zip(ordered_ids[1:], values[1:]):
+                if value is None:
+                    continue
+                if isinstance(value, (list, dict)):
+                    value = copy.deepcopy(value)
+                self.entities_dict[ftrack_id]["hier_attrs"][key] = value
 
     def remove_from_archived(self, mongo_id):
         entity = self.avalon_archived_by_id.pop(mongo_id, None)
@@ -1575,6 +1740,226 @@ class SyncEntitiesFactory:
             len(deleted_entities)
         ))
 
+    def _calculate_entity_hash(self, ftrack_id):
+        """Hash of entity data queried with entities of project.
+
+        Custom attribute values are not part of the hash, their changes
+        are found using stored ftrack events. Link of entity is part of the
+        hash so change of parent's name or hierarchy changes hash of all
+        children.
+        """
+        entity_dict = self.entities_dict[ftrack_id]
+        entity = entity_dict["entity"]
+        data = {
+            "name": entity_dict["name"],
+            "parent_id": entity_dict["parent_id"],
+            "entity_type": entity_dict.get("entity_type_orig"),
+            "tasks": entity_dict.get("tasks")
+        }
+        if ftrack_id != self.ft_project_id:
+            data["description"] = entity["description"]
+            data["link"] = [ent["name"] for ent in entity["link"]]
+        return calculate_data_hash(data)
+
+    def _get_sync_state_collection(self):
+        database_name, collection_name = get_ftrack_sync_state_mongo_info()
+        mongo_client = OpenPypeMongoConnection.get_mongo_client()
+        return mongo_client[database_name][collection_name]
+
+    def _load_sync_state(self):
+        """State stored by last successful synchronization.
+
+        Returns:
+            Union[dict[str, Any], None]: State document or None if state is
+                not available, is not valid for the project or is too old.
+        """
+        state_doc = self._get_sync_state_collection().find_one(
+            {"project_name": self.project_name}
+        )
+        if (
+            not state_doc
+            or state_doc.get("ftrack_project_id") != self.ft_project_id
+            or "avalon_hashes" not in state_doc
+            or not get_project(self.project_name, fields=["_id"])
+        ):
+            return None
+
+        # Processed events are removed from event server database
+        synchronized = state_doc["synchronized"]
+        if self.sync_started - synchronized > self.incremental_max_age:
+            return None
+        return state_doc
+
+    def _get_ids_changed_by_events(self, since):
+        """Ids of entities changed in ftrack since passed date.
+
+        Changes are found in events stored by event server.
+
+        Returns:
+            Union[set[str], None]: Changed entity ids or None if event
+                storer was restarted, events could be missed.
+        """
+        database_name, collection_name = get_ftrack_event_mongo_info()
+        mongo_client = OpenPypeMongoConnection.get_mongo_client()
+        collection = mongo_client[database_name][collection_name]
+        storer_started = collection.find_one({
+            "topic": "openpype.storer.started",
+            "pype_data.stored": {"$gte": since}
+        })
+        if storer_started:
+            return None
+
+        event_docs = collection.find(
+            {
+                "topic": "ftrack.update",
+                "pype_data.stored": {"$gte": since},
+                "data.entities.parents.entityId": self.ft_project_id
+            },
+            {"data.entities": True}
+        )
+        return get_ftrack_ids_from_update_events(event_docs)
+
+    def _get_ids_changed_in_avalon(self, avalon_hashes):
+        """Ids of entities which don't match avalon state of last sync.
+
+        Entity is changed if it does not have avalon document or if the
+        document was changed since last synchronization.
+        """
+        changed_ids = set()
+        matching_ids = set()
+        for asset_doc in get_assets(self.project_name):
+            ftrack_id = asset_doc.get("data", {}).get("ftrackId")
+            if ftrack_id not in self.entities_dict:
+                continue
+            matching_ids.add(ftrack_id)
+            if avalon_hashes.get(ftrack_id) != calculate_data_hash(
+                asset_doc
+            ):
+                changed_ids.add(ftrack_id)
+
+        for ftrack_id, entity_dict in self.entities_dict.items():
+            if (
+                ftrack_id not in matching_ids
+                and ftrack_id != self.ft_project_id
+                and entity_dict["entity"] is not None
+            ):
+                changed_ids.add(ftrack_id)
+        return changed_ids
+
+    def _prepare_incremental_sync(self):
+        """Find entities which changed since last synchronization.
+
+        Only custom attribute values of changed entities, their children and
+        parents are queried and only changed entities with children are
+        updated. Full synchronization is used if state of last
+        synchronization is not available.
+        """
+        state_doc = self._load_sync_state()
+        changed_by_events = None
+        if state_doc is not None:
+            changed_by_events = self._get_ids_changed_by_events(
+                state_doc["synchronized"]
+            )
+
+        if changed_by_events is None:
+            self.log.debug((
+                "State of previous synchronization is not available."
+                " Using full synchronization."
+            ))
+            return
+
+        previous_hashes = state_doc.get("entity_hashes") or {}
+        changed_ids = {
+            ftrack_id
+            for ftrack_id, entity_hash in self.entity_hashes.items()
+            if previous_hashes.get(ftrack_id) != entity_hash
+        }
+        changed_ids |= changed_by_events
+        changed_ids |= self._get_ids_changed_in_avalon(
+            state_doc["avalon_hashes"]
+        )
+
+        self.changed_ftrack_ids, self.fetch_ftrack_ids = (
+            get_incremental_sync_ids(self.entities_dict, changed_ids)
+        )
+        # Project is always updated, children are updated only if project
+        #   changed
+        self.changed_ftrack_ids.add(self.ft_project_id)
+        self.fetch_ftrack_ids.add(self.ft_project_id)
+        self.log.debug((
+            "Incremental synchronization: Changed <{}> of <{}> entities"
+        ).format(len(self.changed_ftrack_ids), len(self.entity_hashes)))
+
+    def _has_report_errors(self):
+        """Synchronization reported errors."""
+        return any(items for items in self.report_items["error"].values())
+
+    def store_sync_state(self):
+        """Store state of synchronized entities.
+
+        Should be called after synchronization. State is not stored if
+        synchronization reported errors, so next incremental
+        synchronization processes the same changes again.
+
+        Returns:
+            bool: State was stored.
+        """
+        if self._has_report_errors():
+            self.log.info((
+                "Synchronization reported errors."
+                " State of synchronization is not stored."
+            ))
+            return False
+
+        entity_hashes = {
+            ftrack_id: entity_hash
+            for ftrack_id, entity_hash in self.entity_hashes.items()
+            if ftrack_id in self.ftrack_avalon_mapper
+        }
+        # Avalon documents after synchronization
+        avalon_hashes = {}
+        for asset_doc in get_assets(self.project_name):
+            ftrack_id = asset_doc.get("data", {}).get("ftrackId")
+            if ftrack_id:
+                avalon_hashes[ftrack_id] = calculate_data_hash(asset_doc)
+
+        self._get_sync_state_collection().replace_one(
+            {"project_name": self.project_name},
+            {
+                "project_name": self.project_name,
+                "ftrack_project_id": self.ft_project_id,
+                "synchronized": self.sync_started,
+                "entity_hashes": entity_hashes,
+                "avalon_hashes": avalon_hashes
+            },
+            upsert=True
+        )
+        return True
+
+    def filter_unchanged_entities(self):
+        """Skip update of entities which did not change since last sync.
+
+        In incremental mode are removed from entities to update entities
+        which did not change. Created and deleted entities are always
+        processed.
+
+        Must be called after 'prepare_avalon_entities' and before
+        'prepare_ftrack_ent_data'.
+        """
+        if self.changed_ftrack_ids is None:
+            return
+
+        update_ftrack_ids = [
+            ftrack_id
+            for ftrack_id in self.update_ftrack_ids
+            if ftrack_id in self.changed_ftrack_ids
+        ]
+        self.log.debug((
+            "Incremental synchronization: Updating <{}> of <{}>"
+            " existing entities"
+        ).format(len(update_ftrack_ids), len(self.update_ftrack_ids)))
+        self.update_ftrack_ids = update_ftrack_ids
+
     def filter_with_children(self, ftrack_id):
         if ftrack_id not in self.entities_dict:
             return
@@ -1,5 +1,6 @@
 import os
 import json
+import collections
 
 from .constants import CUST_ATTR_GROUP
 
@@ -145,3 +146,150 @@ def query_custom_attributes(
             ).all()
         )
     return output
+
+
+class CustomAttributeValuesFetcher(object):
+    """Fetch custom attribute values in chunks and cache them.
+
+    Values are queried in chunks of entity ids and multiple chunk queries
+    are sent to ftrack server in single call. Fetched values are cached by
+    configuration id so repeated requests for same attribute and entity
+    don't trigger new queries.
+
+    Cached values of entities must be cleared using 'clear' when the values
+    may have changed (e.g. on update event of the entity).
+
+    Args:
+        session (ftrack_api.Session): Connected ftrack session.
+        chunk_size (Optional[int]): Maximum number of values queried in one
+            query.
+        queries_per_call (Optional[int]): How many chunk queries are sent to
+            server in single call.
+    """
+
+    default_chunk_size = 5000
+    default_queries_per_call = 10
+
+    def __init__(self, session, chunk_size=None, queries_per_call=None):
+        self._session = session
+        self._chunk_size = chunk_size or self.default_chunk_size
+        self._queries_per_call = (
+            queries_per_call or self.default_queries_per_call
+        )
+        # Values cache by table name -> configuration id -> entity id
+        self._values_cache = collections.defaultdict(
+            lambda: collections.defaultdict(dict)
+        )
+        # Entity ids which were already queried for configuration id
+        self._fetched_ids = collections.defaultdict(
+            lambda: collections.defaultdict(set)
+        )
+
+    def clear(self, entity_ids=None):
+        """Clear cached values.
+
+        Args:
+            entity_ids (Optional[Iterable[str]]): Clear only values of
+                passed entities. All values are cleared if not passed.
+        """
+        if entity_ids is None:
+            self._values_cache.clear()
+            self._fetched_ids.clear()
+            return
+
+        entity_ids = set(entity_ids)
+        for values_by_conf_id in self._values_cache.values():
+            for values_by_entity_id in values_by_conf_id.values():
+                for entity_id in entity_ids:
+                    values_by_entity_id.pop(entity_id, None)
+
+        for fetched_by_conf_id in self._fetched_ids.values():
+            for fetched_ids in fetched_by_conf_id.values():
+                fetched_ids.difference_update(entity_ids)
+
+    def get_values(self, conf_ids, entity_ids, only_set_values=False):
+        """Get custom attribute values.
+
+        Output has same structure as output of 'query_custom_attributes'.
+
+        Args:
+            conf_ids (Iterable[str]): Configuration(attribute) ids.
+            entity_ids (Iterable[str]): Entity ids for which are values
+                queried.
+            only_set_values (bool): Entities that don't have explicitly set
+                value won't return a value. If is set to False then default
+                custom attribute value is returned if value is not set.
+
+        Returns:
+            list[dict[str, Any]]: Values with keys 'entity_id',
+                'configuration_id' and 'value'.
+        """
+        conf_ids = set(conf_ids)
+        entity_ids = set(entity_ids)
+        if not conf_ids or not entity_ids:
+            return []
+
+        if only_set_values:
+            table_name = "CustomAttributeValue"
+        else:
+            table_name = "ContextCustomAttributeValue"
+
+        self._fetch_missing(table_name, conf_ids, entity_ids)
+
+        output = []
+        values_by_conf_id = self._values_cache[table_name]
+        for conf_id in conf_ids:
+            values_by_entity_id = values_by_conf_id[conf_id]
+            for entity_id in entity_ids:
+                if entity_id in values_by_entity_id:
+                    output.append({
+                        "entity_id": entity_id,
+                        "configuration_id": conf_id,
+                        "value": values_by_entity_id[entity_id]
+                    })
+        return output
+
+    def _fetch_missing(self, table_name, conf_ids, entity_ids):
+        fetched_by_conf_id = self._fetched_ids[table_name]
+        missing_conf_ids = set()
+        missing_entity_ids = set()
+        for conf_id in conf_ids:
+            missing_ids = entity_ids - fetched_by_conf_id[conf_id]
+            if missing_ids:
+                missing_conf_ids.add(conf_id)
+                missing_entity_ids |= missing_ids
+
+        if not missing_entity_ids:
+            return
+
+        attributes_joined = join_query_keys(missing_conf_ids)
+        chunk_size = max(1, int(self._chunk_size / len(missing_conf_ids)))
+        entity_ids = list(missing_entity_ids)
+        operations = []
+        for idx in range(0, len(entity_ids), chunk_size):
+            operations.append({
+                "action": "query",
+                "expression": (
+                    "select value, entity_id, configuration_id from {}"
+                    " where entity_id in ({}) and configuration_id in ({})"
+                ).format(
+                    table_name,
+                    join_query_keys(entity_ids[idx:idx + chunk_size]),
+                    attributes_joined
+                )
+            })
+
+        values_by_conf_id = self._values_cache[table_name]
+        for idx in range(0, len(operations), self._queries_per_call):
+            results = self._session.call(
+                operations[idx:idx + self._queries_per_call]
+            )
+            for result in results:
+                for item in result["data"]:
+                    conf_id = item["configuration_id"]
+                    values_by_conf_id[conf_id][item["entity_id"]] = (
+                        item["value"]
+                    )
+
+        for conf_id in missing_conf_ids:
+            fetched_by_conf_id[conf_id] |= missing_entity_ids
@@ -5,3 +5,9 @@ def get_ftrack_event_mongo_info():
     database_name = os.environ["OPENPYPE_DATABASE_NAME"]
     collection_name = "ftrack_events"
     return database_name, collection_name
+
+
+def get_ftrack_sync_state_mongo_info():
+    database_name = os.environ["OPENPYPE_DATABASE_NAME"]
+    collection_name = "ftrack_sync_state"
+    return database_name, collection_name
@@ -0,0 +1,56 @@
+"""Timing middleware for webserver.
+
+These must not be imported in module itself to not break Python 2
+applications.
+"""
+
+import time
+
+from aiohttp import web
+
+
+def timing_middleware(log, slow_threshold=None):
+    """Measure duration of requests.
+
+    Duration is added to 'Server-Timing' header of response (if headers were
+    not sent yet) and logged. Requests slower than 'slow_threshold' are
+    logged as warning.
+
+    Websocket requests are not measured. Their handler returns when
+    connection is closed, so duration is lifetime of the connection.
+
+    Args:
+        log (logging.Logger): Logger used for output.
+        slow_threshold (Optional[float]): Duration in seconds from which is
+            request logged as warning.
+    """
+
+    @web.middleware
+    async def middleware(request, handler):
+        if request.headers.get("Upgrade", "").lower() == "websocket":
+            return await handler(request)
+
+        start = time.perf_counter()
+        try:
+            return_value = await handler(request)
+
+        finally:
+            duration = time.perf_counter() - start
+            msg = "{} {} took {:.3f}s".format(
+                request.method, request.path, duration
+            )
+            if slow_threshold is not None and duration >= slow_threshold:
+                log.warning(msg)
+            else:
+                log.debug(msg)
+
+        if (
+            isinstance(return_value, web.StreamResponse)
+            and not return_value.prepared
+        ):
+            return_value.headers["Server-Timing"] = "total;dur={:.1f}".format(
+                duration * 1000
+            )
+        return return_value
+
+    return middleware
@@ -6,11 +6,15 @@ from aiohttp import web
 
 from openpype.lib import Logger
 from .cors_middleware import cors_middleware
+from .middlewares import timing_middleware
 
 
 class WebServerManager:
     """Manger that care about web server thread."""
 
+    # Requests taking longer (in seconds) are logged as warning
+    slow_request_threshold = 5.0
+
     def __init__(self, port=None, host=None):
         self._log = None
 
@@ -23,6 +27,7 @@ class WebServerManager:
 
         self.app = web.Application(
             middlewares=[
+                timing_middleware(self.log, self.slow_request_threshold),
                 cors_middleware(
                     origins=[re.compile(r"^https?\:\/\/localhost")]
                 )
@@ -1,18 +1,27 @@
 import re
 import os
 import json
+import atexit
+import hashlib
 import contextlib
 import functools
 import platform
 import tempfile
+import threading
+import subprocess
 import warnings
 from copy import deepcopy
 
-from openpype import PACKAGE_DIR
+import appdirs
+
+from openpype import PACKAGE_DIR, AYON_SERVER_ENABLED
 from openpype.settings import get_project_settings
 from openpype.lib import (
     StringTemplate,
     run_openpype_process,
+    get_openpype_execute_args,
+    clean_envs_for_openpype_process,
+    is_running_from_build,
     Logger
 )
 from openpype.pipeline import Anatomy
@@ -143,6 +152,43 @@ def get_colorspace_name_from_filepath(
     Returns:
         str: name of colorspace
     """
+    return get_colorspace_names_from_filepaths(
+        [filepath], host_name, project_name,
+        config_data=config_data,
+        file_rules=file_rules,
+        project_settings=project_settings,
+        validate=validate
+    )[filepath]
+
+
+def get_colorspace_names_from_filepaths(
+    filepaths, host_name, project_name,
+    config_data=None, file_rules=None,
+    project_settings=None,
+    validate=True
+):
+    """Get colorspace names for multiple filepaths.
+
+    Same as 'get_colorspace_name_from_filepath' but settings are resolved
+    and matching rules are compiled only once for all filepaths.
+
+    Args:
+        filepaths (Iterable[str]): path strings, file rule pattern is
+            tested on them
+        host_name (str): host name
+        project_name (str): project name
+        config_data (Optional[dict]): config path and template in dict.
+                                      Defaults to None.
+        file_rules (Optional[dict]): file rule data from settings.
+                                     Defaults to None.
+        project_settings (Optional[dict]): project settings. Defaults to None.
+        validate (Optional[bool]): should resulting colorspaces be validated
+                                with config file? Defaults to True.
+
+    Returns:
+        dict[str, Union[str, None]]: Colorspace name by filepath.
+    """
+    filepaths = list(filepaths)
     project_settings, config_data, file_rules = _get_context_settings(
         host_name, project_name,
         config_data=config_data, file_rules=file_rules,
@@ -151,40 +197,48 @@ def get_colorspace_name_from_filepath(
 
     if not config_data:
         # in case global or host color management is not enabled
-        return None
+        return {filepath: None for filepath in filepaths}
+
+    config_path = config_data["path"]
+    matcher = get_colorspace_matcher(config_path, file_rules)
+    use_config_file_rules = None
+    output = {}
+    for filepath in filepaths:
+        if filepath in output:
+            continue
 
-    # use ImageIO file rules
-    colorspace_name = get_imageio_file_rules_colorspace_from_filepath(
-        filepath, host_name, project_name,
-        config_data=config_data, file_rules=file_rules,
-        project_settings=project_settings
-    )
+        # use ImageIO file rules
+        colorspace_name = matcher.match_file_rules(filepath)
+
+        # try to get colorspace from OCIO v2 file rules
+        if not colorspace_name:
+            if use_config_file_rules is None:
+                use_config_file_rules = compatibility_check_config_version(
+                    config_path, major=2)
+            if use_config_file_rules:
+                colorspace_name = (
+                    get_config_file_rules_colorspace_from_filepath(
+                        config_path, filepath)
+                )
 
-    # try to get colorspace from OCIO v2 file rules
-    if (
-        not colorspace_name
-        and compatibility_check_config_version(config_data["path"], major=2)
-    ):
-        colorspace_name = get_config_file_rules_colorspace_from_filepath(
-            config_data["path"], filepath)
-
-    # use parse colorspace from filepath as fallback
-    colorspace_name = colorspace_name or parse_colorspace_from_filepath(
-        filepath, config_path=config_data["path"]
-    )
+        # use parse colorspace from filepath as fallback
+        colorspace_name = colorspace_name or matcher.parse_colorspace(
+            filepath)
 
-    if not colorspace_name:
-        log.info("No imageio file rule matched input path: '{}'".format(
-            filepath
-        ))
-        return None
+        if not colorspace_name:
+            log.info("No imageio file rule matched input path: '{}'".format(
+                filepath
+            ))
+        output[filepath] = colorspace_name or None
 
-    # validate matching colorspace with config
+    # validate matching colorspaces with config
     if validate:
-        validate_imageio_colorspace_in_config(
-            config_data["path"], colorspace_name)
+        for colorspace_name in set(output.values()):
+            if colorspace_name:
+                validate_imageio_colorspace_in_config(
+                    config_path, colorspace_name)
 
-    return colorspace_name
+    return output
 
 
 # TODO: remove this in future - backward compatibility
@@ -253,21 +307,8 @@ def get_imageio_file_rules_colorspace_from_filepath(
         return None
 
     # match file rule from path
-    colorspace_name = None
-    for file_rule in file_rules.values():
-        pattern = file_rule["pattern"]
-        extension = file_rule["ext"]
-        ext_match = re.match(
-            r".*(?=.{})".format(extension), filepath
-        )
-        file_match = re.search(
-            pattern, filepath
-        )
-
-        if ext_match and file_match:
-            colorspace_name = file_rule["colorspace"]
-
-    return colorspace_name
+    matcher = get_colorspace_matcher(config_data["path"], file_rules)
+    return matcher.match_file_rules(filepath)
 
 
 def get_config_file_rules_colorspace_from_filepath(config_path, filepath):
@@ -330,27 +371,6 @@ def parse_colorspace_from_filepath(
     Returns:
         str: name of colorspace
     """
-    def _get_colorspace_match_regex(colorspaces):
-        """Return a regex pattern
-
-        Allows to search a colorspace match in a filename
-
-        Args:
-            colorspaces (list): List of colorspace names
-
-        Returns:
-            re.Pattern: regex pattern
-        """
-        pattern = "|".join(
-            # Allow to match spaces also as underscores because the
-            # integrator replaces spaces with underscores in filenames
-            re.escape(colorspace) for colorspace in
-            # Sort by longest first so the regex matches longer matches
-            # over smaller matches, e.g. matching 'Output - sRGB' over 'sRGB'
-            sorted(colorspaces, key=len, reverse=True)
-        )
-        return re.compile(pattern)
-
     if not colorspaces and not config_path:
         raise ValueError(
             "Must provide `config_path` if `colorspaces` is not provided."
@@ -360,14 +380,11 @@ def parse_colorspace_from_filepath(
         colorspaces
         or get_ocio_config_colorspaces(config_path)["colorspaces"]
     )
-    underscored_colorspaces = {
-        key.replace(" ", "_"): key for key in colorspaces
-        if " " in key
-    }
+    regex_pattern, underscored_colorspaces = (
+        _colorspace_match_regex_cache.get(colorspaces)
+    )
 
     # match colorspace from  filepath
-    regex_pattern = _get_colorspace_match_regex(
-        list(colorspaces) + list(underscored_colorspaces))
     match = regex_pattern.search(filepath)
     colorspace = match.group(0) if match else None
 
@@ -383,6 +400,242 @@ def parse_colorspace_from_filepath(
     return None
 
 
+class _ColorspaceMatchRegexCache(object):
+    """Compiled regexes matching colorspace names in filepaths.
+
+    Regex is compiled only once per set of colorspace names.
+    """
+
+    max_items = 16
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items = {}
+
+    @staticmethod
+    def _compile(colorspaces):
+        underscored_colorspaces = {
+            key.replace(" ", "_"): key for key in colorspaces
+            if " " in key
+        }
+        pattern = "|".join(
+            # Allow to match spaces also as underscores because the
+            # integrator replaces spaces with underscores in filenames
+            re.escape(colorspace) for colorspace in
+            # Sort by longest first so the regex matches longer matches
+            # over smaller matches, e.g. matching 'Output - sRGB' over 'sRGB'
+            sorted(
+                list(colorspaces) + list(underscored_colorspaces),
+                key=len, reverse=True
+            )
+        )
+        return re.compile(pattern), underscored_colorspaces
+
+    def get(self, colorspaces):
+        """Get compiled regex and mapping of underscored colorspace names.
+
+        Args:
+            colorspaces (Iterable[str]): Colorspace names.
+
+        Returns:
+            tuple[re.Pattern, dict[str, str]]: Regex matching any of the
+                colorspace names and mapping of underscored names to
+                original names.
+        """
+        key = tuple(colorspaces)
+        with self._lock:
+            item = self._items.get(key)
+        if item is not None:
+            return item
+
+        item = self._compile(key)
+        with self._lock:
+            if len(self._items) >= self.max_items:
+                self._items.clear()
+            self._items[key] = item
+        return item
+
+
+_colorspace_match_regex_cache = _ColorspaceMatchRegexCache()
+
+
+class ColorspaceMatcher(object):
+    """Match colorspace names to filepaths with precompiled rules.
+
+    ImageIO file rules from settings and colorspace names from config are
+    compiled only once, so the matcher can be used for many filepaths
+    without rebuilding regexes. Use 'get_colorspace_matcher' to get a cached
+    matcher for config and file rules.
+
+    Args:
+        config_path (Optional[str]): Path to config.ocio file. Used to get
+            colorspace names if 'colorspaces' are not passed.
+        file_rules (Optional[dict[str, dict]]): File rules from settings.
+        colorspaces (Optional[Iterable[str]]): Colorspace names used for
+            parsing of colorspace from filepath.
+    """
+
+    def __init__(self, config_path=None, file_rules=None, colorspaces=None):
+        self._config_path = config_path
+        self._colorspaces = colorspaces
+        self._colorspace_regex = None
+        self._underscored_colorspaces = None
+        # Rules are stored in reversed order so the first matching rule is
+        #   the last matching rule from settings
+        self._file_rules = [
+            (
+                re.compile(r".*(?=.{})".format(file_rule["ext"])),
+                re.compile(file_rule["pattern"]),
+                file_rule["colorspace"]
+            )
+            for file_rule in reversed(list((file_rules or {}).values()))
+        ]
+
+    def match_file_rules(self, filepath):
+        """Get colorspace name from ImageIO file rules.
+
+        Args:
+            filepath (str): Path string, file rule pattern is tested on it.
+
+        Returns:
+            Union[str, None]: Name of colorspace of last matching rule.
+        """
+        for ext_regex, pattern_regex, colorspace_name in self._file_rules:
+            if ext_regex.match(filepath) and pattern_regex.search(filepath):
+                return colorspace_name
+        return None
+
+    def parse_colorspace(self, filepath):
+        """Parse colorspace name from filepath.
+
+        Same logic as 'parse_colorspace_from_filepath'.
+
+        Args:
+            filepath (str): Path string.
+
+        Returns:
+            Union[str, None]: Name of colorspace.
+        """
+        if self._colorspace_regex is None:
+            colorspaces = self._colorspaces
+            if not colorspaces:
+                if not self._config_path:
+                    raise ValueError((
+                        "Must provide `config_path` if `colorspaces`"
+                        " is not provided."
+                    ))
+                colorspaces = get_ocio_config_colorspaces(
+                    self._config_path)["colorspaces"]
+            self._colorspace_regex, self._underscored_colorspaces = (
+                _colorspace_match_regex_cache.get(colorspaces)
+            )
+
+        match = self._colorspace_regex.search(filepath)
+        colorspace = match.group(0) if match else None
+        if colorspace in self._underscored_colorspaces:
+            return self._underscored_colorspaces[colorspace]
+
+        if colorspace:
+            return colorspace
+
+        log.info(
+            "No matching colorspace in config '{}' for path: '{}'".format(
+                self._config_path, filepath
+            )
+        )
+        return None
+
+    def match_file_rules_batch(self, filepaths):
+        """Get colorspace names from ImageIO file rules for filepaths.
+
+        Args:
+            filepaths (Iterable[str]): Path strings.
+
+        Returns:
+            dict[str, Union[str, None]]: Colorspace name by filepath.
+        """
+        return {
+            filepath: self.match_file_rules(filepath)
+            for filepath in filepaths
+        }
+
+    def parse_colorspace_batch(self, filepaths):
+        """Parse colorspace names from filepaths.
+
+        Args:
+            filepaths (Iterable[str]): Path strings.
+
+        Returns:
+            dict[str, Union[str, None]]: Colorspace name by filepath.
+        """
+        return {
+            filepath: self.parse_colorspace(filepath)
+            for filepath in filepaths
+        }
+
+
+class _ColorspaceMatchersCache(object):
+    max_items = 16
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items = {}
+        self._config_mtimes = {}
+
+    @staticmethod
+    def _get_config_mtime(config_path):
+        if not config_path:
+            return None
+        try:
+            return os.path.getmtime(config_path)
+        except OSError:
+            return None
+
+    def get(self, config_path, file_rules):
+        # Modification time is part of the key so config changed in place
+        #   is parsed again
+        config_mtime = self._get_config_mtime(config_path)
+        key = (
+            config_path,
+            config_mtime,
+            json.dumps(file_rules or {}, sort_keys=True, default=str)
+        )
+        with self._lock:
+            matcher = self._items.get(key)
+        if matcher is not None:
+            return matcher
+
+        with self._lock:
+            last_mtime = self._config_mtimes.get(config_path, config_mtime)
+            self._config_mtimes[config_path] = config_mtime
+        if last_mtime != config_mtime:
+            # Colorspaces of config are cached by path
+            CachedData.ocio_config_colorspaces.pop(config_path, None)
+
+        matcher = ColorspaceMatcher(config_path, file_rules)
+        with self._lock:
+            if len(self._items) >= self.max_items:
+                self._items.clear()
+            self._items[key] = matcher
+        return matcher
+
+
+_colorspace_matchers_cache = _ColorspaceMatchersCache()
+
+
+def get_colorspace_matcher(config_path, file_rules=None):
+    """Get cached colorspace matcher for config and file rules.
+
+    Args:
+        config_path (str): Path to config.ocio file.
+        file_rules (Optional[dict[str, dict]]): File rules from settings.
+
+    Returns:
+        ColorspaceMatcher: Matcher with compiled file rules.
+    """
+    return _colorspace_matchers_cache.get(config_path, file_rules)
+
+
 def validate_imageio_colorspace_in_config(config_path, colorspace_name):
     """Validator making sure colorspace name is used in config.ocio
 
@@ -420,10 +673,293 @@ def get_data_subprocess(config_path, data_type):
     )
 
 
+# Must match 'WORKER_RESPONSE_PREFIX' in 'ocio_wrapper.py'
+OCIO_WORKER_RESPONSE_PREFIX = "OCIO_WORKER_RESPONSE:"
+
+
+class _OCIOWorker(object):
+    """Long-lived process answering OCIO queries.
+
+    Process running 'ocio_wrapper.py serve' is started on first query and
+    reused for all queries in current session. Requests and responses are
+    JSON lines on stdin/stdout of the process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._process = None
+        self._request_id = 0
+        self._atexit_registered = False
+
+    def _read_response(self, request_id):
+        while True:
+            line = self._process.stdout.readline()
+            if not line:
+                self._process = None
+                raise RuntimeError("OCIO worker process ended unexpectedly.")
+
+            # Ignore output of process boot
+            if not line.startswith(OCIO_WORKER_RESPONSE_PREFIX):
+                continue
+
+            response = json.loads(line[len(OCIO_WORKER_RESPONSE_PREFIX):])
+            if response.get("id") == request_id:
+                return response
+
+    def _start(self):
+        args = get_openpype_execute_args(
+            "run", get_ocio_config_script_path(), "serve"
+        )
+        env = clean_envs_for_openpype_process(os.environ)
+        # Only keep OpenPype version if we are running from build.
+        if not is_running_from_build():
+            env.pop("OPENPYPE_VERSION", None)
+
+        kwargs = {}
+        if platform.system().lower() == "windows":
+            # CREATE_NO_WINDOW
+            kwargs["creationflags"] = 0x08000000
+
+        log.info("Starting OCIO worker: {}".format(" ".join(args)))
+        self._process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+            universal_newlines=True,
+            **kwargs
+        )
+        if not self._atexit_registered:
+            atexit.register(self.stop)
+            self._atexit_registered = True
+
+        # Wait until worker is ready
+        self._read_response(None)
+
+    def call(self, command_group, command, **kwargs):
+        """Process command in worker.
+
+        Args:
+            command_group (str): command group name
+            command (str): command name
+            **kwargs: command arguments
+
+        Returns:
+            Any: Result of command.
+
+        Raises:
+            RuntimeError: Command failed or worker process ended.
+        """
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._start()
+
+            self._request_id += 1
+            request_id = self._request_id
+            request = {
+                "id": request_id,
+                "group": command_group,
+                "command": command,
+                "kwargs": kwargs,
+            }
+            try:
+                self._process.stdin.write(json.dumps(request) + "\n")
+                self._process.stdin.flush()
+            except (IOError, OSError, ValueError):
+                self._process = None
+                raise RuntimeError("OCIO worker process ended unexpectedly.")
+
+            response = self._read_response(request_id)
+
+        if "error" in response:
+            raise RuntimeError(
+                "OCIO worker command {} {} failed:\n{}".format(
+                    command_group, command, response["error"]
+                )
+            )
+        return response["result"]
+
+    def stop(self):
+        """Stop worker process."""
+        with self._lock:
+            process = self._process
+            self._process = None
+
+        if process is None or process.poll() is not None:
+            return
+
+        # Worker ends when stdin is closed
+        try:
+            process.stdin.close()
+        except (IOError, OSError):
+            pass
+        process.terminate()
+
+
+_ocio_worker = _OCIOWorker()
+
+
+class _OCIOQueryCache(object):
+    """On-disk cache of OCIO config queries.
+
+    Results are stored by hash of config file content so cache is shared
+    across sessions and config changes invalidate it. Queries which depend
+    on a file path (file rules) are not cached as they would grow the cache
+    without limits.
+    """
+
+    cacheable_commands = {
+        ("config", "get_colorspace"),
+        ("config", "get_views"),
+        ("config", "get_version"),
+        ("config", "get_display_view_colorspace_name"),
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hash_by_path = {}
+        self._data_by_hash = {}
+
+    @staticmethod
+    def _get_cache_dir():
+        if AYON_SERVER_ENABLED:
+            root = appdirs.user_data_dir("AYON", "Ynput")
+        else:
+            root = appdirs.user_data_dir("openpype", "pypeclub")
+        return os.path.join(root, "ocio_query_cache")
+
+    def _get_config_hash(self, config_path):
+        stat = os.stat(config_path)
+        stat_key = (stat.st_mtime, stat.st_size)
+        cached = self._hash_by_path.get(config_path)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+
+        hasher = hashlib.sha256()
+        with open(config_path, "rb") as stream:
+            for chunk in iter(lambda: stream.read(65536), b""):
+                hasher.update(chunk)
+        config_hash = hasher.hexdigest()
+        self._hash_by_path[config_path] = (stat_key, config_hash)
+        return config_hash
+
+    def _get_cache_path(self, config_hash):
+        return os.path.join(
+            self._get_cache_dir(), "{}.json".format(config_hash)
+        )
+
+    def _get_data(self, config_hash):
+        data = self._data_by_hash.get(config_hash)
+        if data is not None:
+            return data
+
+        data = {}
+        cache_path = self._get_cache_path(config_hash)
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, "r") as stream:
+                    data = json.load(stream)
+            except ValueError:
+                data = {}
+        self._data_by_hash[config_hash] = data
+        return data
+
+    def _store_data(self, config_hash, data):
+        cache_path = self._get_cache_path(config_hash)
+        cache_dir = os.path.dirname(cache_path)
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+        tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+        with open(tmp_path, "w") as stream:
+            json.dump(data, stream)
+        # 'os.replace' is not available in Python 2
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+        os.rename(tmp_path, cache_path)
+
+    def get_or_query(self, command_group, command, query_func, **kwargs):
+        """Return cached result of command or query it and cache it.
+
+        Args:
+            command_group (str): command group name
+            command (str): command name
+            query_func (Callable[[], Any]): Function which queries result.
+            **kwargs: command arguments
+
+        Returns:
+            Any: Result of command.
+        """
+        config_path = kwargs.get("in_path") or kwargs.get("config_path")
+        if (
+            (command_group, command) not in self.cacheable_commands
+            or not config_path
+            or not os.path.isfile(config_path)
+        ):
+            return query_func()
+
+        query_key = json.dumps([
+            command_group,
+            command,
+            sorted(
+                (key, value)
+                for key, value in kwargs.items()
+                if key not in ("in_path", "config_path")
+            )
+        ])
+        with self._lock:
+            config_hash = self._get_config_hash(config_path)
+            data = self._get_data(config_hash)
+            if query_key in data:
+                return deepcopy(data[query_key])
+
+        result = query_func()
+        with self._lock:
+            data[query_key] = result
+            try:
+                self._store_data(config_hash, data)
+            except (IOError, OSError):
+                log.debug("Failed to store OCIO query cache.", exc_info=True)
+        return deepcopy(result)
+
+
+_ocio_query_cache = _OCIOQueryCache()
+
+
 def _get_wrapped_with_subprocess(command_group, command, **kwargs):
     """Get data via subprocess
 
-    Wrapper for Python 2 hosts.
+    Wrapper for Python 2 hosts. Commands are processed by long-lived OCIO
+    worker process and results of config queries are cached on disk by
+    config file hash. A new process is launched for the command if worker
+    can't be used.
+
+    Args:
+        command_group (str): command group name
+        command (str): command name
+        **kwargs: command arguments
+
+    Returns:
+        Any[dict, None]: data
+    """
+
+    def _query():
+        try:
+            return _ocio_worker.call(command_group, command, **kwargs)
+        except RuntimeError:
+            log.warning(
+                "OCIO worker failed, running command in new process.",
+                exc_info=True
+            )
+        return _run_wrapped_subprocess(command_group, command, **kwargs)
+
+    return _ocio_query_cache.get_or_query(
+        command_group, command, _query, **kwargs
+    )
+
+
+def _run_wrapped_subprocess(command_group, command, **kwargs):
+    """Get data via new OpenPype process for single command.
 
     Args:
         command_group (str): command group name
@@ -1125,12 +1661,16 @@ def set_colorspace_data_to_representation(
         filename = filename[0]
 
     # get matching colorspace from rules
-    colorspace = colorspace or get_imageio_colorspace_from_filepath(
-        filename, host_name, project_name,
-        config_data=config_data,
-        file_rules=file_rules,
-        project_settings=project_settings
-    )
+    if not colorspace:
+        _, config_data, file_rules = _get_context_settings(
+            host_name, project_name,
+            config_data=config_data,
+            file_rules=file_rules,
+            project_settings=project_settings
+        )
+        if config_data:
+            matcher = get_colorspace_matcher(config_data["path"], file_rules)
+            colorspace = matcher.match_file_rules(filename)
 
     # infuse data to representation
     if colorspace:
@@ -1179,20 +1719,9 @@ def get_display_view_colorspace_subprocess(config_path, display, view):
         view color space name (str) e.g. "Output - sRGB"
     """
 
-    with _make_temp_json_file() as tmp_json_path:
-        # Prepare subprocess arguments
-        args = [
-            "run", get_ocio_config_script_path(),
-            "config", "get_display_view_colorspace_name",
-            "--in_path", config_path,
-            "--out_path", tmp_json_path,
-            "--display", display,
-            "--view", view
-        ]
-        log.debug("Executing: {}".format(" ".join(args)))
-
-        run_openpype_process(*args, logger=log)
-
-        # return default view colorspace name
-        with open(tmp_json_path, "r") as f:
-            return json.load(f)
+    return _get_wrapped_with_subprocess(
+        "config", "get_display_view_colorspace_name",
+        in_path=config_path,
+        display=display,
+        view=view
+    )
@@ -22,6 +22,7 @@ from openpype.client import (
     get_ayon_server_api_connection,
 )
 from openpype.lib.events import emit_event
+from openpype.startup_trace import trace_phase, write_startup_trace
 from openpype.modules import load_modules, ModulesManager
 from openpype.settings import get_project_settings
 from openpype.tests.lib import is_in_tests
@@ -117,10 +118,13 @@ def install_host(host):
 
     # Make sure global AYON connection has set site id and version
     if AYON_SERVER_ENABLED:
-        get_ayon_server_api_connection()
+        with trace_phase("AYON connection"):
+            get_ayon_server_api_connection()
 
-    legacy_io.install()
-    modules_manager = _get_modules_manager()
+    with trace_phase("legacy_io install"):
+        legacy_io.install()
+    with trace_phase("modules manager"):
+        modules_manager = _get_modules_manager()
 
     missing = list()
     for key in ("AVALON_PROJECT", "AVALON_ASSET"):
@@ -138,7 +142,8 @@ def install_host(host):
 
     # Optional host install function
     if hasattr(host, "install"):
-        host.install()
+        with trace_phase("host install"):
+            host.install()
 
     register_host(host)
 
@@ -166,9 +171,13 @@ def install_host(host):
 
     # Give option to handle host installation
     for module in modules_manager.get_enabled_modules():
-        module.on_host_install(host, host_name, project_name)
+        with trace_phase("on_host_install", addon=module.name):
+            module.on_host_install(host, host_name, project_name)
+
+    with trace_phase("install openpype plugins"):
+        install_openpype_plugins(project_name, host_name)
 
-    install_openpype_plugins(project_name, host_name)
+    write_startup_trace()
 
 
 def install_openpype_plugins(project_name=None, host_name=None):
@@ -185,23 +194,28 @@ def install_openpype_plugins(project_name=None, host_name=None):
         host_name = os.environ.get("AVALON_APP")
 
     modules_manager = _get_modules_manager()
-    publish_plugin_dirs = modules_manager.collect_publish_plugin_paths(
-        host_name)
+    with trace_phase("collect publish plugin paths"):
+        publish_plugin_dirs = modules_manager.collect_publish_plugin_paths(
+            host_name)
     for path in publish_plugin_dirs:
         pyblish.api.register_plugin_path(path)
 
-    create_plugin_paths = modules_manager.collect_create_plugin_paths(
-        host_name)
+    with trace_phase("collect create plugin paths"):
+        create_plugin_paths = modules_manager.collect_create_plugin_paths(
+            host_name)
     for path in create_plugin_paths:
         register_creator_plugin_path(path)
 
-    load_plugin_paths = modules_manager.collect_load_plugin_paths(
-        host_name)
+    with trace_phase("collect load plugin paths"):
+        load_plugin_paths = modules_manager.collect_load_plugin_paths(
+            host_name)
     for path in load_plugin_paths:
         register_loader_plugin_path(path)
 
-    inventory_action_paths = modules_manager.collect_inventory_action_paths(
-        host_name)
+    with trace_phase("collect inventory action paths"):
+        inventory_action_paths = (
+            modules_manager.collect_inventory_action_paths(host_name)
+        )
     for path in inventory_action_paths:
         register_inventory_action_path(path)
 
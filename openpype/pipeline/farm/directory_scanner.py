@@ -0,0 +1,134 @@
+"""Cached directory listings of rendered output.
+
+Rendered output is usually on network storage where every 'os.listdir',
+'os.path.exists' or 'os.stat' call is a round trip to the server. Scanner
+lists each directory only once with 'os.scandir', multiple directories are
+scanned in parallel and listings are reused for the rest of the publish.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+class DirectoryScanner(object):
+    """Scan directories using 'os.scandir' and cache their listings.
+
+    Listings are cached for whole life of scanner, so scanner should be
+    used only for output which is not changing during its usage.
+
+    Args:
+        max_workers (Optional[int]): Maximum of directories scanned in
+            parallel.
+    """
+
+    def __init__(self, max_workers=None):
+        if not max_workers:
+            # Scanning is waiting on IO so more workers than cpus make sense
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        self._max_workers = max_workers
+        self._listings = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize_path(path):
+        return os.path.normpath(path)
+
+    @staticmethod
+    def _scan_dir(dirpath):
+        try:
+            with os.scandir(dirpath) as entries:
+                return frozenset(entry.name for entry in entries)
+        except (FileNotFoundError, NotADirectoryError):
+            return frozenset()
+
+    def _get_cached_listing(self, dirpath):
+        with self._lock:
+            return self._listings.get(dirpath)
+
+    def _set_cached_listing(self, dirpath, listing):
+        with self._lock:
+            self._listings[dirpath] = listing
+
+    def get_file_names(self, dirpath):
+        """Names of files (and subdirectories) in directory.
+
+        Args:
+            dirpath (str): Path to directory.
+
+        Returns:
+            frozenset[str]: Names of entries in directory. Empty if
+                directory does not exist.
+
+        Raises:
+            OSError: Directory could not be listed.
+        """
+
+        dirpath = self._normalize_path(dirpath)
+        listing = self._get_cached_listing(dirpath)
+        if listing is None:
+            listing = self._scan_dir(dirpath)
+            self._set_cached_listing(dirpath, listing)
+        return listing
+
+    def scan(self, dirpaths):
+        """Scan directories in parallel and cache their listings.
+
+        Directories which could not be listed (e.g. because of permissions)
+        are not cached and are skipped in output. The error is raised by
+        'get_file_names' of the directory, so it is reported by the plugin
+        which uses the listing.
+
+        Args:
+            dirpaths (Iterable[str]): Paths to directories.
+
+        Returns:
+            dict[str, frozenset[str]]: Names of entries by normalized
+                directory path.
+        """
+
+        output = {}
+        dirpaths_to_scan = set()
+        for dirpath in dirpaths:
+            dirpath = self._normalize_path(dirpath)
+            listing = self._get_cached_listing(dirpath)
+            if listing is not None:
+                output[dirpath] = listing
+            else:
+                dirpaths_to_scan.add(dirpath)
+
+        if not dirpaths_to_scan:
+            return output
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = {
+                executor.submit(self._scan_dir, dirpath): dirpath
+                for dirpath in dirpaths_to_scan
+            }
+            for future in as_completed(futures):
+                dirpath = futures[future]
+                try:
+                    listing = future.result()
+                except OSError:
+                    continue
+                self._set_cached_listing(dirpath, listing)
+                output[dirpath] = listing
+
+        return output
+
+
+def get_directory_scanner(context):
+    """Directory scanner shared during publishing of context.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+
+    Returns:
+        DirectoryScanner: Scanner stored in context data.
+    """
+
+    scanner = context.data.get("farmDirectoryScanner")
+    if scanner is None:
+        scanner = DirectoryScanner()
+        context.data["farmDirectoryScanner"] = scanner
+    return scanner
@@ -2,7 +2,6 @@ import copy
 import attr
 import pyblish.api
 import os
-import clique
 from copy import deepcopy
 import re
 import warnings
@@ -16,7 +15,7 @@ from openpype.client import (
     get_last_version_by_subset_name,
     get_representations
 )
-from openpype.lib import Logger
+from openpype.lib import Logger, assemble_frame_sequences_compat
 from openpype.pipeline.publish import KnownPublishError
 from openpype.pipeline.farm.patterning import match_aov_pattern
 
@@ -322,13 +321,14 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
     """
     representations = []
     host_name = os.environ.get("AVALON_APP", "")
-    collections, remainders = clique.assemble(exp_files)
+    sequences, remainders = assemble_frame_sequences_compat(exp_files)
 
     log = Logger.get_logger("farm_publishing")
 
     # create representation for every collected sequence
-    for collection in collections:
-        ext = collection.tail.lstrip(".")
+    for sequence in sequences:
+        ext = sequence.tail.lstrip(".")
+        first_filepath = sequence.get_path(sequence.frame_start)
         preview = False
         # TODO 'useSequenceForReview' is temporary solution which does
         #   not work for 100% of cases. We must be able to tell what
@@ -343,14 +343,13 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
                 )
                 preview = True
             else:
-                render_file_name = list(collection)[0]
                 # if filtered aov name is found in filename, toggle it for
                 # preview video rendering
                 preview = match_aov_pattern(
-                    host_name, aov_filter, render_file_name
+                    host_name, aov_filter, first_filepath
                 )
 
-        staging = os.path.dirname(list(collection)[0])
+        staging = os.path.dirname(first_filepath)
         success, rootless_staging_dir = (
             anatomy.find_root_template_from_path(staging)
         )
@@ -371,7 +370,7 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
         rep = {
             "name": ext,
             "ext": ext,
-            "files": [os.path.basename(f) for f in list(collection)],
+            "files": [os.path.basename(f) for f in sequence],
             "frameStart": frame_start,
             "frameEnd": int(skeleton_data.get("frameEndHandle")),
             # If expectedFile are absolute, we need only filenames
@@ -552,7 +551,7 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
     instances = []
     # go through AOVs in expected files
     for aov, files in exp_files[0].items():
-        cols, rem = clique.assemble(files)
+        cols, rem = assemble_frame_sequences_compat(files)
         # we shouldn't have any reminders. And if we do, it should
         # be just one item for single frame renders.
         if not cols and rem:
@@ -568,7 +567,7 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
             if len(cols) != 1:
                 raise ValueError("Only one image sequence type is expected.")  # noqa: E501
             ext = cols[0].tail.lstrip(".")
-            col = list(cols[0])
+            col = list(cols[0].paths())
 
         # create subset name `familyTaskSubset_AOV`
         # TODO refactor/remove me
@@ -870,15 +869,15 @@ def prepare_cache_representations(skeleton_data, exp_files, anatomy):
 
     """
     representations = []
-    collections, remainders = clique.assemble(exp_files)
+    sequences, remainders = assemble_frame_sequences_compat(exp_files)
 
     log = Logger.get_logger("farm_publishing")
 
     # create representation for every collected sequence
-    for collection in collections:
-        ext = collection.tail.lstrip(".")
+    for sequence in sequences:
+        ext = sequence.tail.lstrip(".")
 
-        staging = os.path.dirname(list(collection)[0])
+        staging = os.path.dirname(sequence.get_path(sequence.frame_start))
         success, rootless_staging_dir = (
             anatomy.find_root_template_from_path(staging)
         )
@@ -894,7 +893,7 @@ def prepare_cache_representations(skeleton_data, exp_files, anatomy):
         rep = {
             "name": ext,
             "ext": ext,
-            "files": [os.path.basename(f) for f in list(collection)],
+            "files": [os.path.basename(f) for f in sequence],
             "frameStart": frame_start,
             "frameEnd": int(skeleton_data.get("frameEndHandle")),
             # If expectedFile are absolute, we need only filenames
@@ -935,7 +934,7 @@ def create_instances_for_cache(instance, skeleton):
     instances = []
     # go through AOVs in expected files
     for _, files in exp_files[0].items():
-        cols, rem = clique.assemble(files)
+        cols, rem = assemble_frame_sequences_compat(files)
         # we shouldn't have any reminders. And if we do, it should
         # be just one item for single frame renders.
         if not cols and rem:
@@ -951,7 +950,7 @@ def create_instances_for_cache(instance, skeleton):
             if len(cols) != 1:
                 raise ValueError("Only one image sequence type is expected.")  # noqa: E501
             ext = cols[0].tail.lstrip(".")
-            col = list(cols[0])
+            col = list(cols[0].paths())
 
         if isinstance(col, (list, tuple)):
             staging = os.path.dirname(col[0])
@@ -1035,15 +1034,16 @@ def copy_extend_frames(instance, representation):
     subset_resources = get_resources(
         project_name, version, representation.get("ext")
     )
-    r_col, _ = clique.assemble(subset_resources)
+    r_sequences, _ = assemble_frame_sequences_compat(subset_resources)
+    if not r_sequences:
+        log.warning("No published frames were found to copy.")
+        return
+    r_sequence = r_sequences[0]
 
     # if override remove all frames we are expecting to be rendered,
     # so we'll copy only those missing from current render
     if instance.data.get("overrideExistingFrame"):
-        for frame in range(start, end + 1):
-            if frame not in r_col.indexes:
-                continue
-            r_col.indexes.remove(frame)
+        r_sequence = r_sequence.difference(range(start, end + 1))
 
     # now we need to translate published names from representation
     # back. This is tricky, right now we'll just use same naming
@@ -1052,20 +1052,16 @@ def copy_extend_frames(instance, representation):
     r_filename = os.path.basename(
         representation.get("files")[0])  # first file
     op = re.search(R_FRAME_NUMBER, r_filename)
+    assert op is not None, "padding string wasn't found"
     pre = r_filename[:op.start("frame")]
     post = r_filename[op.end("frame"):]
-    assert op is not None, "padding string wasn't found"
-    for frame in list(r_col):
-        fn = re.search(R_FRAME_NUMBER, frame)
-        # silencing linter as we need to compare to True, not to
-        # type
-        assert fn is not None, "padding string wasn't found"
+    staging = anatomy.fill_root(representation.get("stagingDir"))
+    for frame in r_sequence.frames():
         # list of tuples (source, destination)
-        staging = representation.get("stagingDir")
-        staging = anatomy.fill_root(staging)
         resource_files.append(
-            (frame, os.path.join(
-                staging, "{}{}{}".format(pre, fn["frame"], post)))
+            (r_sequence.get_path(frame), os.path.join(
+                staging, "{}{}{}".format(
+                    pre, r_sequence.format_frame(frame), post)))
         )
 
     # test if destination dir exists and create it if not
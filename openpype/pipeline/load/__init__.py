@@ -19,7 +19,9 @@ from .utils import (
     load_container,
     remove_container,
     update_container,
+    update_containers,
     switch_container,
+    switch_containers,
 
     get_loader_identifier,
     get_loaders_by_name,
@@ -36,7 +38,9 @@ from .utils import (
 
     any_outdated_containers,
     get_outdated_containers,
+    get_outdated_containers_in_background,
     filter_containers,
+    clear_containers_status_cache,
 )
 
 from .plugins import (
@@ -73,7 +77,9 @@ __all__ = (
     "load_container",
     "remove_container",
     "update_container",
+    "update_containers",
     "switch_container",
+    "switch_containers",
 
     "get_loader_identifier",
     "get_loaders_by_name",
@@ -90,7 +96,9 @@ __all__ = (
 
     "any_outdated_containers",
     "get_outdated_containers",
+    "get_outdated_containers_in_background",
     "filter_containers",
+    "clear_containers_status_cache",
 
     # plugins.py
     "LoaderPlugin",
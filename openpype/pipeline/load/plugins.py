@@ -207,6 +207,40 @@ class LoaderPlugin(list):
         raise NotImplementedError("Loader.update() must be "
                                   "implemented by subclass")
 
+    def update_many(self, items):
+        """Update multiple containers at once.
+
+        Called by 'update_containers' with all containers of this loader.
+        Override to batch scene edits, e.g. to use one undo chunk or reload
+        all references in one pass. Default implementation calls 'update'
+        for each container.
+
+        Errors are not raised but returned instead of result of the
+        container, so failed update of one container does not affect
+        the others.
+
+        Arguments:
+            items (list[tuple[dict, dict]]): Containers with representations
+                to which they should be updated.
+
+        Returns:
+            list[Any]: Result of update or exception for each container.
+        """
+
+        output = []
+        for container, representation in items:
+            try:
+                output.append(self.update(container, representation))
+            except Exception as exc:
+                self.log.warning(
+                    "Update of container '{}' failed".format(
+                        container.get("objectName")
+                    ),
+                    exc_info=True
+                )
+                output.append(exc)
+        return output
+
     def remove(self, container):
         """Remove a container
 
@@ -3,7 +3,9 @@ import platform
 import copy
 import getpass
 import logging
+import time
 import inspect
+import threading
 import collections
 import numbers
 
@@ -17,6 +19,7 @@ from openpype.client import (
     get_last_version_by_subset_id,
     get_hero_version_by_subset_id,
     get_version_by_name,
+    get_hero_versions,
     get_last_versions,
     get_representations,
     get_representation_by_id,
@@ -504,6 +507,255 @@ def update_container(container, version=-1):
     return Loader().update(container, new_representation)
 
 
+def _get_update_representations(project_name, containers, versions):
+    """Find representations to which containers should be updated.
+
+    Entities for all containers are queried at once, one query per entity
+    type.
+
+    Args:
+        project_name (str): Project name.
+        containers (list[dict]): Containers to update.
+        versions (list[Union[int, HeroVersionType]]): Version for each
+            container. Version '-1' means last version.
+
+    Returns:
+        list[Union[dict, Exception]]: Representation or error for each
+            container.
+    """
+
+    repre_ids = {container["representation"] for container in containers}
+    repre_docs_by_id = {
+        str(repre_doc["_id"]): repre_doc
+        for repre_doc in get_representations(
+            project_name,
+            representation_ids=repre_ids,
+            fields=["_id", "name", "parent"]
+        )
+    }
+    version_docs_by_id = {
+        version_doc["_id"]: version_doc
+        for version_doc in get_versions(
+            project_name,
+            version_ids={
+                repre_doc["parent"]
+                for repre_doc in repre_docs_by_id.values()
+            },
+            hero=True,
+            fields=["_id", "parent"]
+        )
+    }
+
+    # Collect which versions are requested for which subsets
+    last_subset_ids = set()
+    hero_subset_ids = set()
+    version_names_subset_ids = set()
+    version_names = set()
+    for container, version in zip(containers, versions):
+        repre_doc = repre_docs_by_id.get(container["representation"])
+        if repre_doc is None:
+            continue
+        version_doc = version_docs_by_id.get(repre_doc["parent"])
+        if version_doc is None:
+            continue
+        subset_id = version_doc["parent"]
+        if version == -1:
+            last_subset_ids.add(subset_id)
+        elif isinstance(version, HeroVersionType):
+            hero_subset_ids.add(subset_id)
+        else:
+            version_names_subset_ids.add(subset_id)
+            version_names.add(version)
+
+    last_versions_by_subset_id = {}
+    if last_subset_ids:
+        last_versions_by_subset_id = get_last_versions(
+            project_name, last_subset_ids, fields=["_id"]
+        )
+
+    hero_versions_by_subset_id = {}
+    if hero_subset_ids:
+        hero_versions_by_subset_id = {
+            version_doc["parent"]: version_doc
+            for version_doc in get_hero_versions(
+                project_name,
+                subset_ids=hero_subset_ids,
+                fields=["_id", "parent"]
+            )
+        }
+
+    versions_by_subset_id_and_name = {}
+    if version_names_subset_ids:
+        versions_by_subset_id_and_name = {
+            (version_doc["parent"], version_doc["name"]): version_doc
+            for version_doc in get_versions(
+                project_name,
+                subset_ids=version_names_subset_ids,
+                versions=version_names,
+                fields=["_id", "parent", "name"]
+            )
+        }
+
+    new_version_ids = []
+    names_by_version_ids = collections.defaultdict(set)
+    for container, version in zip(containers, versions):
+        new_version_id = None
+        repre_doc = repre_docs_by_id.get(container["representation"])
+        version_doc = None
+        if repre_doc is not None:
+            version_doc = version_docs_by_id.get(repre_doc["parent"])
+
+        if version_doc is not None:
+            subset_id = version_doc["parent"]
+            if version == -1:
+                new_version = last_versions_by_subset_id.get(subset_id)
+            elif isinstance(version, HeroVersionType):
+                new_version = hero_versions_by_subset_id.get(subset_id)
+            else:
+                new_version = versions_by_subset_id_and_name.get(
+                    (subset_id, version)
+                )
+            if new_version is not None:
+                new_version_id = new_version["_id"]
+                names_by_version_ids[new_version_id].add(repre_doc["name"])
+        new_version_ids.append(new_version_id)
+
+    new_repre_docs_by_version_and_name = {}
+    if names_by_version_ids:
+        new_repre_docs_by_version_and_name = {
+            (repre_doc["parent"], repre_doc["name"]): repre_doc
+            for repre_doc in get_representations(
+                project_name,
+                names_by_version_ids={
+                    version_id: list(names)
+                    for version_id, names in names_by_version_ids.items()
+                }
+            )
+        }
+
+    output = []
+    for container, new_version_id in zip(containers, new_version_ids):
+        repre_doc = repre_docs_by_id.get(container["representation"])
+        if repre_doc is None:
+            output.append(AssertionError("This is a bug"))
+            continue
+
+        if new_version_id is None:
+            output.append(AssertionError("This is a bug"))
+            continue
+
+        new_repre_doc = new_repre_docs_by_version_and_name.get(
+            (new_version_id, repre_doc["name"])
+        )
+        if new_repre_doc is None:
+            output.append(AssertionError("Representation wasn't found"))
+            continue
+
+        path = get_representation_path(new_repre_doc)
+        if not os.path.exists(path):
+            output.append(
+                AssertionError("Path {} doesn't exist".format(path))
+            )
+            continue
+        output.append(new_repre_doc)
+    return output
+
+
+def update_containers(containers, version=-1):
+    """Update multiple containers at once.
+
+    Target representations of all containers are resolved with one query
+    per entity type. Containers are grouped by their loader and each loader
+    updates all its containers with single 'update_many' call, so hosts can
+    batch their scene edits.
+
+    Errors are not raised but returned for each container. Errors caused by
+    missing entities are 'AssertionError' same as in 'update_container'.
+
+    Args:
+        containers (Iterable[dict]): Containers to update.
+        version (Union[int, HeroVersionType, list]): Version to update to.
+            Can be a list with version for each container. Version '-1'
+            means last version.
+
+    Returns:
+        list[tuple[dict, Union[Exception, None]]]: Containers with error
+            of their update or 'None' if update succeeded.
+    """
+
+    containers = list(containers)
+    if isinstance(version, (list, tuple)):
+        versions = list(version)
+        if len(versions) != len(containers):
+            raise ValueError(
+                "Number of containers mismatches number of versions:"
+                " {} containers - {} versions".format(
+                    len(containers), len(versions)
+                )
+            )
+    else:
+        versions = [version] * len(containers)
+
+    if not containers:
+        return []
+
+    from .plugins import discover_loader_plugins
+
+    project_name = legacy_io.active_project()
+    new_repre_docs = _get_update_representations(
+        project_name, containers, versions
+    )
+    loaders_by_identifier = {
+        get_loader_identifier(loader): loader
+        for loader in discover_loader_plugins()
+    }
+
+    errors = [None] * len(containers)
+    indexes_by_loader = collections.defaultdict(list)
+    for idx, container in enumerate(containers):
+        new_repre_doc = new_repre_docs[idx]
+        if isinstance(new_repre_doc, Exception):
+            errors[idx] = new_repre_doc
+            continue
+
+        loader_name = container.get("loader")
+        if loader_name not in loaders_by_identifier:
+            errors[idx] = LoaderNotFoundError(
+                "Can't update container because loader '{}' was not found."
+                .format(loader_name)
+            )
+            continue
+        indexes_by_loader[loader_name].append(idx)
+
+    for loader_name, indexes in indexes_by_loader.items():
+        Loader = loaders_by_identifier[loader_name]
+        items = [
+            (containers[idx], new_repre_docs[idx])
+            for idx in indexes
+        ]
+        # Errors of containers are returned by 'update_many'
+        try:
+            results = Loader().update_many(items)
+        except Exception as exc:
+            log.warning(
+                "Update of containers with loader '{}' failed".format(
+                    loader_name
+                ),
+                exc_info=True
+            )
+            for idx in indexes:
+                errors[idx] = exc
+            continue
+
+        for idx, result in zip(indexes, results):
+            if isinstance(result, Exception):
+                errors[idx] = result
+
+    # Loaded representations changed so cached statuses are not reliable
+    clear_containers_status_cache()
+    return list(zip(containers, errors))
+
+
 def switch_container(container, representation, loader_plugin=None):
     """Switch a container to representation
 
@@ -552,6 +804,100 @@ def switch_container(container, representation, loader_plugin=None):
     return loader.switch(container, new_representation)
 
 
+def switch_containers(items):
+    """Switch multiple containers to representations.
+
+    Representation contexts of all items are resolved at once, one query
+    per entity type, instead of resolving the context for each container.
+
+    Errors are not raised but returned for each container.
+
+    Args:
+        items (Iterable[tuple[dict, dict, Union[type, None]]]): Container,
+            representation to switch to and loader plugin which should be
+            used. Container's loader is used if loader plugin is 'None'.
+
+    Returns:
+        list[tuple[dict, Union[Exception, None]]]: Containers with error
+            of their switch or 'None' if switch succeeded.
+    """
+
+    items = list(items)
+    if not items:
+        return []
+
+    from .plugins import discover_loader_plugins
+
+    project_name = legacy_io.active_project()
+    repre_docs = list(get_representations(
+        project_name,
+        representation_ids={
+            representation["_id"]
+            for _, representation, _ in items
+        }
+    ))
+    repre_contexts = get_contexts_for_repre_docs(project_name, repre_docs)
+    repre_contexts_by_id = {
+        str(repre_id): repre_context
+        for repre_id, repre_context in repre_contexts.items()
+    }
+    loaders_by_identifier = None
+
+    output = []
+    for container, representation, loader_plugin in items:
+        if loader_plugin is None:
+            if loaders_by_identifier is None:
+                loaders_by_identifier = {
+                    get_loader_identifier(loader): loader
+                    for loader in discover_loader_plugins()
+                }
+            loader_plugin = loaders_by_identifier.get(container["loader"])
+
+        try:
+            if not loader_plugin:
+                raise LoaderNotFoundError(
+                    "Can't switch container because loader '{}' was not"
+                    " found.".format(container.get("loader"))
+                )
+
+            if not hasattr(loader_plugin, "switch"):
+                raise LoaderSwitchNotImplementedError(
+                    "Loader {} does not support 'switch'".format(
+                        loader_plugin.label
+                    )
+                )
+
+            new_context = repre_contexts_by_id.get(
+                str(representation["_id"])
+            )
+            if new_context is None:
+                raise InvalidRepresentationContext(
+                    "Representation {} was not found".format(
+                        representation["_id"]
+                    )
+                )
+
+            if not is_compatible_loader(loader_plugin, new_context):
+                raise IncompatibleLoaderError(
+                    "Loader {} is incompatible with {}".format(
+                        loader_plugin.__name__,
+                        new_context["subset"]["name"]
+                    )
+                )
+
+            loader = loader_plugin(new_context)
+            loader.switch(container, new_context["representation"])
+
+        except Exception as exc:
+            output.append((container, exc))
+
+        else:
+            output.append((container, None))
+
+    clear_containers_status_cache()
+    return output
+
+
 def get_representation_path_from_context(context):
     """Preparation wrapper using only context as a argument"""
     representation = context['representation']
@@ -823,7 +1169,18 @@ def any_outdated_containers(host=None, project_name=None):
     return False
 
 
-def get_outdated_containers(host=None, project_name=None):
+def _get_host_containers(host=None):
+    if host is None:
+        from openpype.pipeline import registered_host
+
+        host = registered_host()
+
+    if isinstance(host, ILoadHost):
+        return host.get_containers()
+    return host.ls()
+
+
+def get_outdated_containers(host=None, project_name=None, use_cache=False):
     """Collect outdated containers from host scene.
 
     Currently registered host and project in global session are used if
@@ -832,64 +1189,148 @@ def get_outdated_containers(host=None, project_name=None):
     Args:
         host (ModuleType): Host implementation with 'ls' function available.
         project_name (str): Name of project in which context we are.
+        use_cache (bool): Use cached status of representations which were
+            checked recently.
     """
 
-    if host is None:
-        from openpype.pipeline import registered_host
-
-        host = registered_host()
-
     if project_name is None:
         project_name = legacy_io.active_project()
 
-    if isinstance(host, ILoadHost):
-        containers = host.get_containers()
-    else:
-        containers = host.ls()
-    return filter_containers(containers, project_name).outdated
+    containers = _get_host_containers(host)
+    return filter_containers(
+        containers, project_name, use_cache=use_cache
+    ).outdated
 
 
-def filter_containers(containers, project_name):
-    """Filter containers and split them into 4 categories.
+def get_outdated_containers_in_background(
+    callback, host=None, project_name=None, use_cache=False
+):
+    """Collect outdated containers from host scene without blocking.
 
-    Categories are 'latest', 'outdated', 'invalid' and 'not_found'.
-    The 'lastest' containers are from last version, 'outdated' are not,
-    'invalid' are invalid containers (invalid content) and 'not_found' has
-    some missing entity in database.
+    Containers are collected from host in current thread, because host
+    API is usually not thread safe. Database queries are processed in
+    a separate thread.
+
+    Callback is called from the thread with list of outdated containers,
+    or with 'None' if the check failed. Callback must not touch host or UI
+    directly, use host's deferred execution (e.g. 'executeDeferred' in
+    Maya) instead.
 
     Args:
-        containers (Iterable[dict]): List of containers referenced into scene.
-        project_name (str): Name of project in which context shoud look for
-            versions.
+        callback (Callable[[Union[List[dict], None]], None]): Function
+            called with outdated containers.
+        host (ModuleType): Host implementation with 'ls' function available.
+        project_name (str): Name of project in which context we are.
+        use_cache (bool): Use cached status of representations which were
+            checked recently.
 
     Returns:
-        ContainersFilterResult: Named tuple with 'latest', 'outdated',
-            'invalid' and 'not_found' containers.
+        threading.Thread: Started thread.
     """
 
-    # Make sure containers is list that won't change
-    containers = list(containers)
+    if project_name is None:
+        project_name = legacy_io.active_project()
 
-    outdated_containers = []
-    uptodate_containers = []
-    not_found_containers = []
-    invalid_containers = []
-    output = ContainersFilterResult(
-        uptodate_containers,
-        outdated_containers,
-        not_found_containers,
-        invalid_containers
+    containers = list(_get_host_containers(host))
+
+    def _process():
+        try:
+            outdated_containers = filter_containers(
+                containers, project_name, use_cache=use_cache
+            ).outdated
+
+        except Exception:
+            log.warning(
+                "Failed to check outdated containers.", exc_info=True
+            )
+            outdated_containers = None
+        callback(outdated_containers)
+
+    thread = threading.Thread(
+        target=_process, name="OutdatedContainersCheck"
     )
-    # Query representation docs to get it's version ids
-    repre_ids = {
-        container["representation"]
-        for container in containers
-        if container["representation"]
-    }
-    if not repre_ids:
-        if containers:
-            invalid_containers.extend(containers)
-        return output
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+class _RepresentationsStatusCache(object):
+    """Cache of representation status used to classify containers.
+
+    Status of representation is not changed by loading or updating of
+    containers but only by publishing of new versions, so status is cached
+    by representation id for short time.
+    """
+
+    timeout = 60
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items = {}
+
+    def get(self, project_name, repre_ids):
+        """Get cached status of representations.
+
+        Args:
+            project_name (str): Project name.
+            repre_ids (Iterable[str]): Representation ids.
+
+        Returns:
+            Tuple[Dict[str, str], Set[str]]: Cached status by representation
+                id and representation ids which are not cached.
+        """
+
+        now = time.time()
+        statuses = {}
+        missing = set()
+        with self._lock:
+            project_items = self._items.get(project_name) or {}
+            for repre_id in repre_ids:
+                item = project_items.get(repre_id)
+                if item is None or (now - item[1]) > self.timeout:
+                    missing.add(repre_id)
+                else:
+                    statuses[repre_id] = item[0]
+        return statuses, missing
+
+    def update(self, project_name, statuses):
+        now = time.time()
+        with self._lock:
+            project_items = self._items.setdefault(project_name, {})
+            for repre_id, status in statuses.items():
+                project_items[repre_id] = (status, now)
+
+    def clear(self):
+        with self._lock:
+            self._items = {}
+
+
+_repre_status_cache = _RepresentationsStatusCache()
+
+
+def clear_containers_status_cache():
+    """Clear cached status of representations used by 'filter_containers'.
+
+    Should be called when it is expected that new versions were published,
+    e.g. on scene inventory refresh triggered by user.
+    """
+
+    _repre_status_cache.clear()
+
+
+def _get_representations_status(project_name, repre_ids):
+    """Status of representations in database.
+
+    One query per entity type is used for all representations.
+
+    Args:
+        project_name (str): Name of project.
+        repre_ids (Iterable[str]): Representation ids.
+
+    Returns:
+        Dict[str, str]: Status of representation by its id. Status is one of
+            'latest', 'outdated', 'repre_not_found' or 'version_not_found'.
+    """
 
     repre_docs = get_representations(
         project_name,
@@ -942,6 +1383,87 @@ def filter_containers(containers, project_name):
             if version_id != last_version_doc["_id"]:
                 outdated_version_ids.add(version_id)
 
+    output = {}
+    for repre_id in repre_ids:
+        repre_doc = repre_docs_by_str_id.get(repre_id)
+        if not repre_doc:
+            output[repre_id] = "repre_not_found"
+            continue
+
+        version_id = repre_doc["parent"]
+        if version_id in outdated_version_ids:
+            output[repre_id] = "outdated"
+
+        elif version_id not in verisons_by_id:
+            output[repre_id] = "version_not_found"
+
+        else:
+            output[repre_id] = "latest"
+    return output
+
+
+def filter_containers(containers, project_name, use_cache=False):
+    """Filter containers and split them into 4 categories.
+
+    Categories are 'latest', 'outdated', 'invalid' and 'not_found'.
+    The 'lastest' containers are from last version, 'outdated' are not,
+    'invalid' are invalid containers (invalid content) and 'not_found' has
+    some missing entity in database.
+
+    Status of each unique representation is resolved only once. With
+    'use_cache' enabled only representations which were not checked
+    recently are queried.
+
+    Args:
+        containers (Iterable[dict]): List of containers referenced into scene.
+        project_name (str): Name of project in which context shoud look for
+            versions.
+        use_cache (bool): Use cached status of representations which were
+            checked recently.
+
+    Returns:
+        ContainersFilterResult: Named tuple with 'latest', 'outdated',
+            'invalid' and 'not_found' containers.
+    """
+
+    # Make sure containers is list that won't change
+    containers = list(containers)
+
+    outdated_containers = []
+    uptodate_containers = []
+    not_found_containers = []
+    invalid_containers = []
+    output = ContainersFilterResult(
+        uptodate_containers,
+        outdated_containers,
+        not_found_containers,
+        invalid_containers
+    )
+    # Query representation docs to get it's version ids
+    repre_ids = {
+        container["representation"]
+        for container in containers
+        if container["representation"]
+    }
+    if not repre_ids:
+        if containers:
+            invalid_containers.extend(containers)
+        return output
+
+    statuses = {}
+    missing_repre_ids = repre_ids
+    if use_cache:
+        statuses, missing_repre_ids = _repre_status_cache.get(
+            project_name, repre_ids
+        )
+
+    if missing_repre_ids:
+        new_statuses = _get_representations_status(
+            project_name, missing_repre_ids
+        )
+        statuses.update(new_statuses)
+        _repre_status_cache.update(project_name, new_statuses)
+
     # Based on all collected data figure out which containers are outdated
     #   - log out if there are missing representation or version documents
     for container in containers:
@@ -951,20 +1473,18 @@ def filter_containers(containers, project_name):
             invalid_containers.append(container)
             continue
 
-        repre_doc = repre_docs_by_str_id.get(repre_id)
-        if not repre_doc:
+        status = statuses[repre_id]
+        if status == "repre_not_found":
             log.debug((
                 "Container '{}' has an invalid representation."
                 " It is missing in the database."
             ).format(container_name))
             not_found_containers.append(container)
-            continue
 
-        version_id = repre_doc["parent"]
-        if version_id in outdated_version_ids:
+        elif status == "outdated":
             outdated_containers.append(container)
 
-        elif version_id not in verisons_by_id:
+        elif status == "version_not_found":
             log.debug((
                 "Representation on container '{}' has an invalid version."
                 " It is missing in the database."
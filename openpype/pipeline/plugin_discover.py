@@ -3,6 +3,7 @@ import inspect
 import traceback
 
 from openpype.lib import Logger
+from openpype.startup_trace import trace_phase
 from openpype.lib.python_module_tools import (
     modules_from_path,
     classes_from_module,
@@ -168,7 +169,10 @@ class PluginDiscoverContext(object):
 
         # Include plug-ins from registered paths
         for path in registered_paths:
-            modules, crashed = modules_from_path(path)
+            with trace_phase(
+                path, category="plugins", superclass=superclass.__name__
+            ):
+                modules, crashed = modules_from_path(path)
             for item in crashed:
                 filepath, exc_info = item
                 result.crashed_file_paths[filepath] = exc_info
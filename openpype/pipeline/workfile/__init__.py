@@ -4,6 +4,7 @@ from .path_resolving import (
     get_workdir_with_workdir_data,
     get_workdir,
 
+    get_workfiles_with_version,
     get_last_workfile_with_version,
     get_last_workfile,
 
@@ -22,6 +23,7 @@ __all__ = (
     "get_workdir_with_workdir_data",
     "get_workdir",
 
+    "get_workfiles_with_version",
     "get_last_workfile_with_version",
     "get_last_workfile",
 
@@ -1,6 +1,7 @@
 import os
 import re
 import copy
+import time
 import platform
 
 from openpype.client import get_project, get_asset_by_name
@@ -188,6 +189,214 @@ def get_workdir(
     )
 
 
+class _WorkdirIndex(object):
+    """Listing of workdir.
+
+    Modification times of files are not cached, a file can be overridden in
+    place without changing modification time of the directory.
+
+    Args:
+        workdir (str): Path to workdir.
+        dir_mtime (Union[int, float]): Modification time of directory
+            when it was listed.
+        filenames (list[str]): Names of files in directory.
+    """
+
+    def __init__(self, workdir, dir_mtime, filenames):
+        self.workdir = workdir
+        self.dir_mtime = dir_mtime
+        self.filenames = filenames
+
+    def get_mtime(self, filename):
+        return os.path.getmtime(os.path.join(self.workdir, filename))
+
+
+class _WorkfilesCache:
+    # Workdir indexes by normalized workdir path
+    workdir_indexes = {}
+    max_workdir_indexes = 128
+    # Directory listing is not cached if directory was modified less than
+    #   this number of seconds ago. Next modification could keep the same
+    #   modification time on filesystems with low mtime resolution.
+    racy_seconds = 2
+    # Workfile template regex parts by template and extensions
+    template_regexes = {}
+    # Compiled workfile regexes by filled pattern
+    compiled_regexes = {}
+    # Regex caches are cleared when they reach this size, filled patterns
+    #   are different for each context
+    max_regexes = 256
+
+
+def _get_workdir_index(workdir):
+    """Get listing of workdir.
+
+    Listing is cached and reused until modification time of the directory
+    changes.
+
+    Args:
+        workdir (str): Path to workdir.
+
+    Returns:
+        Union[_WorkdirIndex, None]: Workdir index or None if workdir does
+            not exist.
+    """
+
+    try:
+        dir_stat = os.stat(workdir)
+    except OSError:
+        return None
+
+    # Nanoseconds are not available in Python 2
+    dir_mtime = getattr(dir_stat, "st_mtime_ns", None) or dir_stat.st_mtime
+    key = os.path.normpath(workdir)
+    workdir_indexes = _WorkfilesCache.workdir_indexes
+    index = workdir_indexes.get(key)
+    if index is not None and index.dir_mtime == dir_mtime:
+        return index
+
+    # Only names are needed so 'os.listdir' is enough ('os.scandir' is not
+    #   available in Python 2)
+    index = _WorkdirIndex(workdir, dir_mtime, os.listdir(workdir))
+
+    workdir_indexes.pop(key, None)
+    if time.time() - dir_stat.st_mtime > _WorkfilesCache.racy_seconds:
+        if len(workdir_indexes) >= _WorkfilesCache.max_workdir_indexes:
+            # Remove the oldest index
+            workdir_indexes.pop(next(iter(workdir_indexes)))
+        workdir_indexes[key] = index
+    return index
+
+
+def _get_workfile_template_regex(file_template, dotted_extensions):
+    """Convert workfile template to regex template.
+
+    Template without optionals, version to digits only regex
+    and comment to any definable value. Result still has to be filled
+    with template data.
+
+    Args:
+        file_template (str): Template of file name.
+        dotted_extensions (tuple[str]): Extensions with dot.
+
+    Returns:
+        str: Workfile template converted to regex template.
+    """
+
+    key = (file_template, dotted_extensions)
+    regex_template = _WorkfilesCache.template_regexes.get(key)
+    if regex_template is not None:
+        return regex_template
+
+    # Escape extensions dot for regex
+    regex_exts = [
+        "\\" + ext
+        for ext in dotted_extensions
+    ]
+    ext_expression = "(?:" + "|".join(regex_exts) + ")"
+
+    # Replace `.{ext}` with `{ext}` so we are sure there is not dot at the end
+    regex_template = re.sub(r"\.?{ext}", ext_expression, file_template)
+    # Replace optional keys with optional content regex
+    regex_template = re.sub(r"<.*?>", r".*?", regex_template)
+    # Replace `{version}` with group regex
+    regex_template = re.sub(r"{version.*?}", r"([0-9]+)", regex_template)
+    regex_template = re.sub(r"{comment.*?}", r".+?", regex_template)
+
+    if len(_WorkfilesCache.template_regexes) >= _WorkfilesCache.max_regexes:
+        _WorkfilesCache.template_regexes.clear()
+    _WorkfilesCache.template_regexes[key] = regex_template
+    return regex_template
+
+
+def _compile_workfile_regex(pattern):
+    compiled = _WorkfilesCache.compiled_regexes.get(pattern)
+    if compiled is None:
+        # Match with ignore case on Windows due to the Windows
+        # OS not being case-sensitive. This avoids later running
+        # into the error that the file did exist if it existed
+        # with a different upper/lower-case.
+        flags = 0
+        if platform.system().lower() == "windows":
+            flags = re.IGNORECASE
+        compiled = re.compile(pattern, flags)
+        compiled_regexes = _WorkfilesCache.compiled_regexes
+        if len(compiled_regexes) >= _WorkfilesCache.max_regexes:
+            compiled_regexes.clear()
+        compiled_regexes[pattern] = compiled
+    return compiled
+
+
+def _match_workfiles(workdir, file_template, fill_data, extensions):
+    """Find workfiles matching template in workdir.
+
+    Returns:
+        tuple[Union[_WorkdirIndex, None], list[tuple[str, Union[int, None]]]]:
+            Workdir index and sorted filenames with their version. Version
+            is None if template does not contain version.
+    """
+
+    index = _get_workdir_index(workdir)
+    if index is None:
+        return None, []
+
+    dotted_extensions = set()
+    for ext in extensions:
+        if not ext.startswith("."):
+            ext = ".{}".format(ext)
+        dotted_extensions.add(ext)
+
+    regex_template = _get_workfile_template_regex(
+        file_template, tuple(sorted(dotted_extensions))
+    )
+    regex = _compile_workfile_regex(
+        StringTemplate.format_strict_template(regex_template, fill_data)
+    )
+
+    matches = []
+    for filename in sorted(index.filenames):
+        # Fast match on extension
+        if os.path.splitext(filename)[-1] not in dotted_extensions:
+            continue
+
+        match = regex.match(filename)
+        if not match:
+            continue
+
+        version = None
+        if match.groups():
+            version = int(match.group(1))
+        matches.append((filename, version))
+    return index, matches
+
+
+def get_workfiles_with_version(workdir, file_template, fill_data, extensions):
+    """Find all workfiles matching template with their version and mtime.
+
+    Listing of workdir is cached and invalidated when modification time of
+    the workdir changes.
+
+    Args:
+        workdir (str): Path to dir where workfiles are stored.
+        file_template (str): Template of file name.
+        fill_data (Dict[str, Any]): Data for filling template.
+        extensions (Iterable[str]): All allowed file extensions of workfile.
+
+    Returns:
+        list[tuple[str, Union[int, None], float]]: Filename, version and
+            modification time of matching workfiles sorted by filename.
+            Version is None if template does not contain version.
+    """
+
+    index, matches = _match_workfiles(
+        workdir, file_template, fill_data, extensions
+    )
+    return [
+        (filename, version, index.get_mtime(filename))
+        for filename, version in matches
+    ]
+
+
 def get_last_workfile_with_version(
     workdir, file_template, fill_data, extensions
 ):
@@ -213,63 +422,18 @@ def get_last_workfile_with_version(
             if there is any workfile otherwise None for both.
     """
 
-    if not os.path.exists(workdir):
-        return None, None
-
-    dotted_extensions = set()
-    for ext in extensions:
-        if not ext.startswith("."):
-            ext = ".{}".format(ext)
-        dotted_extensions.add(ext)
-
-    # Fast match on extension
-    filenames = [
-        filename
-        for filename in os.listdir(workdir)
-        if os.path.splitext(filename)[-1] in dotted_extensions
-    ]
-
-    # Build template without optionals, version to digits only regex
-    # and comment to any definable value.
-    # Escape extensions dot for regex
-    regex_exts = [
-        "\\" + ext
-        for ext in dotted_extensions
-    ]
-    ext_expression = "(?:" + "|".join(regex_exts) + ")"
-
-    # Replace `.{ext}` with `{ext}` so we are sure there is not dot at the end
-    file_template = re.sub(r"\.?{ext}", ext_expression, file_template)
-    # Replace optional keys with optional content regex
-    file_template = re.sub(r"<.*?>", r".*?", file_template)
-    # Replace `{version}` with group regex
-    file_template = re.sub(r"{version.*?}", r"([0-9]+)", file_template)
-    file_template = re.sub(r"{comment.*?}", r".+?", file_template)
-    file_template = StringTemplate.format_strict_template(
-        file_template, fill_data
+    index, matches = _match_workfiles(
+        workdir, file_template, fill_data, extensions
     )
 
-    # Match with ignore case on Windows due to the Windows
-    # OS not being case-sensitive. This avoids later running
-    # into the error that the file did exist if it existed
-    # with a different upper/lower-case.
-    kwargs = {}
-    if platform.system().lower() == "windows":
-        kwargs["flags"] = re.IGNORECASE
-
     # Get highest version among existing matching files
     version = None
     output_filenames = []
-    for filename in sorted(filenames):
-        match = re.match(file_template, filename, **kwargs)
-        if not match:
-            continue
-
-        if not match.groups():
+    for filename, file_version in matches:
+        if file_version is None:
             output_filenames.append(filename)
             continue
 
-        file_version = int(match.group(1))
         if version is None or file_version > version:
             output_filenames[:] = []
             version = file_version
@@ -284,8 +448,7 @@ def get_last_workfile_with_version(
         else:
             last_time = None
             for _output_filename in output_filenames:
-                full_path = os.path.join(workdir, _output_filename)
-                mod_time = os.path.getmtime(full_path)
+                mod_time = index.get_mtime(_output_filename)
                 if last_time is None or last_time < mod_time:
                     output_filename = _output_filename
                     last_time = mod_time
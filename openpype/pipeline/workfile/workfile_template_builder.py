@@ -13,6 +13,7 @@ about it's progress.
 
 import os
 import re
+import time
 import collections
 import copy
 from abc import ABCMeta, abstractmethod
@@ -49,6 +50,12 @@ from openpype.pipeline.create import (
     CreateContext,
 )
 
+PatternType = type(re.compile(""))
+# Shared populate data key of representations queried in batch
+PLANNED_REPRESENTATIONS_KEY = "planned_representations"
+# Shared data key of representations loaded during template build
+LOADED_REPRESENTATIONS_KEY = "loaded_representations"
+
 
 class TemplateNotFound(Exception):
     """Exception raised when template does not exist."""
@@ -620,6 +627,36 @@ class AbstractTemplateBuilder(object):
         for identifier, placeholders in placeholders_by_plugin_id.items():
             plugin = plugins_by_identifier[identifier]
             plugin.prepare_placeholders(placeholders)
+            # Plan queries of load placeholders in batch
+            if isinstance(plugin, PlaceholderLoadMixin):
+                plugin.plan_load_placeholders(placeholders)
+
+    def _log_build_times(self, build_times):
+        """Log report of time spent on each placeholder.
+
+        Args:
+            build_times (List[Tuple[PlaceholderItem, float]]): Placeholders
+                with time in seconds spent on their population.
+        """
+
+        if not build_times:
+            return
+
+        total = sum(duration for _, duration in build_times)
+        lines = [
+            "Placeholders build report ({} placeholders in {:.3f}s):".format(
+                len(build_times), total
+            )
+        ]
+        for placeholder, duration in sorted(
+            build_times, key=lambda item: item[1], reverse=True
+        ):
+            lines.append("    {:>8.3f}s {} ({})".format(
+                duration,
+                placeholder.scene_identifier,
+                placeholder.plugin.__class__.__name__
+            ))
+        self.log.info("\n".join(lines))
 
     def populate_scene_placeholders(
         self, level_limit=None, keep_placeholders=None
@@ -637,6 +674,11 @@ class AbstractTemplateBuilder(object):
         identify which placeholders were already processed is used
         placeholder's 'scene_identifier'.
 
+        Before placeholders of a loop are populated, load placeholder plugins
+        plan their representation queries in batch (see
+        'PlaceholderLoadMixin.plan_load_placeholders'). Time spent on each
+        placeholder is logged at the end of the build.
+
         Args:
             level_limit (int): Level of loops that can happen. Default is 1000.
             keep_placeholders (bool): Add flag to placeholder data for
@@ -666,6 +708,7 @@ class AbstractTemplateBuilder(object):
         # Counter is checked at the ned of a loop so the loop happens at least
         #   once.
         iter_counter = 0
+        build_times = []
         while not all_processed:
             filtered_placeholders = []
             for placeholder in placeholders:
@@ -690,6 +733,7 @@ class AbstractTemplateBuilder(object):
             for placeholder in filtered_placeholders:
                 placeholder.set_in_progress()
                 placeholder_plugin = placeholder.plugin
+                start = time.time()
                 try:
                     placeholder_plugin.populate_placeholder(placeholder)
 
@@ -705,6 +749,7 @@ class AbstractTemplateBuilder(object):
                     )
                     placeholder.set_failed(exc)
 
+                build_times.append((placeholder, time.time() - start))
                 placeholder.set_finished()
 
             # Clear shared data before getting new placeholders
@@ -725,6 +770,7 @@ class AbstractTemplateBuilder(object):
                 placeholder_by_scene_id[identifier] = placeholder
                 placeholders.append(placeholder)
 
+        self._log_build_times(build_times)
         self.refresh()
 
     def _get_build_profiles(self):
@@ -1225,6 +1271,51 @@ class PlaceholderItem(object):
         return self._errors
 
 
+def _filter_value_key(value):
+    """Hashable key of context filter value used to deduplicate values."""
+
+    if isinstance(value, PatternType):
+        return ("regex", value.pattern, value.flags)
+    return ("value", value)
+
+
+def _match_context_filters(repre_context, context_filters):
+    """Match representation context against context filters.
+
+    Matching mimics query by 'context_filters' in 'get_representations'. Each
+    key must match any of its values, regexes are not anchored.
+
+    Args:
+        repre_context (Dict[str, Any]): Representation context.
+        context_filters (Dict[str, List[Union[str, PatternType]]]): Filters
+            by context key.
+
+    Returns:
+        bool: Context matches all filters.
+    """
+
+    for key, filter_values in context_filters.items():
+        value = repre_context.get(key)
+        if value is None:
+            return False
+
+        matched = False
+        for filter_value in filter_values:
+            if isinstance(filter_value, PatternType):
+                matched = (
+                    isinstance(value, six.string_types)
+                    and filter_value.search(value) is not None
+                )
+            else:
+                matched = filter_value == value
+            if matched:
+                break
+
+        if not matched:
+            return False
+    return True
+
+
 class PlaceholderLoadMixin(object):
     """Mixin prepared for loading placeholder plugins.
 
@@ -1236,8 +1327,15 @@ class PlaceholderLoadMixin(object):
     PlaceholderItem can have implemented methods:
     - 'load_failed' - called when loading of one representation failed
     - 'load_succeed' - called when loading of one representation succeeded
+
+    Representations of all placeholders processed in one populate loop are
+    queried in batch by 'plan_load_placeholders'. The same representation
+    is loaded only once per build with the same loader and loader arguments
+    unless 'skip_duplicated_loads' is disabled.
     """
 
+    skip_duplicated_loads = True
+
     def get_load_plugin_options(self, options=None):
         """Unified attribute definitions for load placeholder.
 
@@ -1510,68 +1608,145 @@ class PlaceholderLoadMixin(object):
                 yield folder["id"]
 
     def _get_representations_ayon(self, placeholder):
-        # An OpenPype placeholder loaded in AYON
-        if "asset" in placeholder.data:
-            return []
+        repre_docs_by_id = self._query_representations_ayon([placeholder])
+        return repre_docs_by_id[placeholder.scene_identifier]
 
-        representation_name = placeholder.data["representation"]
-        if not representation_name:
-            return []
+    def _query_representations_ayon(self, placeholders):
+        """Query representations of multiple placeholders in batch in AYON.
+
+        Products, last versions and representations of all placeholders are
+        queried at once and filtered for each placeholder afterwards.
+
+        Args:
+            placeholders (List[PlaceholderItem]): Placeholders to query
+                representations for.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Representation documents by
+                placeholder scene identifier.
+        """
+
+        from ayon_api import get_products, get_last_versions
 
         project_name = self.builder.project_name
-        current_asset_doc = self.builder.current_asset_doc
+        output = {}
+        plan_by_id = {}
+        folder_ids_by_regex = {}
+        for placeholder in placeholders:
+            identifier = placeholder.scene_identifier
+            output[identifier] = []
+            # An OpenPype placeholder loaded in AYON
+            if "asset" in placeholder.data:
+                continue
 
-        folder_path_regex = placeholder.data["folder_path"]
-        product_name_regex_value = placeholder.data["product_name"]
-        product_name_regex = None
-        if product_name_regex_value:
-            product_name_regex = re.compile(product_name_regex_value)
-        product_type = placeholder.data["family"]
+            representation_name = placeholder.data["representation"]
+            if not representation_name:
+                continue
 
-        builder_type = placeholder.data["builder_type"]
-        folder_ids = []
-        if builder_type == "context_folder":
-            folder_ids = [current_asset_doc["_id"]]
+            builder_type = placeholder.data["builder_type"]
+            folder_ids = set()
+            if builder_type == "context_folder":
+                folder_ids = {self.builder.current_asset_doc["_id"]}
+
+            elif builder_type == "all_folders":
+                folder_path_regex = placeholder.data["folder_path"]
+                folder_ids = folder_ids_by_regex.get(folder_path_regex)
+                if folder_ids is None:
+                    folder_ids = set(self._query_by_folder_regex(
+                        project_name, folder_path_regex
+                    ))
+                    folder_ids_by_regex[folder_path_regex] = folder_ids
 
-        elif builder_type == "all_folders":
-            folder_ids = list(self._query_by_folder_regex(
-                project_name, folder_path_regex
-            ))
+            if not folder_ids:
+                continue
 
-        if not folder_ids:
-            return []
+            product_name_regex = None
+            product_name_regex_value = placeholder.data["product_name"]
+            if product_name_regex_value:
+                product_name_regex = re.compile(product_name_regex_value)
 
-        from ayon_api import get_products, get_last_versions
+            plan_by_id[identifier] = (
+                folder_ids,
+                placeholder.data["family"],
+                product_name_regex,
+                representation_name,
+            )
+
+        if not plan_by_id:
+            return output
+
+        all_folder_ids = set()
+        product_types = set()
+        for folder_ids, product_type, _, _ in plan_by_id.values():
+            all_folder_ids |= folder_ids
+            product_types.add(product_type)
 
         products = list(get_products(
             project_name,
-            folder_ids=folder_ids,
-            product_types=[product_type],
-            fields={"id", "name"}
+            folder_ids=all_folder_ids,
+            product_types=product_types,
+            fields={"id", "name", "folderId", "productType"}
         ))
-        filtered_product_ids = set()
-        for product in products:
-            if (
-                product_name_regex is None
-                or product_name_regex.match(product["name"])
-            ):
-                filtered_product_ids.add(product["id"])
-
-        if not filtered_product_ids:
-            return []
+        product_ids_by_id = {}
+        for identifier, plan in plan_by_id.items():
+            folder_ids, product_type, product_name_regex, _ = plan
+            product_ids_by_id[identifier] = {
+                product["id"]
+                for product in products
+                if (
+                    product["folderId"] in folder_ids
+                    and product["productType"] == product_type
+                    and (
+                        product_name_regex is None
+                        or product_name_regex.match(product["name"])
+                    )
+                )
+            }
+
+        all_product_ids = set()
+        for product_ids in product_ids_by_id.values():
+            all_product_ids |= product_ids
+
+        if not all_product_ids:
+            return output
 
-        version_ids = set(
-            version["id"]
-            for version in get_last_versions(
-                project_name, filtered_product_ids, fields={"id"}
-            ).values()
+        last_versions_by_product_id = get_last_versions(
+            project_name, all_product_ids, fields={"id", "productId"}
         )
-        return list(get_representations(
+        version_ids_by_id = {}
+        for identifier, product_ids in product_ids_by_id.items():
+            version_ids_by_id[identifier] = {
+                last_versions_by_product_id[product_id]["id"]
+                for product_id in product_ids
+                if product_id in last_versions_by_product_id
+            }
+
+        all_version_ids = set()
+        for version_ids in version_ids_by_id.values():
+            all_version_ids |= version_ids
+
+        if not all_version_ids:
+            return output
+
+        repre_docs = list(get_representations(
             project_name,
-            representation_names=[representation_name],
-            version_ids=version_ids
+            representation_names={
+                plan[3] for plan in plan_by_id.values()
+            },
+            version_ids=all_version_ids
         ))
-
+        for identifier, plan in plan_by_id.items():
+            representation_name = plan[3]
+            version_ids = version_ids_by_id[identifier]
+            output[identifier] = [
+                repre_doc
+                for repre_doc in repre_docs
+                if (
+                    repre_doc["name"] == representation_name
+                    and repre_doc["parent"] in version_ids
+                )
+            ]
+        return output
 
     def _get_representations(self, placeholder):
         """Prepared query of representations based on load options.
@@ -1592,14 +1767,34 @@ class PlaceholderLoadMixin(object):
                 from placeholder data.
         """
 
+        planned_repre_docs = self.builder.get_shared_populate_data(
+            PLANNED_REPRESENTATIONS_KEY
+        ) or {}
+        repre_docs = planned_repre_docs.get(placeholder.scene_identifier)
+        if repre_docs is not None:
+            return list(repre_docs)
+
         if AYON_SERVER_ENABLED:
             return self._get_representations_ayon(placeholder)
 
+        repre_docs_by_id = self._query_representations([placeholder])
+        return repre_docs_by_id[placeholder.scene_identifier]
+
+    def _get_context_filters(self, placeholder):
+        """Representation context filters based on placeholder data.
+
+        Args:
+            placeholder (PlaceholderItem): Item which should be populated.
+
+        Returns:
+            Union[Dict[str, List[Union[str, PatternType]]], None]: Context
+                filters or None if placeholder can't be used in OpenPype.
+        """
+
         # An AYON placeholder loaded in OpenPype
         if "folder_path" in placeholder.data:
-            return []
+            return None
 
-        project_name = self.builder.project_name
         current_asset_doc = self.builder.current_asset_doc
         linked_asset_docs = self.builder.linked_asset_docs
 
@@ -1637,10 +1832,121 @@ class PlaceholderLoadMixin(object):
                 "representation": [placeholder.data["representation"]],
                 "family": [placeholder.data["family"]]
             }
+        return context_filters
 
-        return list(get_representations(
-            project_name,
-            context_filters=context_filters
+    def _query_representations(self, placeholders):
+        """Query representations of multiple placeholders in batch.
+
+        Placeholders are grouped by representation name and family and
+        filters of each group are merged into single query. Result of the
+        query is then filtered for each placeholder using its own filters.
+
+        Args:
+            placeholders (List[PlaceholderItem]): Placeholders to query
+                representations for.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Representation documents by
+                placeholder scene identifier.
+        """
+
+        output = {}
+        filters_by_group = collections.defaultdict(list)
+        for placeholder in placeholders:
+            output[placeholder.scene_identifier] = []
+            context_filters = self._get_context_filters(placeholder)
+            if context_filters is None:
+                continue
+            group_key = (
+                tuple(context_filters["representation"]),
+                tuple(context_filters["family"])
+            )
+            filters_by_group[group_key].append(
+                (placeholder.scene_identifier, context_filters)
+            )
+
+        project_name = self.builder.project_name
+        for group_key, group_items in filters_by_group.items():
+            repre_names, families = group_key
+            merged_filters = {
+                "representation": list(repre_names),
+                "family": list(families),
+            }
+            for key in ("asset", "subset", "hierarchy"):
+                values_by_key = {}
+                for _, context_filters in group_items:
+                    for value in context_filters[key]:
+                        values_by_key[_filter_value_key(value)] = value
+                merged_filters[key] = list(values_by_key.values())
+
+            if not merged_filters["asset"]:
+                continue
+
+            repre_docs = list(get_representations(
+                project_name,
+                context_filters=merged_filters
+            ))
+            for identifier, context_filters in group_items:
+                output[identifier] = [
+                    repre_doc
+                    for repre_doc in repre_docs
+                    if _match_context_filters(
+                        repre_doc["context"], context_filters
+                    )
+                ]
+        return output
+
+    def plan_load_placeholders(self, placeholders):
+        """Query representations of placeholders before they're populated.
+
+        Representations of all passed placeholders are queried with few
+        batched requests instead of a query per placeholder. Result is
+        stored to shared populate data and used by '_get_representations'.
+
+        Planning is skipped if '_get_representations' is overridden.
+
+        Args:
+            placeholders (List[PlaceholderItem]): Placeholders that will be
+                populated in current populate loop.
+        """
+
+        if (
+            not placeholders
+            or getattr(type(self), "_get_representations", None)
+            is not PlaceholderLoadMixin._get_representations
+        ):
+            return
+
+        try:
+            if AYON_SERVER_ENABLED:
+                repre_docs_by_id = self._query_representations_ayon(
+                    placeholders
+                )
+            else:
+                repre_docs_by_id = self._query_representations(placeholders)
+
+        except Exception:
+            self.log.warning(
+                "Failed to plan representations of placeholders.",
+                exc_info=True
+            )
+            return
+
+        planned_repre_docs = self.builder.get_shared_populate_data(
+            PLANNED_REPRESENTATIONS_KEY
+        )
+        if planned_repre_docs is None:
+            planned_repre_docs = {}
+            self.builder.set_shared_populate_data(
+                PLANNED_REPRESENTATIONS_KEY, planned_repre_docs
+            )
+        planned_repre_docs.update(repre_docs_by_id)
+        self.log.debug((
+            "Planned representations of {} placeholders"
+            " ({} representations)"
+        ).format(
+            len(repre_docs_by_id),
+            sum(len(docs) for docs in repre_docs_by_id.values())
         ))
 
     def _before_placeholder_load(self, placeholder):
@@ -1732,10 +2038,35 @@ class PlaceholderLoadMixin(object):
             placeholder
         )
 
+        loaded_repres = self.builder.get_shared_data(
+            LOADED_REPRESENTATIONS_KEY
+        )
+        if loaded_repres is None:
+            loaded_repres = {}
+            self.builder.set_shared_data(
+                LOADED_REPRESENTATIONS_KEY, loaded_repres
+            )
+
         failed = False
         for repre_load_context in repre_load_contexts.values():
             representation = repre_load_context["representation"]
             repre_context = representation["context"]
+            load_key = (
+                str(representation["_id"]),
+                loader_name,
+                placeholder.data["loader_args"],
+            )
+            if self.skip_duplicated_loads and load_key in loaded_repres:
+                self.log.info((
+                    "Skipping {} from {}, already loaded"
+                    " by placeholder {} with the same loader."
+                ).format(
+                    repre_context["subset"],
+                    repre_context["asset"],
+                    loaded_repres[load_key]
+                ))
+                continue
+
             self._before_repre_load(
                 placeholder, representation
             )
@@ -1759,6 +2090,7 @@ class PlaceholderLoadMixin(object):
                 self.load_failed(placeholder, representation)
                 failed = True
             else:
+                loaded_repres[load_key] = placeholder.scene_identifier
                 self.load_succeed(placeholder, container)
 
         # Run post placeholder process after load of all representations
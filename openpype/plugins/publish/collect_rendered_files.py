@@ -14,6 +14,7 @@ import pyblish.api
 
 from openpype.pipeline import legacy_io, KnownPublishError
 from openpype.pipeline.publish.lib import add_repre_files_for_cleanup
+from openpype.pipeline.farm.directory_scanner import get_directory_scanner
 
 
 class CollectRenderedFiles(pyblish.api.ContextPlugin):
@@ -182,3 +183,14 @@ class CollectRenderedFiles(pyblish.api.ContextPlugin):
         except Exception as e:
             self.log.error(e, exc_info=True)
             raise Exception("Error") from e
+
+        # List staging directories of rendered files in parallel, the
+        #   listings are reused by following plugins. Directories which
+        #   can't be listed are reported by plugins using the listing.
+        staging_dirs = {
+            repre["stagingDir"]
+            for instance in context
+            for repre in instance.data.get("representations") or []
+            if repre.get("stagingDir")
+        }
+        get_directory_scanner(context).scan(staging_dirs)
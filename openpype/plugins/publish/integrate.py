@@ -4,7 +4,6 @@ import sys
 import copy
 import datetime
 
-import clique
 import six
 from bson.objectid import ObjectId
 import pyblish.api
@@ -24,7 +23,11 @@ from openpype.client import (
     get_subset_by_name,
     get_version_by_name,
 )
-from openpype.lib import source_hash
+from openpype.lib import (
+    source_hash,
+    FrameSequence,
+    assemble_frame_sequences_compat,
+)
 from openpype.lib.file_transaction import (
     FileTransaction,
     DuplicateDestinationError
@@ -530,17 +533,94 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         if not is_sequence_representation:
             return
 
-        src_collections, remainders = clique.assemble(files)
-        if len(files) < 2 or len(src_collections) != 1 or remainders:
+        src_sequences, remainders = assemble_frame_sequences_compat(files)
+        if len(files) < 2 or len(src_sequences) != 1 or remainders:
             raise KnownPublishError((
                 "Files of representation does not contain proper"
                 " sequence files.\nCollected collections: {}"
                 "\nCollected remainders: {}"
             ).format(
-                ", ".join([str(col) for col in src_collections]),
+                ", ".join([str(seq) for seq in src_sequences]),
                 ", ".join([str(rem) for rem in remainders])
             ))
 
+    def _get_destination_sequence(
+        self, path_template_obj, template_data, key, indexes, padding
+    ):
+        """Fill destination path template for sequence indexes.
+
+        Template is filled only for first two indexes and rest of paths is
+        defined by head and tail of destination sequence. Template is filled
+        for all indexes if frame can't be safely found in filled paths.
+
+        Args:
+            path_template_obj (TemplateResult): Path template.
+            template_data (dict[str, Any]): Data for template.
+            key (str): Template key of index ('frame' or 'udim').
+            indexes (list[int]): Destination indexes.
+            padding (int): Destination padding.
+
+        Returns:
+            tuple[FrameSequence, dict[str, Any]]: Destination sequence and
+                used values of first filled template.
+        """
+
+        filled_paths = []
+        for index in indexes[:2]:
+            template_data[key] = index
+            filled_paths.append(path_template_obj.format_strict(template_data))
+        self.log.debug("Template filled: {}".format(str(filled_paths[0])))
+        repre_context = filled_paths[0].used_values
+
+        dst_sequence = self._get_sequence_from_filled_paths(
+            filled_paths, indexes, padding
+        )
+        if dst_sequence is None:
+            for index in indexes[2:]:
+                template_data[key] = index
+                filled_paths.append(
+                    path_template_obj.format_strict(template_data)
+                )
+            dst_sequence = assemble_frame_sequences_compat(
+                [str(path) for path in filled_paths]
+            )[0][0]
+            dst_sequence.padding = padding
+
+        template_data[key] = indexes[-1]
+        return dst_sequence, repre_context
+
+    @staticmethod
+    def _get_sequence_from_filled_paths(filled_paths, indexes, padding):
+        """Find head and tail of sequence from two filled paths.
+
+        Returns:
+            Union[FrameSequence, None]: Sequence or None if paths don't
+                differ only by frame.
+        """
+
+        if len(filled_paths) < 2:
+            return None
+
+        first, second = str(filled_paths[0]), str(filled_paths[1])
+        prefix_len = len(os.path.commonprefix([first, second]))
+        suffix_len = len(os.path.commonprefix([first[::-1], second[::-1]]))
+        # Frames can share digits e.g. '1001' and '1002'
+        while prefix_len > 0 and first[prefix_len - 1].isdigit():
+            prefix_len -= 1
+        while suffix_len > 0 and first[len(first) - suffix_len].isdigit():
+            suffix_len -= 1
+
+        sequence = FrameSequence.from_frames(
+            first[:prefix_len],
+            first[len(first) - suffix_len:],
+            padding,
+            indexes
+        )
+        for path, index in zip((first, second), indexes):
+            if sequence.get_path(index) != path:
+                return None
+        return sequence
+
     def prepare_representation(self, repre,
                                template_name,
                                existing_repres_by_name,
@@ -659,16 +739,13 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             # Find out first frame string value
             first_index_padded = None
             if not is_udim and is_sequence_representation:
-                col = clique.assemble(files)[0][0]
-                sorted_frames = tuple(sorted(col.indexes))
-                # First frame used for end value
-                first_frame = sorted_frames[0]
-                # Get last frame for padding
-                last_frame = sorted_frames[-1]
-                # Use padding from collection of length of last frame as string
-                padding = max(col.padding, len(str(last_frame)))
+                src_sequence = assemble_frame_sequences_compat(files)[0][0]
+                # Use padding from sequence of length of last frame as string
+                padding = max(
+                    src_sequence.padding, len(str(src_sequence.frame_end))
+                )
                 first_index_padded = get_frame_padded(
-                    frame=first_frame,
+                    frame=src_sequence.frame_start,
                     padding=padding
                 )
 
@@ -694,10 +771,8 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
         elif is_sequence_representation:
             # Collection of files (sequence)
-            src_collections, remainders = clique.assemble(files)
-
-            src_collection = src_collections[0]
-            destination_indexes = list(src_collection.indexes)
+            src_sequence = assemble_frame_sequences_compat(files)[0][0]
+            destination_indexes = list(src_sequence.frames())
             # Use last frame for minimum padding
             #   - that should cover both 'udim' and 'frame' minimum padding
             destination_padding = len(str(destination_indexes[-1]))
@@ -735,23 +810,14 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                 padding=destination_padding
             )
 
-            # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+            # Construct destination sequence from template
+            dst_sequence, repre_context = self._get_destination_sequence(
+                path_template_obj,
+                template_data,
+                "udim" if is_udim else "frame",
+                destination_indexes,
+                destination_padding
+            )
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -759,10 +825,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             if not is_udim:
                 repre_context["frame"] = first_index_padded
 
-            # Update the destination indexes and padding
-            dst_collection = clique.assemble(dst_filepaths)[0][0]
-            dst_collection.padding = destination_padding
-            if len(src_collection.indexes) != len(dst_collection.indexes):
+            if len(src_sequence) != len(dst_sequence):
                 raise KnownPublishError((
                     "This is a bug. Source sequence frames length"
                     " does not match integration frames length"
@@ -770,7 +833,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
             # Multiple file transfers
             transfers = []
-            for src_file_name, dst in zip(src_collection, dst_collection):
+            for src_file_name, dst in zip(src_sequence, dst_sequence):
                 src = os.path.join(stagingdir, src_file_name)
                 transfers.append((src, dst))
 
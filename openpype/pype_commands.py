@@ -293,8 +293,13 @@ class PypeCommands:
         version_packer = VersionRepacker(directory)
         version_packer.process()
 
-    def pack_project(self, project_name, dirpath, database_only):
-        from openpype.lib.project_backpack import pack_project
+    def pack_project(
+        self, project_name, dirpath, database_only, streamed=False
+    ):
+        from openpype.lib.project_backpack import (
+            pack_project,
+            pack_project_streamed,
+        )
 
         if database_only and not dirpath:
             raise ValueError((
@@ -303,7 +308,10 @@ class PypeCommands:
                 " to specify directory."
             ))
 
-        pack_project(project_name, dirpath, database_only)
+        if streamed:
+            pack_project_streamed(project_name, dirpath, database_only)
+        else:
+            pack_project(project_name, dirpath, database_only)
 
     def unpack_project(self, zip_filepath, new_root, database_only):
         from openpype.lib.project_backpack import unpack_project
@@ -17,12 +17,42 @@ Providing functionality:
 - _get_views_data - python 3 - module function
                  - returning all available viewers
                    found in input config path.
+- serve - console command - python 2
+        - long-lived worker answering requests of all other console
+          commands as JSON lines on stdin/stdout.
 """
 import os
+import sys
 import click
 import json
+import traceback
 import PyOpenColorIO as ocio
 
+# Prefix of worker response lines on stdout, other lines are ignored
+WORKER_RESPONSE_PREFIX = "OCIO_WORKER_RESPONSE:"
+
+# Configs loaded by worker by path with their modification time
+_config_cache = {}
+
+
+def _load_config(config_path):
+    """Load OCIO config, worker reuses config until the file changes.
+
+    Args:
+        config_path (str): path string leading to config.ocio
+
+    Returns:
+        PyOpenColorIO.Config: Loaded config.
+    """
+    mtime = os.path.getmtime(config_path)
+    cached = _config_cache.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    config = ocio.Config.CreateFromFile(config_path)
+    _config_cache[config_path] = (mtime, config)
+    return config
+
 
 @click.group()
 def main():
@@ -99,7 +129,7 @@ def _get_colorspace_data(config_path):
         raise IOError(
             "Input path `{}` should be `config.ocio` file".format(config_path))
 
-    config = ocio.Config().CreateFromFile(config_path)
+    config = _load_config(config_path)
 
     colorspace_data = {
         "roles": {},
@@ -191,7 +221,7 @@ def _get_views_data(config_path):
     if not os.path.isfile(config_path):
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(config_path)
+    config = _load_config(config_path)
 
     data_ = {}
     for display in config.getDisplays():
@@ -261,7 +291,7 @@ def _get_version_data(config_path):
     if not os.path.isfile(config_path):
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(config_path)
+    config = _load_config(config_path)
 
     return {
         "major": config.getMajorVersion(),
@@ -330,7 +360,7 @@ def _get_config_file_rules_colorspace_from_filepath(config_path, filepath):
         raise IOError(
             "Input path `{}` should be `config.ocio` file".format(config_path))
 
-    config = ocio.Config().CreateFromFile(config_path)
+    config = _load_config(config_path)
 
     # TODO: use `parseColorSpaceFromString` instead if ocio v1
     colorspace = config.getColorSpaceFromFilepath(filepath)
@@ -356,7 +386,7 @@ def _get_display_view_colorspace_name(config_path, display, view):
     if not os.path.isfile(config_path):
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config.CreateFromFile(config_path)
+    config = _load_config(config_path)
     colorspace = config.getDisplayViewColorSpaceName(display, view)
 
     return colorspace
@@ -410,5 +440,92 @@ def get_display_view_colorspace_name(in_path, out_path,
     print("Display view colorspace saved to '{}'".format(out_path))
 
 
+# Worker commands by command group and name with their argument names
+#   - arguments are same as options of console commands
+_WORKER_COMMANDS = {
+    ("config", "get_colorspace"): (
+        _get_colorspace_data, ("in_path", )
+    ),
+    ("config", "get_views"): (
+        _get_views_data, ("in_path", )
+    ),
+    ("config", "get_version"): (
+        _get_version_data, ("config_path", )
+    ),
+    ("config", "get_display_view_colorspace_name"): (
+        _get_display_view_colorspace_name, ("in_path", "display", "view")
+    ),
+    ("colorspace", "get_config_file_rules_colorspace_from_filepath"): (
+        _get_config_file_rules_colorspace_from_filepath,
+        ("config_path", "filepath")
+    ),
+}
+
+
+def _process_worker_request(request):
+    """Process single worker request.
+
+    Args:
+        request (dict): Request with 'id', 'group', 'command' and 'kwargs'.
+
+    Returns:
+        dict: Response with 'id' and 'result' or 'error'.
+    """
+    response = {"id": request.get("id")}
+    try:
+        key = (request["group"], request["command"])
+        if key not in _WORKER_COMMANDS:
+            raise ValueError("Unknown command {} {}".format(*key))
+
+        func, arg_names = _WORKER_COMMANDS[key]
+        kwargs = request.get("kwargs") or {}
+        response["result"] = func(*[kwargs[name] for name in arg_names])
+
+    except Exception:
+        response["error"] = traceback.format_exc()
+    return response
+
+
+@main.command(
+    name="serve",
+    help=(
+        "run worker answering commands as JSON lines on stdin/stdout"
+    )
+)
+def serve():
+    """Run long-lived worker processing requests from stdin.
+
+    Each request is one JSON line with 'id', 'group', 'command' and
+    'kwargs' where group, command and kwargs match console commands
+    (without 'out_path'). Each response is one line on stdout with
+    'WORKER_RESPONSE_PREFIX' followed by JSON with 'id' and 'result' or
+    'error'. Worker ends when stdin is closed.
+
+    Example of use:
+    > pyton.exe ./ocio_wrapper.py serve
+    """
+    # Announce that worker is ready
+    sys.stdout.write("{}{}\n".format(
+        WORKER_RESPONSE_PREFIX, json.dumps({"id": None, "result": "ready"})
+    ))
+    sys.stdout.flush()
+
+    for line in iter(sys.stdin.readline, ""):
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+        except ValueError:
+            continue
+
+        response = _process_worker_request(request)
+        sys.stdout.write("{}{}\n".format(
+            WORKER_RESPONSE_PREFIX, json.dumps(response)
+        ))
+        sys.stdout.flush()
+
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+"""Tracer of process startup enabled by 'OPENPYPE_STARTUP_TRACE'.
+
+Module uses only standard library and is imported by 'openpype' package
+before any other openpype module, so imports of all of them are traced.
+"""
+import os
+import sys
+import json
+import time
+import atexit
+import inspect
+import tempfile
+import threading
+import contextlib
+
+
+# Environment variable enabling startup tracer. Value can be path to output
+#   json file with optional '{pid}' and '{host}' keys, or "1" to use
+#   temp directory.
+STARTUP_TRACE_ENV_KEY = "OPENPYPE_STARTUP_TRACE"
+
+_perf_counter = getattr(time, "perf_counter", time.time)
+_startup_tracer = None
+
+
+class _ImportTraceFinder(object):
+    """Meta path finder which measures time of module imports.
+
+    Finder does not find anything on its own. It asks other finders for
+    module spec and wraps 'exec_module' of found loader.
+    """
+
+    is_openpype_trace_finder = True
+
+    def __init__(self, tracer):
+        self.tracer = tracer
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, "searching", False):
+            return None
+
+        self._local.searching = True
+        spec = None
+        try:
+            for finder in sys.meta_path:
+                find_spec = getattr(finder, "find_spec", None)
+                if finder is self or find_spec is None:
+                    continue
+                spec = find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            self._local.searching = False
+
+        loader = getattr(spec, "loader", None)
+        if (
+            loader is None
+            or inspect.isclass(loader)
+            or not hasattr(loader, "exec_module")
+            or getattr(loader.exec_module, "is_openpype_traced", False)
+        ):
+            return spec
+
+        try:
+            loader.exec_module = self._wrap_exec_module(loader.exec_module)
+        except AttributeError:
+            # Loader does not allow to set attributes
+            pass
+        return spec
+
+    def _wrap_exec_module(self, exec_module):
+        tracer = self.tracer
+
+        def traced_exec_module(module):
+            with tracer.trace_import(module.__name__):
+                return exec_module(module)
+
+        traced_exec_module.is_openpype_traced = True
+        return traced_exec_module
+
+
+class StartupTracer(object):
+    """Tracer of process startup.
+
+    Records wall time of startup phases, of each imported module (cumulative
+    and self time like 'python -X importtime') and of loading of plugin
+    paths. Result is stored as Chrome trace json file which can be opened in
+    'chrome://tracing' or Perfetto. Summary of the trace is stored under
+    'otherData' key of the file.
+
+    Tracer is created by 'get_startup_tracer' if 'OPENPYPE_STARTUP_TRACE'
+    environment variable is set.
+
+    Args:
+        output_path (str): Path to output json file.
+    """
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self._start_time = _perf_counter()
+        self._events = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._finder = None
+
+    def _get_ts(self, timestamp):
+        return int((timestamp - self._start_time) * 1000000)
+
+    def _add_event(self, name, category, start, end, args=None):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self._get_ts(start),
+            "dur": int((end - start) * 1000000),
+            "pid": os.getpid(),
+            "tid": threading.current_thread().ident,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+
+    def start(self):
+        """Start tracing of imports."""
+
+        if self._finder is not None or not hasattr(sys, "meta_path"):
+            return
+        self._finder = _ImportTraceFinder(self)
+        sys.meta_path.insert(0, self._finder)
+        atexit.register(self.write)
+
+    def stop(self):
+        """Stop tracing of imports."""
+
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    def add_phase(self, name, start, end, category="phase", **kwargs):
+        """Add already measured phase.
+
+        Args:
+            name (str): Name of phase.
+            start (float): Start time from 'time.perf_counter'.
+            end (float): End time from 'time.perf_counter'.
+            category (str): Category of phase.
+            **kwargs: Additional data stored to event.
+        """
+
+        self._add_event(name, category, start, end, kwargs)
+
+    @contextlib.contextmanager
+    def trace_phase(self, name, category="phase", **kwargs):
+        """Measure wall time of a phase.
+
+        Args:
+            name (str): Name of phase.
+            category (str): Category of phase.
+            **kwargs: Additional data stored to event.
+        """
+
+        start = _perf_counter()
+        try:
+            yield
+        finally:
+            self._add_event(name, category, start, _perf_counter(), kwargs)
+
+    @contextlib.contextmanager
+    def trace_import(self, module_name):
+        """Measure import of a module.
+
+        Time of nested imports is subtracted from self time of the module.
+        """
+
+        stack = getattr(self._local, "import_stack", None)
+        if stack is None:
+            stack = self._local.import_stack = []
+        # Time spent in nested imports
+        stack.append(0.0)
+        start = _perf_counter()
+        try:
+            yield
+        finally:
+            end = _perf_counter()
+            duration = end - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += duration
+            self._add_event(
+                module_name,
+                "import",
+                start,
+                end,
+                {"self_us": int((duration - nested) * 1000000)}
+            )
+
+    def get_summary(self):
+        """Summary of recorded events.
+
+        Returns:
+            dict[str, Any]: Phases in order of start, imports and plugin
+                paths sorted by duration. Durations are in seconds.
+        """
+
+        with self._lock:
+            events = list(self._events)
+
+        phases = []
+        imports = []
+        plugin_paths = []
+        for event in sorted(events, key=lambda item: item["ts"]):
+            duration = event["dur"] / 1000000.0
+            args = event.get("args") or {}
+            if event["cat"] == "import":
+                imports.append({
+                    "module": event["name"],
+                    "cumulative": duration,
+                    "self": args.get("self_us", 0) / 1000000.0
+                })
+            elif event["cat"] == "plugins":
+                item = {"name": event["name"], "duration": duration}
+                item.update(args)
+                plugin_paths.append(item)
+            else:
+                phases.append({"name": event["name"], "duration": duration})
+
+        imports.sort(key=lambda item: item["cumulative"], reverse=True)
+        plugin_paths.sort(key=lambda item: item["duration"], reverse=True)
+        return {
+            "total": _perf_counter() - self._start_time,
+            "phases": phases,
+            "imports": imports,
+            "plugin_paths": plugin_paths,
+        }
+
+    def write(self, output_path=None):
+        """Write Chrome trace json file.
+
+        Args:
+            output_path (Optional[str]): Path to output file. Path passed
+                on initialization is used if not passed.
+
+        Returns:
+            str: Path to written file.
+        """
+
+        if output_path is None:
+            output_path = self.output_path
+
+        with self._lock:
+            events = list(self._events)
+
+        dirpath = os.path.dirname(output_path)
+        if dirpath and not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        with open(output_path, "w") as stream:
+            json.dump(
+                {
+                    "traceEvents": events,
+                    "displayTimeUnit": "ms",
+                    "otherData": self.get_summary()
+                },
+                stream
+            )
+        return output_path
+
+
+def _get_startup_trace_path(value):
+    if value.lower() in ("1", "true", "yes"):
+        value = os.path.join(
+            tempfile.gettempdir(), "openpype_startup_{host}_{pid}.json"
+        )
+    return value.format(
+        pid=os.getpid(),
+        host=os.environ.get("AVALON_APP") or "openpype"
+    )
+
+
+def get_startup_tracer():
+    """Startup tracer of current process.
+
+    Tracer is created and started on first call if 'OPENPYPE_STARTUP_TRACE'
+    environment variable is set.
+
+    Returns:
+        Union[StartupTracer, None]: Tracer or None if tracing is disabled.
+    """
+
+    global _startup_tracer
+
+    if _startup_tracer is not None or not os.environ.get(
+        STARTUP_TRACE_ENV_KEY
+    ):
+        return _startup_tracer
+
+    # Tracer may be already running if openpype modules were reimported
+    for finder in getattr(sys, "meta_path", []):
+        if getattr(finder, "is_openpype_trace_finder", False):
+            _startup_tracer = finder.tracer
+            return _startup_tracer
+
+    _startup_tracer = StartupTracer(
+        _get_startup_trace_path(os.environ[STARTUP_TRACE_ENV_KEY])
+    )
+    _startup_tracer.start()
+    return _startup_tracer
+
+
+def trace_phase(name, category="phase", **kwargs):
+    """Measure wall time of a phase if startup tracing is enabled.
+
+    Args:
+        name (str): Name of phase.
+        category (str): Category of phase.
+        **kwargs: Additional data stored to event.
+
+    Returns:
+        contextlib.AbstractContextManager: Context manager measuring phase.
+    """
+
+    tracer = get_startup_tracer()
+    if tracer is None:
+        return _NullContext()
+    return tracer.trace_phase(name, category, **kwargs)
+
+
+def write_startup_trace():
+    """Write startup trace file if startup tracing is enabled.
+
+    Returns:
+        Union[str, None]: Path to trace file.
+    """
+
+    tracer = get_startup_tracer()
+    if tracer is None:
+        return None
+    return tracer.write()
+
+
+class _NullContext(object):
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *args):
+        return False
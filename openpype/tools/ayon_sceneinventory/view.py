@@ -17,10 +17,10 @@ from openpype.client import (
 from openpype import style
 from openpype.pipeline import (
     HeroVersionType,
-    update_container,
     remove_container,
     discover_inventory_actions,
 )
+from openpype.pipeline.load import update_containers
 from openpype.tools.utils.lib import (
     iter_model_rows,
     format_version
@@ -814,12 +814,21 @@ class SceneInventoryView(QtWidgets.QTreeView):
 
         # Trigger update to latest
         try:
-            for item, item_version in zip(items, versions):
-                try:
-                    update_container(item, item_version)
-                except AssertionError:
+            other_error = None
+            results = update_containers(items, version)
+            for (item, error), item_version in zip(results, versions):
+                if error is None:
+                    continue
+
+                if isinstance(error, AssertionError):
                     self._show_version_error_dialog(item_version, [item])
-                    log.warning("Update failed", exc_info=True)
+                    log.warning("Update failed", exc_info=error)
+
+                elif other_error is None:
+                    other_error = error
+
+            if other_error is not None:
+                raise other_error
         finally:
             # Always update the scene inventory view, even if errors occurred
             self.data_changed.emit()
@@ -85,6 +85,9 @@ So, bootstrapping OpenPype looks like this::
 Todo:
     Move or remove bootstrapping environments out of the code.
 
+Set `OPENPYPE_STARTUP_TIMING` environment variable to print duration of
+each bootstrap phase before OpenPype is launched.
+
 Attributes:
     silent_commands (set): list of commands for which we won't print OpenPype
         logo and info header.
@@ -100,11 +103,14 @@ import platform
 import traceback
 import subprocess
 import site
+import time
+import contextlib
 import distutils.spawn
 from pathlib import Path
 
 
 silent_mode = False
+startup_timings = []
 
 # OPENPYPE_ROOT is variable pointing to build (or code) directory
 # WARNING `OPENPYPE_ROOT` must be defined before igniter import
@@ -280,6 +286,31 @@ silent_commands = {"run", "igniter", "standalonepublisher",
                    "extractenvironments", "version"}
 
 
+@contextlib.contextmanager
+def _timed_phase(label: str):
+    """Measure duration of bootstrap phase for startup timing report."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        startup_timings.append((label, time.perf_counter() - start))
+
+
+def _print_startup_timings() -> None:
+    """Print durations of bootstrap phases.
+
+    Report is printed only if `OPENPYPE_STARTUP_TIMING` is set.
+    """
+    if not os.getenv("OPENPYPE_STARTUP_TIMING") or not startup_timings:
+        return
+    width = max(len(label) for label, _ in startup_timings)
+    _print(">>> Startup timing:")
+    for label, duration in startup_timings:
+        _print(f"  - {label.ljust(width)} {duration:8.3f}s")
+    total = sum(duration for _, duration in startup_timings)
+    _print(f"  - {'total'.ljust(width)} {total:8.3f}s")
+
+
 def list_versions(openpype_versions: list, local_version=None) -> None:
     """Print list of detected versions."""
     _print("  - Detected versions:")
@@ -928,8 +959,10 @@ def _boot_validate_versions(use_version, local_version):
     version_path = bootstrap.get_version_path_from_list(
         use_version, openpype_versions
     )
-    valid, message = bootstrap.validate_openpype_version(version_path)
+    with _timed_phase("validate version"):
+        valid, message = bootstrap.validate_openpype_version(version_path)
     _print(f'{">>> " if valid else "!!! "}{message}', not valid)
+    _print_startup_timings()
     return valid
 
 
@@ -980,7 +1013,8 @@ def boot():
     # ------------------------------------------------------------------------
     # Do necessary startup validations
     # ------------------------------------------------------------------------
-    _startup_validations()
+    with _timed_phase("startup validations"):
+        _startup_validations()
 
     # ------------------------------------------------------------------------
     # Process arguments
@@ -1002,7 +1036,8 @@ def boot():
     # ------------------------------------------------------------------------
 
     try:
-        openpype_mongo = _determine_mongodb()
+        with _timed_phase("determine mongodb"):
+            openpype_mongo = _determine_mongodb()
     except RuntimeError as e:
         # without mongodb url we are done for.
         _print(f"!!! {e}", True)
@@ -1021,10 +1056,12 @@ def boot():
         if "_tests" not in avalon_db:
             os.environ["AVALON_DB"] = avalon_db + "_tests"
 
-    global_settings = get_openpype_global_settings(openpype_mongo)
+    with _timed_phase("global settings"):
+        global_settings = get_openpype_global_settings(openpype_mongo)
 
     _print(">>> run disk mapping command ...")
-    run_disk_mapping_commands(global_settings)
+    with _timed_phase("disk mapping"):
+        run_disk_mapping_commands(global_settings)
 
     # Logging to server enabled/disabled
     log_to_server = global_settings.get("log_to_server", True)
@@ -1071,7 +1108,8 @@ def boot():
     if getattr(sys, 'frozen', False):
         # find versions of OpenPype to be used with frozen code
         try:
-            version_path = _find_frozen_openpype(use_version, use_staging)
+            with _timed_phase("find version"):
+                version_path = _find_frozen_openpype(use_version, use_staging)
         except OpenPypeVersionNotFound as exc:
             _boot_handle_missing_version(local_version, str(exc))
             sys.exit(1)
@@ -1082,14 +1120,16 @@ def boot():
             sys.exit(1)
         # validate version
         _print(f">>> Validating version in frozen [ {str(version_path)} ]")
-        result = bootstrap.validate_openpype_version(version_path)
+        with _timed_phase("validate version"):
+            result = bootstrap.validate_openpype_version(version_path)
         if not result[0]:
             _print(f"!!! Invalid version: {result[1]}", True)
             sys.exit(1)
         _print("--- version is valid")
     else:
         try:
-            version_path = _bootstrap_from_code(use_version)
+            with _timed_phase("bootstrap from code"):
+                version_path = _bootstrap_from_code(use_version)
 
         except OpenPypeVersionNotFound as exc:
             _boot_handle_missing_version(local_version, str(exc))
@@ -1118,11 +1158,14 @@ def boot():
     _print(">>> loading environments ...")
     # Avalon environments must be set before avalon module is imported
     _print("  - for Avalon ...")
-    set_avalon_environments()
+    with _timed_phase("avalon environments"):
+        set_avalon_environments()
     _print("  - global OpenPype ...")
-    set_openpype_global_environments()
+    with _timed_phase("global environments"):
+        set_openpype_global_environments()
     _print("  - for modules ...")
-    set_modules_environments()
+    with _timed_phase("modules environments"):
+        set_modules_environments()
 
     assert version_path, "Version path not defined."
 
@@ -1147,6 +1190,8 @@ def boot():
         for i in info:
             t.echo(i)
 
+    _print_startup_timings()
+
     from openpype import cli
     try:
         cli.main(obj={}, prog_name="openpype")
@@ -0,0 +1,172 @@
+"""Test texture processing pool and texture cache of Maya look extractor.
+
+    Texture processing is done by a fake processor executable which
+    sleeps and writes an output file, so no texture tools are required.
+"""
+import os
+import sys
+import time
+import subprocess
+
+import pytest
+
+from openpype.hosts.maya.texture_processing import (
+    COPY,
+    TextureCache,
+    TextureProcessor,
+    TextureProcessingPool,
+    TextureResult,
+)
+
+FAKE_PROCESSOR_SCRIPT = """
+import sys
+import time
+source, destination, duration = sys.argv[1:]
+if "fail" in source:
+    sys.exit(1)
+time.sleep(float(duration))
+with open(destination, "w") as stream:
+    stream.write(source)
+"""
+
+
+class FakeProcessor(TextureProcessor):
+    extension = ".fake"
+
+    def __init__(self, script_path, durations):
+        super(FakeProcessor, self).__init__()
+        self.script_path = script_path
+        self.durations = durations
+
+    def process(self, source, colorspace, color_management, staging_dir):
+        destination = os.path.join(
+            staging_dir, os.path.basename(source) + self.extension
+        )
+        subprocess.check_call([
+            sys.executable,
+            self.script_path,
+            source,
+            destination,
+            str(self.durations.get(source, 0.0))
+        ])
+        return TextureResult(
+            path=destination,
+            colorspace=colorspace,
+            file_hash=None,
+            transfer_mode=COPY
+        )
+
+
+class TestTextureProcessingPool:
+    @pytest.fixture
+    def processor(self, tmp_path):
+        script_path = tmp_path / "fake_processor.py"
+        script_path.write_text(FAKE_PROCESSOR_SCRIPT)
+        return FakeProcessor(str(script_path), {
+            "tex_slow": 0.6,
+            "tex_a": 0.2,
+            "tex_b": 0.2,
+            "tex_c": 0.2,
+        })
+
+    def _process_func(self, processor, staging_dir):
+        def _process(source):
+            return processor.process(source, "sRGB", {}, staging_dir)
+        return _process
+
+    def test_results_in_order(self, processor, tmp_path):
+        sources = ["tex_slow", "tex_a", "tex_b", "tex_c"]
+        pool = TextureProcessingPool(max_workers=4)
+        results = pool.map(
+            self._process_func(processor, str(tmp_path)), sources
+        )
+
+        assert [os.path.basename(result.path) for result, _ in results] == [
+            source + ".fake" for source in sources
+        ]
+        for (result, duration), source in zip(results, sources):
+            assert duration >= processor.durations[source]
+            with open(result.path, "r") as stream:
+                assert stream.read() == source
+
+    def test_runs_in_parallel(self, processor, tmp_path):
+        sources = ["tex_slow", "tex_a", "tex_b", "tex_c"]
+        pool = TextureProcessingPool(max_workers=4)
+        start = time.time()
+        results = pool.map(
+            self._process_func(processor, str(tmp_path)), sources
+        )
+        wall_duration = time.time() - start
+
+        # Other textures are processed while the slowest texture is
+        #   processed by other worker
+        assert wall_duration < sum(duration for _, duration in results)
+
+    def test_error_is_raised(self, processor, tmp_path):
+        pool = TextureProcessingPool(max_workers=2)
+        with pytest.raises(subprocess.CalledProcessError):
+            pool.map(
+                self._process_func(processor, str(tmp_path)),
+                ["tex_a", "tex_fail", "tex_b"]
+            )
+
+
+class TestTextureCache:
+    def _store(self, cache, tmp_path, name, content):
+        texture_path = tmp_path / name
+        texture_path.write_text(content)
+        key = cache.get_key(
+            str(texture_path), name, "FakeProcessor", "sRGB"
+        )
+        cache.store(key, TextureResult(
+            path=str(texture_path),
+            colorspace="ACEScg",
+            file_hash=name,
+            transfer_mode=COPY
+        ))
+        return key
+
+    def test_get_stored_texture(self, tmp_path):
+        cache = TextureCache(str(tmp_path / "cache"))
+        key = self._store(cache, tmp_path, "tex.tx", "content")
+        staging_dir = tmp_path / "staging"
+
+        assert cache.get("missing", str(staging_dir)) is None
+
+        result = cache.get(key, str(staging_dir))
+        assert result.path == str(staging_dir / "resources" / "tex.tx")
+        assert result.colorspace == "ACEScg"
+        assert result.file_hash == "tex.tx"
+        with open(result.path, "r") as stream:
+            assert stream.read() == "content"
+
+    def test_prune_least_recently_used(self, tmp_path):
+        cache = TextureCache(str(tmp_path / "cache"), max_size=20)
+        old_key = self._store(cache, tmp_path, "old.tx", "a" * 10)
+        used_key = self._store(cache, tmp_path, "used.tx", "b" * 10)
+        for idx, key in enumerate((old_key, used_key)):
+            entry_path = os.path.join(
+                cache.root, key[:2], key, cache.entry_filename
+            )
+            os.utime(entry_path, (idx, idx))
+
+        new_key = self._store(cache, tmp_path, "new.tx", "c" * 10)
+        assert cache.prune() == 1
+
+        staging_dir = str(tmp_path / "staging")
+        assert cache.get(old_key, staging_dir) is None
+        assert cache.get(used_key, staging_dir) is not None
+        assert cache.get(new_key, staging_dir) is not None
+
+        # Prune is not done again until 'prune_interval' passes
+        self._store(cache, tmp_path, "other.tx", "d" * 10)
+        assert cache.prune() == 0
+        assert cache.prune(force=True) == 1
+
+    def test_key_contains_source_path(self, tmp_path):
+        cache = TextureCache(str(tmp_path / "cache"))
+        args = ("tex.tx1000", "FakeProcessor", "sRGB")
+
+        assert cache.get_key("/a/tex.tx", *args) != cache.get_key(
+            "/b/tex.tx", *args
+        )
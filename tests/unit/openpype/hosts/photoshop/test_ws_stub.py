@@ -0,0 +1,207 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+pytest.importorskip("wsrpc_aiohttp")
+
+from aiohttp import web  # noqa
+from wsrpc_aiohttp import WebSocketAsync, WebSocketRoute, WSRPCClient  # noqa
+
+from openpype.hosts.photoshop.api.ws_stub import PhotoshopServerStub  # noqa
+
+
+class ServerWebSocket(WebSocketAsync):
+    """Server side websocket, keeps its own connected clients."""
+
+
+class PhotoshopRoute(WebSocketRoute):
+    """Methods of Photoshop extension, records received calls."""
+
+    def _record(self, method, **kwargs):
+        self.socket.calls.append(("Photoshop.{}".format(method), kwargs))
+
+    async def get_layers(self, **kwargs):
+        self._record("get_layers", **kwargs)
+        return json.dumps(self.socket.layers)
+
+    async def read(self, **kwargs):
+        self._record("read", **kwargs)
+        return json.dumps([])
+
+    async def set_visible(self, **kwargs):
+        self._record("set_visible", **kwargs)
+
+    async def rename_layer(self, **kwargs):
+        self._record("rename_layer", **kwargs)
+
+    async def delete_layer(self, **kwargs):
+        self._record("delete_layer", **kwargs)
+
+    async def imprint(self, **kwargs):
+        self._record("imprint", **kwargs)
+
+
+class PhotoshopExtension(WSRPCClient):
+    """Client acting as Photoshop extension."""
+
+    def __init__(self, *args, **kwargs):
+        super(PhotoshopExtension, self).__init__(*args, **kwargs)
+        self.calls = []
+        self.layers = [
+            {"id": 1, "name": "Layer 1", "visible": True},
+            {"id": 2, "name": "Layer 2", "visible": True},
+        ]
+
+
+PhotoshopExtension.add_route("Photoshop", PhotoshopRoute)
+
+
+class WebServer:
+    """Local websocket server counting round trips to the client."""
+
+    def __init__(self):
+        self.round_trips = 0
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever)
+        self._thread.start()
+        self._runner = None
+        self.port = self._run(self._start())
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(10)
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_route("*", "/ws/", ServerWebSocket)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        return self._runner.addresses[0][1]
+
+    def connect(self):
+        async def _connect():
+            client = PhotoshopExtension(
+                "ws://127.0.0.1:{}/ws/".format(self.port)
+            )
+            await client.connect()
+            while not ServerWebSocket.get_clients():
+                await asyncio.sleep(0.01)
+            return client
+        return self._run(_connect())
+
+    def call(self, func):
+        # Same as 'WebServerTool.call'
+        self.round_trips += 1
+        return self._run(func)
+
+    def stop(self, extension):
+        async def _stop():
+            await extension.close()
+            while ServerWebSocket.get_clients():
+                await asyncio.sleep(0.01)
+            await self._runner.cleanup()
+        self._run(_stop())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+@pytest.fixture
+def server():
+    web_server = WebServer()
+    web_server.extension = web_server.connect()
+    yield web_server
+    web_server.stop(web_server.extension)
+
+
+@pytest.fixture
+def stub(server):
+    return PhotoshopServerStub(
+        websocketserver=server,
+        client=list(ServerWebSocket.get_clients().values())[0]
+    )
+
+
+def test_calls_without_batch(stub, server):
+    stub.set_visible(1, False)
+    stub.set_visible(2, False)
+
+    assert server.round_trips == 2
+
+
+def test_batch_sends_calls_at_once(stub, server):
+    with stub.batch():
+        stub.set_visible(1, False)
+        stub.rename_layer(2, "Renamed")
+        assert server.round_trips == 0
+
+    assert server.round_trips == 1
+    assert [call[0] for call in server.extension.calls] == [
+        "Photoshop.set_visible", "Photoshop.rename_layer"
+    ]
+
+
+def test_batch_flushes_before_query(stub, server):
+    with stub.batch():
+        stub.set_visible(1, False)
+        stub.get_layers()
+        # Query did flush queued call and did query layers
+        assert server.round_trips == 2
+
+    assert [call[0] for call in server.extension.calls] == [
+        "Photoshop.set_visible", "Photoshop.get_layers"
+    ]
+
+
+def test_batch_reuses_layers_snapshot(stub, server):
+    with stub.batch():
+        stub.get_layers()
+        stub.set_visible(1, False)
+        layers = stub.get_layers()
+        assert server.round_trips == 1
+        assert not stub.get_layer(1).visible
+
+        stub.delete_layer(2)
+        stub.get_layers()
+
+    assert len(layers) == 2
+    assert [call[0] for call in server.extension.calls] == [
+        "Photoshop.get_layers",
+        "Photoshop.set_visible",
+        "Photoshop.delete_layer",
+        "Photoshop.get_layers",
+    ]
+
+
+def test_batch_merges_imprints(stub, server):
+    with stub.batch():
+        stub.imprint(1, {"members": ["1"], "id": "pyblish.avalon.instance"})
+        stub.imprint(2, {"members": ["2"], "id": "pyblish.avalon.instance"})
+
+    imprint_calls = [
+        call for call in server.extension.calls
+        if call[0] == "Photoshop.imprint"
+    ]
+    assert len(imprint_calls) == 1
+    payload = json.loads(imprint_calls[0][1]["payload"])
+    assert [item["members"] for item in payload] == [["1"], ["2"]]
+
+
+def test_nested_batch(stub, server):
+    with stub.batch():
+        with stub.batch():
+            stub.set_visible(1, False)
+        assert server.round_trips == 0
+        stub.set_visible(2, False)
+
+    assert server.round_trips == 1
+
+
+def test_batch_stub_is_shared(stub):
+    assert PhotoshopServerStub.get_batch_stub() is None
+    with stub.batch():
+        assert PhotoshopServerStub.get_batch_stub() is stub
+    assert PhotoshopServerStub.get_batch_stub() is None
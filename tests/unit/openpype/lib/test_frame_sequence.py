@@ -0,0 +1,89 @@
+import clique
+
+from openpype.lib.frame_sequence import (
+    FrameSequence,
+    assemble_frame_sequences,
+    assemble_frame_sequences_compat,
+    DOT_FRAME_PATTERN,
+)
+
+
+def test_assemble_frame_sequences():
+    files = ["/r/beauty.{:04d}.exr".format(idx) for idx in range(1, 11)]
+    files.extend(["/r/movie.1001.mp4", "/r/movie.1002.mp4"])
+    files.extend(["/r/single.exr", "/r/other1.exr"])
+
+    sequences, remainders = assemble_frame_sequences(files)
+
+    assert [str(seq) for seq in sequences] == [
+        "/r/beauty.%04d.exr [1-10]",
+        "/r/movie.%d.mp4 [1001-1002]",
+    ]
+    assert sorted(remainders) == ["/r/other1.exr", "/r/single.exr"]
+    assert list(sequences[0]) == files[:10]
+
+
+def test_assemble_merges_unpadded_frames():
+    files = ["b.0998.exr", "b.0999.exr", "b.1000.exr", "b.10000.exr"]
+    sequences, remainders = assemble_frame_sequences(files)
+
+    assert len(sequences) == 1
+    assert sequences[0].padding == 4
+    assert sorted(sequences[0].paths()) == sorted(files)
+    assert not remainders
+
+
+def test_assemble_matches_clique():
+    files = ["sh010_v001_beauty.{}.exr".format(idx) for idx in range(5, 15)]
+    sequences, _ = assemble_frame_sequences(files)
+    collections, _ = clique.assemble(files)
+
+    assert len(sequences) == len(collections) == 1
+    assert list(sequences[0]) == list(collections[0])
+    assert sequences[0].to_collection().indexes == collections[0].indexes
+
+
+def test_assemble_compat_fallback():
+    # Frame is not last number in filename
+    files = ["render.{}.final2.exr".format(idx) for idx in range(1, 4)]
+    sequences, remainders = assemble_frame_sequences_compat(files)
+
+    assert len(sequences) == 1
+    assert sequences[0].ranges == [(1, 3)]
+    assert not remainders
+
+
+def test_dot_frame_pattern():
+    sequences, remainders = assemble_frame_sequences(
+        ["file_v001.exr", "file.0001.exr"],
+        minimum_items=1,
+        pattern=DOT_FRAME_PATTERN
+    )
+    assert [str(seq) for seq in sequences] == ["file.%04d.exr [1]"]
+    assert remainders == ["file_v001.exr"]
+
+
+def test_set_operations():
+    sequence = FrameSequence.from_frames(
+        "a.", ".exr", 4, [1, 2, 3, 7, 8, 10]
+    )
+
+    assert sequence.ranges == [(1, 3), (7, 8), (10, 10)]
+    assert len(sequence) == 6
+    assert 8 in sequence
+    assert 9 not in sequence
+    assert sequence.gaps() == [(4, 6), (9, 9)]
+    assert sequence.gaps(0, 12) == [(0, 0), (4, 6), (9, 9), (11, 12)]
+    assert sequence.union(range(4, 7)).ranges == [(1, 8), (10, 10)]
+    assert sequence.intersection(range(2, 9)).ranges == [(2, 3), (7, 8)]
+    assert sequence.difference([2, 10]).ranges == [(1, 1), (3, 3), (7, 8)]
+    assert sequence.get_path(7) == "a.0007.exr"
+
+
+def test_large_sequence_is_compact():
+    sequence = FrameSequence.from_frames(
+        "a.", ".exr", 4, range(1001, 11001)
+    )
+    assert sequence.ranges == [(1001, 11000)]
+    assert len(sequence) == 10000
+    assert sequence.gaps() == []
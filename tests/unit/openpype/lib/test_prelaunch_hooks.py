@@ -0,0 +1,100 @@
+import logging
+import threading
+
+import pytest
+
+from openpype.lib.applications import ApplicationLaunchContext
+from openpype.hooks.pre_global_host_data import GlobalHostDataHook
+from openpype.hooks.pre_ocio_hook import OCIOEnvHook
+from openpype.hooks.pre_add_last_workfile_arg import (
+    AddLastWorkfileToLaunchArgs,
+)
+from openpype.hooks.pre_create_extra_workdir_folders import (
+    CreateWorkdirExtraFolders,
+)
+from openpype.hooks.pre_non_python_host_launch import NonPythonHostHook
+
+
+def _create_launch_context():
+    launch_context = ApplicationLaunchContext.__new__(
+        ApplicationLaunchContext
+    )
+    launch_context.log = logging.getLogger("test_prelaunch_hooks")
+    launch_context.launch_timings = []
+    return launch_context
+
+
+def _create_hook(hook_class, execute):
+    # Hooks are not initialized, only scheduling of them is tested
+    hook = hook_class.__new__(hook_class)
+    hook.execute = execute
+    return hook
+
+
+def test_shipped_hooks_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+    executed = []
+
+    def _create_execute(name, wait):
+        def execute():
+            if wait:
+                # Fails if the other hook is not running at the same time
+                barrier.wait()
+            executed.append(name)
+        return execute
+
+    hooks = [
+        _create_hook(
+            GlobalHostDataHook, _create_execute("global", False)
+        ),
+        _create_hook(OCIOEnvHook, _create_execute("ocio", False)),
+        _create_hook(
+            AddLastWorkfileToLaunchArgs, _create_execute("workfile", False)
+        ),
+        _create_hook(
+            CreateWorkdirExtraFolders, _create_execute("folders", True)
+        ),
+        _create_hook(
+            NonPythonHostHook, _create_execute("non_python", True)
+        ),
+    ]
+
+    _create_launch_context()._run_prelaunch_hooks_concurrently(hooks)
+
+    assert executed[:3] == ["global", "ocio", "workfile"]
+    assert set(executed[3:]) == {"folders", "non_python"}
+
+
+def test_prelaunch_hooks_dependencies():
+    launch_context = _create_launch_context()
+    hooks = [
+        _create_hook(GlobalHostDataHook, None),
+        _create_hook(OCIOEnvHook, None),
+        _create_hook(AddLastWorkfileToLaunchArgs, None),
+        _create_hook(CreateWorkdirExtraFolders, None),
+        _create_hook(NonPythonHostHook, None),
+    ]
+
+    assert launch_context._get_prelaunch_hooks_dependencies(hooks) == [
+        set(), {0}, {1}, {2}, {2}
+    ]
+
+    # Following hooks wait for independent hook with lower order
+    hooks[3].blocks_following = True
+    assert launch_context._get_prelaunch_hooks_dependencies(hooks) == [
+        set(), {0}, {1}, {2}, {2, 3}
+    ]
+
+
+def test_prelaunch_hook_error_is_raised():
+    def _fail():
+        raise ValueError("Failed")
+
+    hooks = [
+        _create_hook(AddLastWorkfileToLaunchArgs, lambda: None),
+        _create_hook(CreateWorkdirExtraFolders, _fail),
+        _create_hook(NonPythonHostHook, lambda: None),
+    ]
+
+    with pytest.raises(ValueError):
+        _create_launch_context()._run_prelaunch_hooks_concurrently(hooks)
@@ -0,0 +1,176 @@
+import datetime
+import collections
+
+import pytest
+
+pytest.importorskip("ftrack_api")
+
+from openpype.modules.ftrack.lib import avalon_sync  # noqa
+from openpype.modules.ftrack.lib.avalon_sync import (  # noqa
+    SyncEntitiesFactory,
+    calculate_data_hash,
+    get_ftrack_ids_from_update_events,
+    get_incremental_sync_ids,
+)
+
+
+class _Collection(object):
+    def __init__(self):
+        self.replaced = []
+
+    def replace_one(self, query, doc, upsert=False):
+        self.replaced.append(doc)
+
+
+def _create_entities_dict():
+    # project
+    #   - sq01
+    #       - sh01
+    #       - sh02
+    #   - sq02
+    #       - sh03
+    entities_dict = collections.defaultdict(lambda: {
+        "children": [],
+        "parent_id": None,
+        "entity": None,
+    })
+    for ftrack_id, parent_id in (
+        ("sq01", "project"),
+        ("sq02", "project"),
+        ("sh01", "sq01"),
+        ("sh02", "sq01"),
+        ("sh03", "sq02"),
+    ):
+        entities_dict[ftrack_id]["parent_id"] = parent_id
+        entities_dict[parent_id]["children"].append(ftrack_id)
+
+    for entity_dict in entities_dict.values():
+        entity_dict["entity"] = object()
+    return entities_dict
+
+
+def _create_factory(entities_dict):
+    factory = SyncEntitiesFactory.__new__(SyncEntitiesFactory)
+    factory.log = avalon_sync.log
+    factory.ft_project_id = "project"
+    factory.entities_dict = entities_dict
+    factory.entities_dict["project"]["name"] = "test_project"
+    factory.sync_started = datetime.datetime.utcnow()
+    factory.entity_hashes = {
+        ftrack_id: ftrack_id
+        for ftrack_id in entities_dict.keys()
+    }
+    factory.changed_ftrack_ids = None
+    factory.fetch_ftrack_ids = None
+    factory.report_items = {"error": collections.defaultdict(list)}
+    return factory
+
+
+def _create_asset_doc(ftrack_id):
+    return {"name": ftrack_id, "data": {"ftrackId": ftrack_id}}
+
+
+def test_ftrack_ids_from_update_events():
+    event_docs = [
+        {"data": {"entities": [
+            {"entityId": "sh01", "entity_type": "Shot"},
+            {"entityId": "task01", "parentId": "sh02", "entity_type": "Task"},
+        ]}},
+        {"data": {"entities": [{"entityId": ["sq02"]}]}},
+        {"data": {}},
+    ]
+
+    assert get_ftrack_ids_from_update_events(event_docs) == {
+        "sh01", "sh02", "sq02"
+    }
+
+
+def test_incremental_sync_ids():
+    update_ids, fetch_ids = get_incremental_sync_ids(
+        _create_entities_dict(), ["sq01", "sh03", "missing"]
+    )
+
+    # Children of changed entities are updated
+    assert update_ids == {"sq01", "sh01", "sh02", "sh03"}
+    # Values of parents are needed to resolve hierarchical values
+    assert fetch_ids == update_ids | {"sq02", "project"}
+
+
+def test_prepare_incremental_sync(monkeypatch):
+    entities_dict = _create_entities_dict()
+    factory = _create_factory(entities_dict)
+    asset_docs = [
+        _create_asset_doc(ftrack_id)
+        for ftrack_id in ("sq01", "sq02", "sh01", "sh02")
+    ]
+    avalon_hashes = {
+        asset_doc["data"]["ftrackId"]: calculate_data_hash(asset_doc)
+        for asset_doc in asset_docs
+    }
+    # Document was changed in avalon since last synchronization
+    asset_docs[1]["name"] = "changed"
+    state_doc = {
+        "synchronized": factory.sync_started,
+        "entity_hashes": dict(factory.entity_hashes),
+        "avalon_hashes": avalon_hashes,
+    }
+
+    monkeypatch.setattr(factory, "_load_sync_state", lambda: state_doc)
+    monkeypatch.setattr(
+        factory, "_get_ids_changed_by_events", lambda since: {"sh01"}
+    )
+    monkeypatch.setattr(
+        avalon_sync, "get_assets", lambda project_name: iter(asset_docs)
+    )
+
+    factory._prepare_incremental_sync()
+
+    # 'sh01' changed in ftrack, 'sq02' changed in avalon and 'sh03' does
+    #   not have avalon document
+    assert factory.changed_ftrack_ids == {"project", "sh01", "sq02", "sh03"}
+    assert factory.fetch_ftrack_ids == (
+        factory.changed_ftrack_ids | {"sq01"}
+    )
+
+
+def test_prepare_incremental_sync_fallback(monkeypatch):
+    factory = _create_factory(_create_entities_dict())
+    state_doc = {"synchronized": factory.sync_started}
+
+    monkeypatch.setattr(factory, "_load_sync_state", lambda: state_doc)
+    # Event storer was restarted since last synchronization
+    monkeypatch.setattr(
+        factory, "_get_ids_changed_by_events", lambda since: None
+    )
+
+    factory._prepare_incremental_sync()
+
+    assert factory.changed_ftrack_ids is None
+    assert factory.fetch_ftrack_ids is None
+
+
+def test_store_sync_state(monkeypatch):
+    factory = _create_factory(_create_entities_dict())
+    factory.ftrack_avalon_mapper = {"project": "1", "sh01": "2"}
+    collection = _Collection()
+    asset_doc = _create_asset_doc("sh01")
+
+    monkeypatch.setattr(
+        factory, "_get_sync_state_collection", lambda: collection
+    )
+    monkeypatch.setattr(
+        avalon_sync, "get_assets", lambda project_name: iter([asset_doc])
+    )
+
+    assert factory.store_sync_state()
+    state_doc = collection.replaced[0]
+    assert state_doc["synchronized"] == factory.sync_started
+    assert state_doc["entity_hashes"] == {"project": "project", "sh01": "sh01"}
+    assert state_doc["avalon_hashes"] == {
+        "sh01": calculate_data_hash(asset_doc)
+    }
+
+    # State is not stored when synchronization reported errors
+    factory.report_items["error"]["Invalid fps"].append("sh01")
+    assert not factory.store_sync_state()
+    assert len(collection.replaced) == 1
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from aiohttp import web  # noqa
+from aiohttp.test_utils import TestServer, TestClient  # noqa
+
+from openpype.modules.webserver.middlewares import timing_middleware  # noqa
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super(RecordingHandler, self).__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _run(app, test_func):
+    async def _main():
+        client = TestClient(TestServer(app))
+        await client.start_server()
+        try:
+            return await test_func(client)
+        finally:
+            await client.close()
+
+    return asyncio.run(_main())
+
+
+def _create_app(slow_threshold):
+    log = logging.getLogger("test_timing_middleware")
+    log.setLevel(logging.DEBUG)
+    log.propagate = False
+    handler = RecordingHandler()
+    log.handlers = [handler]
+
+    async def slow_handler(request):
+        await asyncio.sleep(slow_threshold * 2)
+        return web.Response()
+
+    async def ws_handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for _msg in ws:
+            pass
+        return ws
+
+    app = web.Application(
+        middlewares=[timing_middleware(log, slow_threshold)]
+    )
+    app.router.add_get("/slow", slow_handler)
+    app.router.add_get("/ws", ws_handler)
+    return app, handler
+
+
+def test_timing_slow_request():
+    app, handler = _create_app(0.05)
+
+    async def test_func(client):
+        return await client.get("/slow")
+
+    response = _run(app, test_func)
+    assert "Server-Timing" in response.headers
+    assert [record.levelno for record in handler.records] == [
+        logging.WARNING
+    ]
+    assert "GET /slow" in handler.records[0].getMessage()
+
+
+def test_timing_skips_websocket():
+    app, handler = _create_app(0.05)
+
+    async def test_func(client):
+        ws = await client.ws_connect("/ws")
+        # Connection is open longer than slow threshold
+        await asyncio.sleep(0.1)
+        await ws.close()
+        # Give server time to finish the handler
+        await asyncio.sleep(0.05)
+
+    _run(app, test_func)
+    assert handler.records == []
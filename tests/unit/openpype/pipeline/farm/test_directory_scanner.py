@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from openpype.pipeline.farm.directory_scanner import DirectoryScanner
+
+
+def _create_files(root, rel_paths):
+    for rel_path in rel_paths:
+        path = os.path.join(str(root), rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w"):
+            pass
+
+
+def test_scan(tmp_path):
+    _create_files(tmp_path, [
+        "beauty/beauty.1001.exr",
+        "beauty/beauty.1002.exr",
+        "crypto/crypto.1001.exr",
+    ])
+    scanner = DirectoryScanner(max_workers=2)
+    beauty_dir = str(tmp_path / "beauty")
+    crypto_dir = str(tmp_path / "crypto")
+
+    listings = scanner.scan([beauty_dir, crypto_dir, beauty_dir])
+
+    assert listings == {
+        os.path.normpath(beauty_dir): {"beauty.1001.exr", "beauty.1002.exr"},
+        os.path.normpath(crypto_dir): {"crypto.1001.exr"},
+    }
+
+
+def test_listings_are_cached(tmp_path):
+    _create_files(tmp_path, ["render.1001.exr"])
+    scanner = DirectoryScanner()
+    dirpath = str(tmp_path)
+    scanner.scan([dirpath])
+
+    # New file is not visible in cached listing
+    _create_files(tmp_path, ["render.1002.exr"])
+    assert scanner.get_file_names(dirpath) == {"render.1001.exr"}
+
+
+def test_missing_directory(tmp_path):
+    scanner = DirectoryScanner()
+    dirpath = str(tmp_path / "missing")
+
+    assert scanner.get_file_names(dirpath) == frozenset()
+    assert scanner.scan([dirpath])[os.path.normpath(dirpath)] == set()
+
+
+def test_scan_error(tmp_path, monkeypatch):
+    _create_files(tmp_path, ["allowed/render.1001.exr", "denied/secret.exr"])
+    allowed_dir = os.path.normpath(str(tmp_path / "allowed"))
+    denied_dir = os.path.normpath(str(tmp_path / "denied"))
+
+    scandir = os.scandir
+
+    def _scandir(path):
+        if os.path.normpath(path) == denied_dir:
+            raise PermissionError(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", _scandir)
+    scanner = DirectoryScanner()
+
+    # Error of one directory does not fail the scan
+    listings = scanner.scan([allowed_dir, denied_dir])
+    assert listings == {allowed_dir: {"render.1001.exr"}}
+
+    # Error is raised for the plugin using the listing
+    with pytest.raises(PermissionError):
+        scanner.get_file_names(denied_dir)
@@ -0,0 +1,101 @@
+import os
+import shutil
+import tempfile
+import unittest
+from openpype.pipeline.colorspace import (
+    ColorspaceMatcher,
+    get_colorspace_matcher,
+    parse_colorspace_from_filepath,
+)
+
+
+class TestColorspaceMatcher(unittest.TestCase):
+    def setUp(self):
+        self.file_rules = {
+            "exr_linear": {
+                "pattern": "plate",
+                "ext": "exr",
+                "colorspace": "ACES - ACEScg"
+            },
+            "exr_log": {
+                "pattern": "_log_",
+                "ext": "exr",
+                "colorspace": "ACES - ACEScct"
+            },
+            "jpg_srgb": {
+                "pattern": ".*",
+                "ext": "jpg",
+                "colorspace": "Output - sRGB"
+            },
+        }
+        self.colorspaces = [
+            "sRGB",
+            "Output - sRGB",
+            "ACES - ACEScg",
+            "ACES - ACEScct",
+        ]
+        self.matcher = ColorspaceMatcher(
+            file_rules=self.file_rules,
+            colorspaces=self.colorspaces
+        )
+
+    def test_match_file_rules(self):
+        self.assertEqual(
+            self.matcher.match_file_rules("/path/plate_v001.1001.exr"),
+            "ACES - ACEScg"
+        )
+        # last matching rule wins
+        self.assertEqual(
+            self.matcher.match_file_rules("/path/plate_log_v001.1001.exr"),
+            "ACES - ACEScct"
+        )
+        self.assertEqual(
+            self.matcher.match_file_rules("/path/review.jpg"),
+            "Output - sRGB"
+        )
+        self.assertIsNone(
+            self.matcher.match_file_rules("/path/review.mov"))
+
+    def test_parse_colorspace(self):
+        filepaths = [
+            "/path/ACES_-_ACEScg/plate.exr",
+            "/path/render_Output - sRGB.jpg",
+            "/path/render_sRGB.jpg",
+            "/path/render.jpg",
+        ]
+        expected = {
+            filepaths[0]: "ACES - ACEScg",
+            filepaths[1]: "Output - sRGB",
+            filepaths[2]: "sRGB",
+            filepaths[3]: None,
+        }
+        self.assertEqual(
+            self.matcher.parse_colorspace_batch(filepaths), expected)
+
+        for filepath, colorspace in expected.items():
+            self.assertEqual(
+                parse_colorspace_from_filepath(
+                    filepath, colorspaces=self.colorspaces),
+                colorspace
+            )
+
+    def test_matcher_cache_config_changed(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        config_path = os.path.join(tmp_dir, "config.ocio")
+        with open(config_path, "w") as stream:
+            stream.write("ocio_profile_version: 2")
+
+        matcher = get_colorspace_matcher(config_path, self.file_rules)
+        self.assertIs(
+            get_colorspace_matcher(config_path, self.file_rules), matcher)
+
+        # config edited in place
+        mtime = os.path.getmtime(config_path) + 10
+        os.utime(config_path, (mtime, mtime))
+        self.assertIsNot(
+            get_colorspace_matcher(config_path, self.file_rules), matcher)
+
+
+if __name__ == "__main__":
+    unittest.main()